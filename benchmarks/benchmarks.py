@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import mddrt
+from benchmarks.synthetic_log import SYNTHETIC_LOG_FORMAT, generate_event_log
+from mddrt.drt_parameters import DirectlyRootedTreeParameters
+from mddrt.tree_builder import DirectlyRootedTreeBuilder
+from mddrt.tree_diagrammer import DirectlyRootedTreeDiagrammer
+from mddrt.tree_grouper import DirectedRootedTreeGrouper
+from mddrt.utils.builder import calculate_cases_metrics, resolve_missing_columns
+
+
+class SyntheticLogBenchmark:
+    params = ([1_000, 10_000], [10, 30])
+    param_names = ["cases", "trace_length"]
+    timeout = 600
+
+    def setup(self, cases: int, trace_length: int) -> None:
+        self.raw_log = generate_event_log(cases, variants=cases // 10, trace_length=trace_length)
+        self.log = mddrt.log_formatter(self.raw_log, SYNTHETIC_LOG_FORMAT)
+        self.parameters = DirectlyRootedTreeParameters()
+
+
+class LogFormatter(SyntheticLogBenchmark):
+    params = ([1_000, 10_000], [10, 30], [False, True])
+    param_names = ["cases", "trace_length", "zero_copy"]
+
+    def setup(self, cases: int, trace_length: int, zero_copy: bool) -> None:
+        super().setup(cases, trace_length)
+
+    def time_log_formatter(self, cases: int, trace_length: int, zero_copy: bool) -> None:
+        mddrt.log_formatter(self.raw_log, SYNTHETIC_LOG_FORMAT, zero_copy=zero_copy)
+
+    def peakmem_log_formatter(self, cases: int, trace_length: int, zero_copy: bool) -> None:
+        mddrt.log_formatter(self.raw_log, SYNTHETIC_LOG_FORMAT, zero_copy=zero_copy)
+
+
+class CasesMetrics(SyntheticLogBenchmark):
+    def time_calculate_cases_metrics(self, cases: int, trace_length: int) -> None:
+        calculate_cases_metrics(self.log, resolve_missing_columns(self.log, self.parameters))
+
+    def peakmem_calculate_cases_metrics(self, cases: int, trace_length: int) -> None:
+        calculate_cases_metrics(self.log, resolve_missing_columns(self.log, self.parameters))
+
+
+class TreeBuilder(SyntheticLogBenchmark):
+    params = ([1_000, 10_000], [10, 30], [20, 200])
+    param_names = ["cases", "trace_length", "activities"]
+
+    def setup(self, cases: int, trace_length: int, activities: int) -> None:
+        self.raw_log = generate_event_log(cases, variants=cases // 10, trace_length=trace_length, activities=activities)
+        self.log = mddrt.log_formatter(self.raw_log, SYNTHETIC_LOG_FORMAT)
+        self.parameters = DirectlyRootedTreeParameters()
+
+    def time_tree_builder(self, cases: int, trace_length: int, activities: int) -> None:
+        DirectlyRootedTreeBuilder(self.log, self.parameters)
+
+    def peakmem_tree_builder(self, cases: int, trace_length: int, activities: int) -> None:
+        DirectlyRootedTreeBuilder(self.log, self.parameters)
+
+
+class TreeGrouper(SyntheticLogBenchmark):
+    # The grouper modifies the tree in place, so every measurement needs a fresh tree from setup
+    number = 1
+    repeat = 5
+
+    def setup(self, cases: int, trace_length: int) -> None:
+        super().setup(cases, trace_length)
+        self.tree = DirectlyRootedTreeBuilder(self.log, self.parameters).get_tree()
+
+    def time_tree_grouper(self, cases: int, trace_length: int) -> None:
+        DirectedRootedTreeGrouper(self.tree)
+
+    def peakmem_tree_grouper(self, cases: int, trace_length: int) -> None:
+        DirectedRootedTreeGrouper(self.tree)
+
+
+class TreeDiagrammer(SyntheticLogBenchmark):
+    def setup(self, cases: int, trace_length: int) -> None:
+        super().setup(cases, trace_length)
+        self.tree = DirectlyRootedTreeBuilder(self.log, self.parameters).get_tree()
+
+    def time_tree_diagrammer(self, cases: int, trace_length: int) -> None:
+        DirectlyRootedTreeDiagrammer(self.tree, node_measures=["total", "consumed", "remaining"], arc_measures=["avg"])
+
+    def peakmem_tree_diagrammer(self, cases: int, trace_length: int) -> None:
+        DirectlyRootedTreeDiagrammer(self.tree, node_measures=["total", "consumed", "remaining"], arc_measures=["avg"])
+
+
+class ManualLogGrouping(SyntheticLogBenchmark):
+    params = ([100, 1_000], [10, 30])
+
+    def setup(self, cases: int, trace_length: int) -> None:
+        super().setup(cases, trace_length)
+        self.activities_to_group = self.log["concept:name"].value_counts().index[:2].tolist()
+
+    def time_manual_log_grouping(self, cases: int, trace_length: int) -> None:
+        mddrt.manual_log_grouping(self.log, self.activities_to_group)
+
+    def peakmem_manual_log_grouping(self, cases: int, trace_length: int) -> None:
+        mddrt.manual_log_grouping(self.log, self.activities_to_group)
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+SYNTHETIC_LOG_FORMAT = {
+    "case:concept:name": "Case ID",
+    "concept:name": "Activity",
+    "time:timestamp": "Complete",
+    "start_timestamp": "Start",
+    "org:resource": "Resource",
+    "cost:total": "Cost",
+}
+
+
+def generate_event_log(
+    cases: int,
+    variants: int = 50,
+    trace_length: int = 10,
+    activities: int = 20,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Generates a synthetic raw event log with the columns of `SYNTHETIC_LOG_FORMAT`.
+
+    Each case follows one of `variants` random activity sequences, chosen with a Zipf-like
+    frequency so a few variants are common and most are rare, as in real logs.
+
+    Args:
+        cases (int): Number of cases in the log.
+        variants (int, optional): Number of distinct activity sequences. Defaults to 50.
+        trace_length (int, optional): Mean number of events per case. Defaults to 10.
+        activities (int, optional): Size of the activity alphabet. Defaults to 20.
+        seed (int, optional): Seed of the random generator. Defaults to 0.
+
+    Returns:
+        pd.DataFrame: The raw event log, with timestamps as strings.
+    """
+    rng = np.random.default_rng(seed)
+    activity_names = np.array([f"Activity {index}" for index in range(activities)], dtype=object)
+    variant_lengths = np.maximum(1, rng.poisson(trace_length, size=variants))
+    variant_traces = [rng.integers(0, activities, size=length) for length in variant_lengths]
+    variant_weights = 1 / np.arange(1, variants + 1)
+    case_variants = rng.choice(variants, size=cases, p=variant_weights / variant_weights.sum())
+
+    case_lengths = variant_lengths[case_variants]
+    events = int(case_lengths.sum())
+    case_ids = np.repeat(np.arange(cases), case_lengths)
+    event_activities = np.concatenate([variant_traces[variant] for variant in case_variants])
+
+    case_first_events = np.cumsum(case_lengths) - case_lengths
+    service_times = rng.integers(60, 4 * 3600, size=events)
+    waiting_times = rng.integers(0, 8 * 3600, size=events)
+    waiting_times[case_first_events] = 0
+    elapsed_times = np.cumsum(service_times + waiting_times)
+    case_elapsed_times = elapsed_times - np.repeat(
+        elapsed_times[case_first_events] - service_times[case_first_events], case_lengths
+    )
+    complete_seconds = np.repeat(rng.integers(0, 365 * 24 * 3600, size=cases), case_lengths) + case_elapsed_times
+    start_seconds = complete_seconds - service_times
+
+    origin = pd.Timestamp("2023-01-01")
+    return pd.DataFrame(
+        {
+            "Case ID": case_ids,
+            "Activity": activity_names[event_activities],
+            "Start": (origin + pd.to_timedelta(start_seconds, unit="s")).strftime("%Y-%m-%d %H:%M:%S"),
+            "Complete": (origin + pd.to_timedelta(complete_seconds, unit="s")).strftime("%Y-%m-%d %H:%M:%S"),
+            "Resource": rng.choice(["Clara", "Hugo", "Ana", "Pedro"], size=events),
+            "Cost": rng.integers(100, 10_000, size=events),
+        },
+    )
@@ -1,10 +1,29 @@
 from mddrt.actions import (
     # automatic_group_drt_activities,
     discover_multi_dimensional_drt,
+    get_multi_dimensional_drt_diff_string,
+    get_multi_dimensional_drt_html,
+    get_multi_dimensional_drt_image,
     get_multi_dimensional_drt_string,
+    get_multi_dimensional_drt_svg,
+    save_html_multi_dimensional_drt,
+    save_svg_multi_dimensional_drt,
     save_vis_multi_dimensional_drt,
+    save_vis_multi_dimensional_drts,
+    save_vis_multi_dimensional_drt_diff,
     view_multi_dimensional_drt,
+    view_multi_dimensional_drt_diff,
 )
+from mddrt.batch_render import RenderConfig
+from mddrt.case_attribute_index import CaseAttributeIndex
 from mddrt.log_formatter import log_formatter
 from mddrt.manual_log_grouping import manual_log_grouping
 from mddrt.pruning import prune_log_based_on_top_variants, prune_tree_to_depth
+from mddrt.time_windowed_drt import TimeWindowedDRT
+from mddrt.tree_diff import diff_trees
+from mddrt.tree_export import export_tree
+from mddrt.tree_merge import merge_trees
+from mddrt.tree_query import subtree_by_prefix
+from mddrt.utils.color_schemes import register_color_scheme
+from mddrt.utils.profiler import DiscoveryProfiler, StageStats
+from mddrt.utils.render_cache import RenderCache
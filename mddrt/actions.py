@@ -1,13 +1,35 @@
-from typing import Literal
+from __future__ import annotations
 
-import pandas as pd
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
 
+from mddrt.approximate_tree_builder import ApproximateDirectlyRootedTreeBuilder
+from mddrt.batch_render import BatchDiagramRenderer, RenderConfig
 from mddrt.drt_parameters import DirectlyRootedTreeParameters
+from mddrt.lazy_tree_builder import LazyDirectlyRootedTreeBuilder
 from mddrt.tree_builder import DirectlyRootedTreeBuilder
 from mddrt.tree_diagrammer import DirectlyRootedTreeDiagrammer
+from mddrt.tree_diff_diagrammer import DirectlyRootedTreeDiffDiagrammer
 from mddrt.tree_grouper import DirectedRootedTreeGrouper
-from mddrt.tree_node import TreeNode
-from mddrt.utils.actions import save_graphviz_diagram, view_graphviz_diagram
+from mddrt.tree_html_renderer import DirectlyRootedTreeHtmlRenderer
+from mddrt.tree_svg_renderer import DirectlyRootedTreeSvgRenderer
+from mddrt.utils.actions import (
+    check_view_format,
+    display_diagram,
+    pipe_graphviz_diagram,
+    save_graphviz_diagram,
+    view_graphviz_diagram,
+)
+from mddrt.utils.misc import tree_size
+from mddrt.utils.profiler import DiscoveryProfiler, profile_stage
+from mddrt.utils.render_cache import RenderCache, render_cache_key
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from mddrt.tree_diff import TreeNodeDiff
+    from mddrt.tree_node import TreeNode
+    from mddrt.utils.progress import Progress
 
 
 def discover_multi_dimensional_drt(
@@ -22,6 +44,15 @@ def discover_multi_dimensional_drt(
     timestamp_key: str = "time:timestamp",
     start_timestamp_key: str = "start_timestamp",
     cost_key: str = "cost:total",
+    profiler: DiscoveryProfiler | None = None,
+    progress: Progress = "tqdm",
+    calculate_quantiles: bool = False,
+    approximate: bool = False,
+    sample_fraction: float = 0.1,
+    stratify_by: Literal["variant", "start_activity"] = "variant",
+    random_state: int | None = None,
+    confidence_level: float = 0.95,
+    lazy: bool = False,
 ) -> TreeNode:
     """
     Discovers and constructs a multi-dimensional Directly Rooted Tree (DRT) from the provided event log.
@@ -46,6 +77,29 @@ def discover_multi_dimensional_drt(
         timestamp_key (str, optional): The key for timestamps in the event log. Defaults to "time:timestamp".
         start_timestamp_key (str, optional): The key for start timestamps in the event log. Defaults to "start_timestamp".
         cost_key (str, optional): The key for cost information in the event log. Defaults to "cost:total".
+        profiler (DiscoveryProfiler | None, optional): Collects wall time, CPU time, peak RSS and event/case/node
+            counts of each discovery stage ("calculate_cases_metrics", "build_cases", "build_tree", "update_root"
+            and "group_activities"). Defaults to None.
+        progress (Progress, optional): How to report the build progress: None for no output, "tqdm" for progress
+            bars or a callable receiving (stage description, processed cases, total cases), called once per batch
+            of cases. Defaults to "tqdm".
+        calculate_quantiles (bool, optional): Whether to keep per-node quantile sketches of the service time, waiting
+            time and cost, needed by the "p50"/"p95" arc measures. Each sketch uses bounded memory. Defaults to False.
+        approximate (bool, optional): Whether to build the DRT from a stratified sample of the cases instead of
+            the whole log. Node frequencies and summed metrics are estimated by weighting each sampled case, and
+            each node stores the confidence intervals of its per-case averages in `confidence_intervals`.
+            Defaults to False.
+        sample_fraction (float, optional): Expected fraction of cases sampled when `approximate` is True.
+            Defaults to 0.1.
+        stratify_by (Literal["variant", "start_activity"], optional): Case attribute used to build the sampling
+            strata when `approximate` is True. Defaults to "variant".
+        random_state (int | None, optional): Seed of the sampling when `approximate` is True. Defaults to None.
+        confidence_level (float, optional): Confidence level of the intervals when `approximate` is True.
+            Defaults to 0.95.
+        lazy (bool, optional): Whether to build the nodes of the DRT on demand, the first time their parent's
+            children are accessed. Useful with huge logs when only the first levels are viewed (see `max_depth`
+            of the visualization functions). Grouping activities materializes the whole tree. Can't be combined
+            with `approximate`. Defaults to False.
 
     Returns:
         TreeNode: The root node of the constructed multi-dimensional Directly Rooted Tree (DRT).
@@ -54,6 +108,12 @@ def discover_multi_dimensional_drt(
         >>> drt = discover_multi_dimensional_drt(log, calculate_time=True, calculate_cost=False)
         >>> print(drt)
 
+        >>> profiler = DiscoveryProfiler()
+        >>> drt = discover_multi_dimensional_drt(log, profiler=profiler)
+        >>> print(profiler.report())
+
+        >>> drt = discover_multi_dimensional_drt(log, approximate=True, sample_fraction=0.05, random_state=0)
+
     Notes:
         - The function uses the `DirectlyRootedTreeParameters` class to encapsulate the parameters and
           the `DirectlyRootedTreeBuilder` class to build the tree.
@@ -70,10 +130,32 @@ def discover_multi_dimensional_drt(
         calculate_cost,
         calculate_quality,
         calculate_flexibility,
+        calculate_quantiles,
     )
-    multi_dimensional_drt = DirectlyRootedTreeBuilder(log, parameters).get_tree()
+    if approximate and lazy:
+        error_message = "Approximate and lazy discovery can't be combined."
+        raise ValueError(error_message)
+    if approximate:
+        builder = ApproximateDirectlyRootedTreeBuilder(
+            log,
+            parameters,
+            sample_fraction,
+            stratify_by,
+            random_state,
+            confidence_level,
+            profiler,
+            progress,
+        )
+    elif lazy:
+        builder = LazyDirectlyRootedTreeBuilder(log, parameters, profiler, progress)
+    else:
+        builder = DirectlyRootedTreeBuilder(log, parameters, profiler, progress)
+    multi_dimensional_drt = builder.get_tree()
     if group_activities:
-        multi_dimensional_drt = group_drt_activities(multi_dimensional_drt)
+        with profile_stage(profiler, "group_activities") as counts:
+            multi_dimensional_drt = group_drt_activities(multi_dimensional_drt)
+            if profiler is not None:
+                counts.update(nodes=tree_size(multi_dimensional_drt))
 
     return multi_dimensional_drt
 
@@ -99,7 +181,9 @@ def get_multi_dimensional_drt_string(
     visualize_quality: bool = True,
     visualize_flexibility: bool = True,
     node_measures: list[Literal["total", "consumed", "remaining"]] = ["total"],
-    arc_measures: list[Literal["avg", "min", "max"]] = [],
+    arc_measures: list[Literal["avg", "min", "max", "std", "p50", "p95"]] = [],
+    max_depth: int | None = None,
+    max_nodes: int | None = None,
 ) -> str:
     """
     Generates a string representation of a multi-dimensional directly rooted tree (DRT) diagram.
@@ -115,11 +199,19 @@ def get_multi_dimensional_drt_string(
             - "consumed": Consumed measure of the node.
             - "remaining": Remaining measure of the node.
             Defaults to ["total"].
-        arc_measures (list[Literal["avg", "min", "max"]], optional): The measures to include for each arc in the visualization.
+        arc_measures (list[Literal["avg", "min", "max", "std", "p50", "p95"]], optional): The measures to include for each arc in the visualization.
             - "avg": Average measure of the arc.
             - "min": Minimum measure of the arc.
             - "max": Maximum measure of the arc.
+            - "std": Standard deviation of the measure of the arc.
+            - "p50", "p95" or any "pNN": Quantile of the service time and cost of the arc. Only shown for trees
+              discovered with `calculate_quantiles=True`.
             Defaults to [].
+        max_depth (int | None, optional): Number of activity levels to include below the root node, or None to include
+            the whole tree. Defaults to None.
+        max_nodes (int | None, optional): Render budget for large trees. Only the `max_nodes` most frequent nodes are
+            rendered and the other branches of each node are collapsed into one "+N more" node with their aggregated
+            data. None renders every node. Defaults to None.
     Returns:
         str: A string representation of the multi-dimensional DRT diagram.
     """
@@ -131,10 +223,65 @@ def get_multi_dimensional_drt_string(
         visualize_flexibility=visualize_flexibility,
         node_measures=node_measures,
         arc_measures=arc_measures,
+        max_depth=max_depth,
+        max_nodes=max_nodes,
     )
     return diagrammer.get_diagram_string()
 
 
+def get_multi_dimensional_drt_image(
+    multi_dimensional_drt: TreeNode,
+    visualize_time: bool = True,
+    visualize_cost: bool = True,
+    visualize_quality: bool = True,
+    visualize_flexibility: bool = True,
+    node_measures: list[Literal["total", "consumed", "remaining"]] = ["total"],
+    arc_measures: list[Literal["avg", "min", "max", "std", "p50", "p95"]] = [],
+    format: str = "svg",
+    max_depth: int | None = None,
+    max_nodes: int | None = None,
+    use_cache: bool = True,
+    render_cache: RenderCache | None = None,
+) -> bytes:
+    """
+    Renders a multi-dimensional directly rooted tree (DRT) in memory, without temporary files.
+
+    Args:
+        multi_dimension_drt (TreeNode): The root of the multi-dimensional DRT.
+        visualize_time (bool, optional): Whether to include the time dimension in the visualization. Defaults to True.
+        visualize_cost (bool, optional): Whether to include the cost dimension in the visualization. Defaults to True.
+        visualize_quality (bool, optional): Whether to include the quality dimension in the visualization. Defaults to True.
+        visualize_flexibility (bool, optional): Whether to include the flexibility dimension in the visualization. Defaults to True.
+        node_measures (list[Literal["total", "consumed", "remaining"]], optional): The measures to include for each node in the visualization.
+            Defaults to ["total"].
+        arc_measures (list[Literal["avg", "min", "max", "std", "p50", "p95"]], optional): The measures to include for each arc in the visualization.
+            Defaults to [].
+        format (str, optional): The Graphviz output format (e.g., "jpg", "png", "svg", "pdf"). Defaults to "svg".
+        max_depth (int | None, optional): Number of activity levels to include below the root node, or None to include
+            the whole tree. Defaults to None.
+        max_nodes (int | None, optional): Render budget for large trees, see `save_vis_multi_dimensional_drt`.
+            Defaults to None.
+        use_cache (bool, optional): Whether to reuse the output of a previous rendering of the same diagram, kept in
+            an in-memory LRU cache keyed by the hash of the DOT source. Defaults to True.
+        render_cache (RenderCache | None, optional): Cache of rendered diagrams keyed by the tree content and these
+            options. A hit skips the DOT generation and the Graphviz layout. Defaults to None.
+
+    Returns:
+        bytes: The rendered diagram.
+    """
+    diagram_options = {
+        "visualize_time": visualize_time,
+        "visualize_cost": visualize_cost,
+        "visualize_quality": visualize_quality,
+        "visualize_flexibility": visualize_flexibility,
+        "node_measures": node_measures,
+        "arc_measures": arc_measures,
+        "max_depth": max_depth,
+        "max_nodes": max_nodes,
+    }
+    return render_multi_dimensional_drt(multi_dimensional_drt, diagram_options, format, use_cache, render_cache)
+
+
 def view_multi_dimensional_drt(
     multi_dimensional_drt: TreeNode,
     visualize_time: bool = True,
@@ -142,8 +289,12 @@ def view_multi_dimensional_drt(
     visualize_quality: bool = True,
     visualize_flexibility: bool = True,
     node_measures: list[Literal["total", "consumed", "remaining"]] = ["total"],
-    arc_measures: list[Literal["avg", "min", "max"]] = [],
+    arc_measures: list[Literal["avg", "min", "max", "std", "p50", "p95"]] = [],
     format="svg",
+    max_depth: int | None = None,
+    max_nodes: int | None = None,
+    use_cache: bool = True,
+    render_cache: RenderCache | None = None,
 ) -> None:
     """
     Visualizes a multi-dimensional directly rooted tree (DRT) using a graphical format.
@@ -159,27 +310,44 @@ def view_multi_dimensional_drt(
             - "consumed": Consumed measure of the node.
             - "remaining": Remaining measure of the node.
             Defaults to ["total"].
-        arc_measures (list[Literal["avg", "min", "max"]], optional): The measures to include for each arc in the visualization.
+        arc_measures (list[Literal["avg", "min", "max", "std", "p50", "p95"]], optional): The measures to include for each arc in the visualization.
             - "avg": Average measure of the arc.
             - "min": Minimum measure of the arc.
             - "max": Maximum measure of the arc.
+            - "std": Standard deviation of the measure of the arc.
+            - "p50", "p95" or any "pNN": Quantile of the service time and cost of the arc. Only shown for trees
+              discovered with `calculate_quantiles=True`.
             Defaults to [].
+        max_depth (int | None, optional): Number of activity levels to include below the root node, or None to include
+            the whole tree. Defaults to None.
+        max_nodes (int | None, optional): Render budget for large trees. Only the `max_nodes` most frequent nodes are
+            rendered and the other branches of each node are collapsed into one "+N more" node with their aggregated
+            data. None renders every node. Defaults to None.
+        use_cache (bool, optional): Whether to reuse the output of a previous rendering of the same diagram instead of
+            running Graphviz again. Defaults to True.
+        render_cache (RenderCache | None, optional): Cache of rendered diagrams keyed by the tree content and these
+            options. A hit skips the DOT generation and the Graphviz layout. Defaults to None.
     Raises:
-        IOError: If the temporary file cannot be created or read.
+        ValueError: If the format cannot be displayed in the current environment.
+        graphviz.ExecutableNotFound: If the Graphviz `dot` executable is not installed.
+        graphviz.CalledProcessError: If `dot` fails to render the diagram.
+        OSError: If the temporary file opened by the external viewer cannot be written.
     Returns:
         None
     """
-
-    drt_string = get_multi_dimensional_drt_string(
-        multi_dimensional_drt,
-        visualize_time=visualize_time,
-        visualize_cost=visualize_cost,
-        visualize_quality=visualize_quality,
-        visualize_flexibility=visualize_flexibility,
-        node_measures=node_measures,
-        arc_measures=arc_measures,
-    )
-    view_graphviz_diagram(drt_string, format=format)
+    check_view_format(format)
+    diagram_options = {
+        "visualize_time": visualize_time,
+        "visualize_cost": visualize_cost,
+        "visualize_quality": visualize_quality,
+        "visualize_flexibility": visualize_flexibility,
+        "node_measures": node_measures,
+        "arc_measures": arc_measures,
+        "max_depth": max_depth,
+        "max_nodes": max_nodes,
+    }
+    diagram = render_multi_dimensional_drt(multi_dimensional_drt, diagram_options, format, use_cache, render_cache)
+    display_diagram(diagram, format)
 
 
 def save_vis_multi_dimensional_drt(
@@ -190,8 +358,11 @@ def save_vis_multi_dimensional_drt(
     visualize_quality: bool = True,
     visualize_flexibility: bool = True,
     node_measures: list[Literal["total", "consumed", "remaining"]] = ["total"],
-    arc_measures: list[Literal["avg", "min", "max"]] = [],
+    arc_measures: list[Literal["avg", "min", "max", "std", "p50", "p95"]] = [],
     format: str = "svg",
+    max_depth: int | None = None,
+    max_nodes: int | None = None,
+    render_cache: RenderCache | None = None,
 ):
     """
     Saves a visualization of a multi-dimensional directly rooted tree (DRT) to a file.
@@ -209,16 +380,242 @@ def save_vis_multi_dimensional_drt(
             - "consumed": Consumed measure of the node.
             - "remaining": Remaining measure of the node.
             Defaults to ["total"].
-        arc_measures (list[Literal["avg", "min", "max"]], optional): The measures to include for each arc in the visualization.
+        arc_measures (list[Literal["avg", "min", "max", "std", "p50", "p95"]], optional): The measures to include for each arc in the visualization.
             - "avg": Average measure of the arc.
             - "min": Minimum measure of the arc.
             - "max": Maximum measure of the arc.
+            - "std": Standard deviation of the measure of the arc.
+            - "p50", "p95" or any "pNN": Quantile of the service time and cost of the arc. Only shown for trees
+              discovered with `calculate_quantiles=True`.
+            Defaults to [].
+        max_depth (int | None, optional): Number of activity levels to include below the root node, or None to include
+            the whole tree. Defaults to None.
+        max_nodes (int | None, optional): Render budget for large trees. Only the `max_nodes` most frequent nodes are
+            rendered and the other branches of each node are collapsed into one "+N more" node with their aggregated
+            data. None renders every node. Defaults to None.
+        render_cache (RenderCache | None, optional): Cache of rendered diagrams keyed by the tree content and these
+            options. A hit skips the DOT generation and the Graphviz layout. Defaults to None.
+
+    Returns:
+        None
+    """
+    diagram_options = {
+        "visualize_time": visualize_time,
+        "visualize_cost": visualize_cost,
+        "visualize_quality": visualize_quality,
+        "visualize_flexibility": visualize_flexibility,
+        "node_measures": node_measures,
+        "arc_measures": arc_measures,
+        "max_depth": max_depth,
+        "max_nodes": max_nodes,
+    }
+    # One-off renders would evict the diagrams cached for viewing
+    diagram = render_multi_dimensional_drt(multi_dimensional_drt, diagram_options, format, False, render_cache)
+    Path(f"{file_path}.{format}").write_bytes(diagram)
+
+
+def save_vis_multi_dimensional_drts(
+    multi_dimensional_drt: TreeNode,
+    configs: list[RenderConfig],
+    max_workers: int | None = None,
+    max_pending: int | None = None,
+    progress: Progress = "tqdm",
+) -> list[str]:
+    """
+    Saves many visualizations of a multi-dimensional directly rooted tree (DRT), one per render configuration.
+
+    Faster than calling `save_vis_multi_dimensional_drt` for every configuration: statistics shared by the
+    visualizations are computed once and the `dot` subprocesses run concurrently.
+
+    Args:
+        multi_dimensional_drt (TreeNode): The root of the multi-dimensional DRT to visualize.
+        configs (list[RenderConfig]): The file path and visualization options of each visualization.
+        max_workers (int | None, optional): Number of concurrent `dot` subprocesses. Defaults to the number of CPUs.
+        max_pending (int | None, optional): Maximum number of visualizations queued for rendering. Defaults to twice
+            the number of workers.
+        progress (Progress, optional): How to report the progress of the visualizations. Defaults to "tqdm".
+
+    Returns:
+        list[str]: The path of the saved file of each configuration, in the same order.
+
+    Example:
+        >>> configs = [
+        ...     mddrt.RenderConfig(f"drt_{len(node_measures)}_{len(arc_measures)}", node_measures=node_measures, arc_measures=arc_measures)
+        ...     for node_measures in [["total"], ["total", "consumed", "remaining"]]
+        ...     for arc_measures in [[], ["avg", "min", "max"]]
+        ... ]
+        >>> mddrt.save_vis_multi_dimensional_drts(drt, configs, max_workers=4)
+    """
+    renderer = BatchDiagramRenderer(multi_dimensional_drt, max_workers=max_workers, max_pending=max_pending)
+    return renderer.render(configs, progress=progress)
+
+
+def get_multi_dimensional_drt_html(
+    multi_dimensional_drt: TreeNode,
+    visualize_time: bool = True,
+    visualize_cost: bool = True,
+    visualize_quality: bool = True,
+    visualize_flexibility: bool = True,
+    node_measures: list[Literal["total", "consumed", "remaining"]] = ["total"],
+    arc_measures: list[Literal["avg", "min", "max", "std", "p50", "p95"]] = [],
+    max_depth: int | None = None,
+    max_nodes: int | None = None,
+    initial_depth: int = 2,
+) -> str:
+    """
+    Generates a self-contained interactive HTML page of a multi-dimensional directly rooted tree (DRT).
+
+    The page does not need Graphviz: the tree is laid out and drawn in the browser, with the same labels and
+    colors as the Graphviz diagram. Clicking a node expands or collapses its children.
+
+    Args:
+        multi_dimensional_drt (TreeNode): The root of the multi-dimensional DRT to visualize.
+        visualize_time (bool, optional): Whether to include the time dimension in the visualization. Defaults to True.
+        visualize_cost (bool, optional): Whether to include the cost dimension in the visualization. Defaults to True.
+        visualize_quality (bool, optional): Whether to include the quality dimension in the visualization. Defaults to True.
+        visualize_flexibility (bool, optional): Whether to include the flexibility dimension in the visualization. Defaults to True.
+        node_measures (list[Literal["total", "consumed", "remaining"]], optional): The measures to include for each node in the visualization.
+            Defaults to ["total"].
+        arc_measures (list[Literal["avg", "min", "max", "std", "p50", "p95"]], optional): The measures to include for each arc in the visualization.
+            Defaults to [].
+        max_depth (int | None, optional): Number of activity levels to include below the root node, or None to include
+            the whole tree. Defaults to None.
+        max_nodes (int | None, optional): Render budget for large trees, see `save_vis_multi_dimensional_drt`.
+            Defaults to None.
+        initial_depth (int, optional): Number of levels shown when the page is opened. Defaults to 2.
+
+    Returns:
+        str: The HTML page.
+    """
+    renderer = DirectlyRootedTreeHtmlRenderer(
+        multi_dimensional_drt,
+        visualize_time=visualize_time,
+        visualize_cost=visualize_cost,
+        visualize_quality=visualize_quality,
+        visualize_flexibility=visualize_flexibility,
+        node_measures=node_measures,
+        arc_measures=arc_measures,
+        max_depth=max_depth,
+        max_nodes=max_nodes,
+        initial_depth=initial_depth,
+    )
+    return renderer.get_html_string()
+
+
+def save_html_multi_dimensional_drt(
+    multi_dimensional_drt: TreeNode,
+    file_path: str,
+    visualize_time: bool = True,
+    visualize_cost: bool = True,
+    visualize_quality: bool = True,
+    visualize_flexibility: bool = True,
+    node_measures: list[Literal["total", "consumed", "remaining"]] = ["total"],
+    arc_measures: list[Literal["avg", "min", "max", "std", "p50", "p95"]] = [],
+    max_depth: int | None = None,
+    max_nodes: int | None = None,
+    initial_depth: int = 2,
+) -> None:
+    """
+    Saves a self-contained interactive HTML page of a multi-dimensional directly rooted tree (DRT).
+
+    See `get_multi_dimensional_drt_html` for the arguments.
+
+    Args:
+        multi_dimensional_drt (TreeNode): The root of the multi-dimensional DRT to visualize.
+        file_path (str): The path of the HTML file.
+
+    Returns:
+        None
+    """
+    drt_html = get_multi_dimensional_drt_html(
+        multi_dimensional_drt,
+        visualize_time=visualize_time,
+        visualize_cost=visualize_cost,
+        visualize_quality=visualize_quality,
+        visualize_flexibility=visualize_flexibility,
+        node_measures=node_measures,
+        arc_measures=arc_measures,
+        max_depth=max_depth,
+        max_nodes=max_nodes,
+        initial_depth=initial_depth,
+    )
+    Path(file_path).write_text(drt_html, encoding="utf-8")
+
+
+def get_multi_dimensional_drt_svg(
+    multi_dimensional_drt: TreeNode,
+    visualize_time: bool = True,
+    visualize_cost: bool = True,
+    visualize_quality: bool = True,
+    visualize_flexibility: bool = True,
+    node_measures: list[Literal["total", "consumed", "remaining"]] = ["total"],
+    arc_measures: list[Literal["avg", "min", "max", "std", "p50", "p95"]] = [],
+    max_depth: int | None = None,
+    max_nodes: int | None = None,
+) -> str:
+    """
+    Generates an SVG diagram of a multi-dimensional directly rooted tree (DRT) without Graphviz.
+
+    The tree is laid out with a linear time tidy tree layout and written as SVG directly, with the same labels and
+    colors as the Graphviz diagram, so large trees are rendered in seconds and the `dot` binary is not needed.
+
+    Args:
+        multi_dimensional_drt (TreeNode): The root of the multi-dimensional DRT to visualize.
+        visualize_time (bool, optional): Whether to include the time dimension in the visualization. Defaults to True.
+        visualize_cost (bool, optional): Whether to include the cost dimension in the visualization. Defaults to True.
+        visualize_quality (bool, optional): Whether to include the quality dimension in the visualization. Defaults to True.
+        visualize_flexibility (bool, optional): Whether to include the flexibility dimension in the visualization. Defaults to True.
+        node_measures (list[Literal["total", "consumed", "remaining"]], optional): The measures to include for each node in the visualization.
+            Defaults to ["total"].
+        arc_measures (list[Literal["avg", "min", "max", "std", "p50", "p95"]], optional): The measures to include for each arc in the visualization.
             Defaults to [].
+        max_depth (int | None, optional): Number of activity levels to include below the root node, or None to include
+            the whole tree. Defaults to None.
+        max_nodes (int | None, optional): Render budget for large trees, see `save_vis_multi_dimensional_drt`.
+            Defaults to None.
+
+    Returns:
+        str: The SVG diagram.
+    """
+    renderer = DirectlyRootedTreeSvgRenderer(
+        multi_dimensional_drt,
+        visualize_time=visualize_time,
+        visualize_cost=visualize_cost,
+        visualize_quality=visualize_quality,
+        visualize_flexibility=visualize_flexibility,
+        node_measures=node_measures,
+        arc_measures=arc_measures,
+        max_depth=max_depth,
+        max_nodes=max_nodes,
+    )
+    return renderer.get_svg_string()
+
+
+def save_svg_multi_dimensional_drt(
+    multi_dimensional_drt: TreeNode,
+    file_path: str,
+    visualize_time: bool = True,
+    visualize_cost: bool = True,
+    visualize_quality: bool = True,
+    visualize_flexibility: bool = True,
+    node_measures: list[Literal["total", "consumed", "remaining"]] = ["total"],
+    arc_measures: list[Literal["avg", "min", "max", "std", "p50", "p95"]] = [],
+    max_depth: int | None = None,
+    max_nodes: int | None = None,
+) -> None:
+    """
+    Saves an SVG diagram of a multi-dimensional directly rooted tree (DRT) rendered without Graphviz.
+
+    See `get_multi_dimensional_drt_svg` for the arguments.
+
+    Args:
+        multi_dimensional_drt (TreeNode): The root of the multi-dimensional DRT to visualize.
+        file_path (str): The path of the SVG file.
 
     Returns:
         None
     """
-    drt_string = get_multi_dimensional_drt_string(
+    drt_svg = get_multi_dimensional_drt_svg(
         multi_dimensional_drt,
         visualize_time=visualize_time,
         visualize_cost=visualize_cost,
@@ -226,5 +623,122 @@ def save_vis_multi_dimensional_drt(
         visualize_flexibility=visualize_flexibility,
         node_measures=node_measures,
         arc_measures=arc_measures,
+        max_depth=max_depth,
+        max_nodes=max_nodes,
+    )
+    Path(file_path).write_text(drt_svg, encoding="utf-8")
+
+
+def get_multi_dimensional_drt_diff_string(
+    drt_diff: TreeNodeDiff,
+    visualize_time: bool = True,
+    visualize_cost: bool = True,
+    visualize_quality: bool = True,
+    visualize_flexibility: bool = True,
+) -> str:
+    """
+    Generates a string representation of the diagram of the diff between two multi-dimensional DRTs.
+
+    Args:
+        drt_diff (TreeNodeDiff): The root of the diff, as returned by `diff_trees`.
+        visualize_time (bool, optional): Whether to include the time dimension in the visualization. Defaults to True.
+        visualize_cost (bool, optional): Whether to include the cost dimension in the visualization. Defaults to True.
+        visualize_quality (bool, optional): Whether to include the quality dimension in the visualization. Defaults to True.
+        visualize_flexibility (bool, optional): Whether to include the flexibility dimension in the visualization. Defaults to True.
+
+    Returns:
+        str: A string representation of the diff diagram.
+    """
+    diagrammer = DirectlyRootedTreeDiffDiagrammer(
+        drt_diff,
+        visualize_time=visualize_time,
+        visualize_cost=visualize_cost,
+        visualize_quality=visualize_quality,
+        visualize_flexibility=visualize_flexibility,
+    )
+    return diagrammer.get_diagram_string()
+
+
+def view_multi_dimensional_drt_diff(
+    drt_diff: TreeNodeDiff,
+    visualize_time: bool = True,
+    visualize_cost: bool = True,
+    visualize_quality: bool = True,
+    visualize_flexibility: bool = True,
+    format: str = "svg",
+) -> None:
+    """
+    Visualizes the diff between two multi-dimensional DRTs.
+
+    Args:
+        drt_diff (TreeNodeDiff): The root of the diff, as returned by `diff_trees`.
+        visualize_time (bool, optional): Whether to include the time dimension in the visualization. Defaults to True.
+        visualize_cost (bool, optional): Whether to include the cost dimension in the visualization. Defaults to True.
+        visualize_quality (bool, optional): Whether to include the quality dimension in the visualization. Defaults to True.
+        visualize_flexibility (bool, optional): Whether to include the flexibility dimension in the visualization. Defaults to True.
+        format (str, optional): The file format of the visualization output (e.g., "jpg", "png", "jpeg", "svg", "webp"). Defaults to "svg".
+
+    Returns:
+        None
+    """
+    drt_diff_string = get_multi_dimensional_drt_diff_string(
+        drt_diff,
+        visualize_time=visualize_time,
+        visualize_cost=visualize_cost,
+        visualize_quality=visualize_quality,
+        visualize_flexibility=visualize_flexibility,
+    )
+    view_graphviz_diagram(drt_diff_string, format=format)
+
+
+def save_vis_multi_dimensional_drt_diff(
+    drt_diff: TreeNodeDiff,
+    file_path: str,
+    visualize_time: bool = True,
+    visualize_cost: bool = True,
+    visualize_quality: bool = True,
+    visualize_flexibility: bool = True,
+    format: str = "svg",
+) -> None:
+    """
+    Saves a visualization of the diff between two multi-dimensional DRTs to a file.
+
+    Args:
+        drt_diff (TreeNodeDiff): The root of the diff, as returned by `diff_trees`.
+        file_path (str): The path where the visualization will be saved.
+        visualize_time (bool, optional): Whether to include the time dimension in the visualization. Defaults to True.
+        visualize_cost (bool, optional): Whether to include the cost dimension in the visualization. Defaults to True.
+        visualize_quality (bool, optional): Whether to include the quality dimension in the visualization. Defaults to True.
+        visualize_flexibility (bool, optional): Whether to include the flexibility dimension in the visualization. Defaults to True.
+        format (str, optional): The file format for the visualization output (e.g., "jpg", "jpeg", "png", "webp", "svg"). Defaults to "svg".
+
+    Returns:
+        None
+    """
+    drt_diff_string = get_multi_dimensional_drt_diff_string(
+        drt_diff,
+        visualize_time=visualize_time,
+        visualize_cost=visualize_cost,
+        visualize_quality=visualize_quality,
+        visualize_flexibility=visualize_flexibility,
     )
-    save_graphviz_diagram(drt_string, file_path, format)
+    save_graphviz_diagram(drt_diff_string, file_path, format)
+
+
+def render_multi_dimensional_drt(
+    multi_dimensional_drt: TreeNode,
+    diagram_options: dict,
+    format: str,
+    use_cache: bool,
+    render_cache: RenderCache | None,
+) -> bytes:
+    if render_cache is not None:
+        key = render_cache_key(multi_dimensional_drt, {**diagram_options, "format": format})
+        diagram = render_cache.get(key)
+        if diagram is not None:
+            return diagram
+    drt_string = get_multi_dimensional_drt_string(multi_dimensional_drt, **diagram_options)
+    diagram = pipe_graphviz_diagram(drt_string, format, use_cache and render_cache is None)
+    if render_cache is not None:
+        render_cache.put(key, diagram)
+    return diagram
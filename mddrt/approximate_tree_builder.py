@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import math
+from statistics import NormalDist
+from typing import TYPE_CHECKING, Literal
+
+from mddrt.tree_builder import DirectlyRootedTreeBuilder
+from mddrt.utils.builder import log_optional_activities, popcount, resolve_missing_columns
+from mddrt.utils.misc import iter_nodes
+from mddrt.utils.running_stats import RunningStats
+from mddrt.utils.sampling import stratified_cases_sample
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from mddrt.drt_parameters import DirectlyRootedTreeParameters
+    from mddrt.tree_node import TreeNode
+    from mddrt.utils.profiler import DiscoveryProfiler
+    from mddrt.utils.progress import Progress
+
+SUMMED_METRICS = {
+    "time": ["service", "waiting", "lead", "lead_case", "lead_accumulated"],
+    "cost": ["total", "total_case", "accumulated"],
+    "quality": ["total", "total_case", "accumulated"],
+    "flexibility": ["total", "total_case", "accumulated"],
+}
+
+
+class ApproximateDirectlyRootedTreeBuilder(DirectlyRootedTreeBuilder):
+    def __init__(
+        self,
+        log: pd.DataFrame,
+        params: DirectlyRootedTreeParameters,
+        sample_fraction: float = 0.1,
+        stratify_by: Literal["variant", "start_activity"] = "variant",
+        random_state: int | None = None,
+        confidence_level: float = 0.95,
+        profiler: DiscoveryProfiler | None = None,
+        progress: Progress = "tqdm",
+    ) -> None:
+        """
+        Builds a DRT from a stratified sample of the cases of the log.
+
+        Each sampled case is weighted by the inverse of its inclusion probability (Horvitz-Thompson), so node
+        frequencies and summed metrics are unbiased estimates of the values of the full log. Optional activities,
+        used by the flexibility dimension, are the ones of the full log. Min and max values are the ones
+        observed in the sample. Each node stores in `confidence_intervals` the interval of the per-case
+        average of every summed metric, using the normal approximation with finite population correction.
+
+        Args:
+            log (pd.DataFrame): The event log.
+            params (DirectlyRootedTreeParameters): The tree parameters.
+            sample_fraction (float, optional): Expected fraction of cases to sample. Defaults to 0.1.
+            stratify_by (Literal["variant", "start_activity"], optional): Cases attribute used to build the
+                strata. Defaults to "variant".
+            random_state (int | None, optional): Seed of the sampling. Defaults to None.
+            confidence_level (float, optional): Confidence level of the intervals. Defaults to 0.95.
+            profiler (DiscoveryProfiler | None, optional): Collects per-stage statistics. Defaults to None.
+            progress (Progress, optional): How to report the build progress. Defaults to "tqdm".
+        """
+        params = resolve_missing_columns(log, params)
+        # Optional activities are the ones of the whole log, as a sample misses the rare variants
+        self.log_optional_activities: list[str] = (
+            log_optional_activities(log, params) if params.calculate_flexibility else []
+        )
+        sampled_log, self.cases_weights = stratified_cases_sample(
+            log, params, sample_fraction, stratify_by, random_state
+        )
+        self.z_score: float = NormalDist().inv_cdf((1 + confidence_level) / 2)
+        self.weighted_data: dict[int, dict] = {}
+        super().__init__(sampled_log, params, profiler, progress)
+
+    def build_cases(self, cases_metrics: pd.DataFrame) -> None:
+        super().build_cases(cases_metrics)
+        if self.params.calculate_flexibility:
+            self.optional_activities = sum(
+                1 << self.alphabet.codes[name] for name in self.log_optional_activities if name in self.alphabet.codes
+            )
+        for case_id, case in self.cases.items():
+            case["weight"] = self.cases_weights[case_id]
+            if self.params.calculate_flexibility:
+                case["optional_activities"] = self.optional_activities
+                case["flexibility"] = popcount(case["activity_sets"][-1] & self.optional_activities)
+
+    def build_tree(self) -> None:
+        super().build_tree()
+        for node in iter_nodes(self.tree):
+            if node is not self.tree:
+                self.apply_weights(node)
+
+    def update_node_dimensions(self, node: TreeNode, depth: int, current_case: dict) -> None:
+        weight = current_case["weight"]
+        node_data = self.weighted_data.setdefault(
+            node.id,
+            {
+                "weight": 0.0,
+                "samples": 0,
+                "metrics": {
+                    dimension: {metric: RunningStats() for metric in SUMMED_METRICS[dimension]}
+                    for dimension in self.dimensions_to_calculate
+                },
+            },
+        )
+        node_data["weight"] += weight
+        node_data["samples"] += 1
+        for dimension in self.dimensions_to_calculate:
+            dimension_data = node.dimensions_data[dimension]
+            previous_values = {metric: dimension_data[metric] for metric in SUMMED_METRICS[dimension]}
+            node.update_dimension(dimension, depth, current_case)
+            for metric, previous_value in previous_values.items():
+                node_data["metrics"][dimension][metric].update(dimension_data[metric] - previous_value, weight)
+
+    def apply_weights(self, node: TreeNode) -> None:
+        node_data = self.weighted_data[node.id]
+        total_weight = node_data["weight"]
+        samples = node_data["samples"]
+        # Finite population correction, using the estimated number of cases that reach the node
+        population_correction = math.sqrt(max(0.0, 1 - samples / total_weight))
+        node.frequency = round(total_weight)
+        node.confidence_intervals = {}
+        for dimension, metrics in node_data["metrics"].items():
+            dimension_data = node.dimensions_data[dimension]
+            node.confidence_intervals[dimension] = {}
+            for metric, stats in metrics.items():
+                margin = self.z_score * stats.std / math.sqrt(samples) * population_correction
+                node.confidence_intervals[dimension][metric] = (stats.mean - margin, stats.mean + margin)
+                weighted_sum = stats.mean * total_weight
+                dimension_data[metric] = round(weighted_sum) if dimension == "time" else weighted_sum
+            if dimension == "time":
+                dimension_data["lead_remainder"] = dimension_data["lead_case"] - dimension_data["lead_accumulated"]
+            else:
+                dimension_data["remainder"] = dimension_data["total_case"] - dimension_data["accumulated"]
+            node.running_stats[dimension] = metrics["service" if dimension == "time" else "total"]
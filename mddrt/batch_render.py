@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
+
+from mddrt.render_budget import collapse_low_frequency_branches
+from mddrt.tree_diagrammer import DirectlyRootedTreeDiagrammer
+from mddrt.utils.actions import render_graphviz_diagram
+from mddrt.utils.diagrammer import dimensions_min_and_max
+from mddrt.utils.progress import track_progress
+
+if TYPE_CHECKING:
+    from mddrt.tree_node import TreeNode
+    from mddrt.utils.progress import Progress
+
+
+@dataclass
+class RenderConfig:
+    file_path: str
+    visualize_time: bool = True
+    visualize_cost: bool = True
+    visualize_quality: bool = True
+    visualize_flexibility: bool = True
+    node_measures: list[Literal["total", "consumed", "remaining"]] = field(default_factory=lambda: ["total"])
+    arc_measures: list[Literal["avg", "min", "max", "std", "p50", "p95"]] = field(default_factory=list)
+    format: str = "svg"
+    max_depth: int | None = None
+    max_nodes: int | None = None
+
+
+class BatchDiagramRenderer:
+    def __init__(self, tree: TreeNode, max_workers: int | None = None, max_pending: int | None = None) -> None:
+        """
+        Renders many diagrams of the same DRT, e.g. every combination of dimensions and measures.
+
+        The DOT source of each diagram is generated in the calling thread. The statistics shared by the diagrams
+        with the same `max_depth` and `max_nodes` (the reduced tree and the min and max values used for colors and
+        arc widths) are computed once. Sources are rendered by `dot` subprocesses in a thread pool, as rendering is
+        mostly spent waiting for the subprocess. At most `max_pending` renders are queued, so generating sources
+        never runs far ahead of rendering them.
+
+        Args:
+            tree (TreeNode): The root of the tree to diagram.
+            max_workers (int | None, optional): Number of concurrent `dot` subprocesses. Defaults to the number
+                of CPUs.
+            max_pending (int | None, optional): Maximum number of sources waiting to be rendered or being rendered.
+                Defaults to twice the number of workers.
+
+        Raises:
+            ValueError: If `max_workers` or `max_pending` is lower than 1.
+        """
+        self.tree = tree
+        self.max_workers = max_workers if max_workers is not None else os.cpu_count() or 1
+        self.max_pending = max_pending if max_pending is not None else 2 * self.max_workers
+        if self.max_workers < 1 or self.max_pending < 1:
+            error_message = "Max workers and max pending renders should be at least 1."
+            raise ValueError(error_message)
+        self.diagram_trees: dict[tuple[int | None, int | None], tuple[TreeNode, dict[str, list[int]]]] = {}
+
+    def render(self, configs: list[RenderConfig], progress: Progress = "tqdm") -> list[str]:
+        """
+        Renders a diagram for each configuration.
+
+        Args:
+            configs (list[RenderConfig]): The configuration and file path of each diagram.
+            progress (Progress, optional): How to report the progress of the diagrams. Defaults to "tqdm".
+
+        Returns:
+            list[str]: The path of the rendered file of each configuration, in the same order.
+        """
+        rendered_paths: list[str | None] = [None] * len(configs)
+        pending: dict[Future, int] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for index, config in enumerate(track_progress(configs, len(configs), "Rendering Diagrams", progress)):
+                if len(pending) >= self.max_pending:
+                    self.collect_rendered(pending, rendered_paths, FIRST_COMPLETED)
+                future = executor.submit(
+                    render_graphviz_diagram, self.diagram_string(config), config.file_path, config.format
+                )
+                pending[future] = index
+            self.collect_rendered(pending, rendered_paths)
+
+        return rendered_paths
+
+    def diagram_string(self, config: RenderConfig) -> str:
+        diagram_tree, min_and_max = self.diagram_tree(config.max_depth, config.max_nodes)
+        diagrammer = DirectlyRootedTreeDiagrammer(
+            diagram_tree,
+            visualize_time=config.visualize_time,
+            visualize_cost=config.visualize_cost,
+            visualize_quality=config.visualize_quality,
+            visualize_flexibility=config.visualize_flexibility,
+            node_measures=config.node_measures,
+            arc_measures=config.arc_measures,
+            max_depth=config.max_depth,
+            precomputed_min_and_max=min_and_max,
+        )
+        return diagrammer.get_diagram_string()
+
+    def diagram_tree(self, max_depth: int | None, max_nodes: int | None) -> tuple[TreeNode, dict[str, list[int]]]:
+        key = (max_depth, max_nodes)
+        if key not in self.diagram_trees:
+            diagram_tree = (
+                collapse_low_frequency_branches(self.tree, max_nodes, max_depth) if max_nodes is not None else self.tree
+            )
+            self.diagram_trees[key] = (diagram_tree, dimensions_min_and_max(diagram_tree, max_depth))
+        return self.diagram_trees[key]
+
+    def collect_rendered(
+        self,
+        pending: dict[Future, int],
+        rendered_paths: list[str | None],
+        return_when: str = "ALL_COMPLETED",
+    ) -> None:
+        done, _ = wait(pending, return_when=return_when)
+        for future in done:
+            rendered_paths[pending.pop(future)] = future.result()
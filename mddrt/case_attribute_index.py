@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from mddrt.drt_parameters import DirectlyRootedTreeParameters
+from mddrt.tree_builder import DirectlyRootedTreeBuilder
+from mddrt.utils.builder import optional_activities_mask, popcount
+from mddrt.utils.profiler import profile_stage
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from mddrt.tree_node import TreeNode
+    from mddrt.utils.profiler import DiscoveryProfiler
+    from mddrt.utils.progress import Progress
+
+
+class CaseAttributeIndex:
+    def __init__(
+        self,
+        log: pd.DataFrame,
+        attributes: list[str],
+        calculate_time: bool = True,
+        calculate_cost: bool = True,
+        calculate_quality: bool = True,
+        calculate_flexibility: bool = True,
+        case_id_key: str = "case:concept:name",
+        activity_key: str = "concept:name",
+        timestamp_key: str = "time:timestamp",
+        start_timestamp_key: str = "start_timestamp",
+        cost_key: str = "cost:total",
+        progress: Progress = "tqdm",
+    ) -> None:
+        """
+        Index of the cases of a log by case attributes, to build DRTs of slices of the log without rebuilding
+        the cases of each slice.
+
+        The cases of the log are built once. For every attribute value, a bitmap (packed with `np.packbits`)
+        marks the cases whose first event has that value. Trees of a slice are built from the precomputed cases
+        selected by combining bitmaps, and are equal to the trees discovered from the filtered log.
+
+        Args:
+            log (pd.DataFrame): The event log.
+            attributes (list[str]): The case attribute columns to index.
+            calculate_time (bool, optional): Whether to include the time dimension in the trees. Defaults to True.
+            calculate_cost (bool, optional): Whether to include the cost dimension in the trees. Defaults to True.
+            calculate_quality (bool, optional): Whether to include the quality dimension in the trees.
+                Defaults to True.
+            calculate_flexibility (bool, optional): Whether to include the flexibility dimension in the trees.
+                Defaults to True.
+            case_id_key (str, optional): The key for case IDs in the event log. Defaults to "case:concept:name".
+            activity_key (str, optional): The key for activity names in the event log. Defaults to "concept:name".
+            timestamp_key (str, optional): The key for timestamps in the event log. Defaults to "time:timestamp".
+            start_timestamp_key (str, optional): The key for start timestamps in the event log.
+                Defaults to "start_timestamp".
+            cost_key (str, optional): The key for cost information in the event log. Defaults to "cost:total".
+            progress (Progress, optional): How to report the progress of building the cases. Defaults to "tqdm".
+        """
+        params = DirectlyRootedTreeParameters(
+            case_id_key,
+            activity_key,
+            timestamp_key,
+            start_timestamp_key,
+            cost_key,
+            calculate_time,
+            calculate_cost,
+            calculate_quality,
+            calculate_flexibility,
+        )
+        self.cases_builder: IndexedCasesBuilder = IndexedCasesBuilder(log, params, progress=progress)
+        self.case_ids: list[Hashable] = list(self.cases_builder.cases)
+        self.bitmaps: dict[str, dict[Hashable, np.ndarray]] = {
+            attribute: self.build_attribute_bitmaps(log, attribute) for attribute in attributes
+        }
+
+    def build_attribute_bitmaps(self, log: pd.DataFrame, attribute: str) -> dict[Hashable, np.ndarray]:
+        case_id_key = self.cases_builder.params.case_id_key
+        cases_values = log.groupby(case_id_key, sort=False, observed=True)[attribute].first()
+        value_codes, values = pd.factorize(cases_values.reindex(self.case_ids))
+        return {value: np.packbits(value_codes == code) for code, value in enumerate(values)}
+
+    def select(self, filters: dict[str, Hashable | list[Hashable]]) -> np.ndarray:
+        """
+        Gets the bitmap of the cases that match every filter.
+
+        Args:
+            filters (dict[str, Hashable | list[Hashable]]): Attribute values to select by indexed attribute. A list
+                of values selects the cases with any of them.
+
+        Raises:
+            ValueError: If an attribute is not indexed.
+
+        Returns:
+            np.ndarray: The packed bitmap of the selected cases. Bitmaps can be combined with `&`, `|` and `~`.
+        """
+        selection = np.packbits(np.ones(len(self.case_ids), dtype=bool))
+        for attribute, values in filters.items():
+            if attribute not in self.bitmaps:
+                error_message = f"Attribute '{attribute}' is not indexed."
+                raise ValueError(error_message)
+            attribute_selection = np.zeros_like(selection)
+            for value in values if isinstance(values, list) else [values]:
+                if value in self.bitmaps[attribute]:
+                    attribute_selection |= self.bitmaps[attribute][value]
+            selection &= attribute_selection
+        return selection
+
+    def selected_cases(self, selection: np.ndarray) -> np.ndarray:
+        return np.flatnonzero(np.unpackbits(selection, count=len(self.case_ids)))
+
+    def build_tree(
+        self,
+        selection: dict[str, Hashable | list[Hashable]] | np.ndarray,
+        profiler: DiscoveryProfiler | None = None,
+        progress: Progress = None,
+    ) -> TreeNode:
+        """
+        Builds the DRT of the selected cases.
+
+        Args:
+            selection (dict[str, Hashable | list[Hashable]] | np.ndarray): Filters as accepted by `select`, or a
+                bitmap of cases.
+            profiler (DiscoveryProfiler | None, optional): Collects per-stage statistics. Defaults to None.
+            progress (Progress, optional): How to report the build progress. Defaults to None.
+
+        Raises:
+            ValueError: If no case is selected.
+
+        Returns:
+            TreeNode: The root of the DRT of the selected cases.
+        """
+        if isinstance(selection, dict):
+            selection = self.select(selection)
+        case_positions = self.selected_cases(selection)
+        if len(case_positions) == 0:
+            error_message = "No case matches the selection."
+            raise ValueError(error_message)
+        selected_case_ids = [self.case_ids[position] for position in case_positions]
+        return SelectedCasesTreeBuilder(self.cases_builder, selected_case_ids, profiler, progress).get_tree()
+
+
+class IndexedCasesBuilder(DirectlyRootedTreeBuilder):
+    def build(self) -> None:
+        self.prepare_cases()
+
+
+class SelectedCasesTreeBuilder(DirectlyRootedTreeBuilder):
+    def __init__(
+        self,
+        cases_builder: DirectlyRootedTreeBuilder,
+        case_ids: list[Hashable],
+        profiler: DiscoveryProfiler | None = None,
+        progress: Progress = "tqdm",
+        recompute_optional_activities: bool = True,
+    ) -> None:
+        self.cases_builder: DirectlyRootedTreeBuilder = cases_builder
+        self.selected_case_ids: list[Hashable] = case_ids
+        self.recompute_optional_activities: bool = recompute_optional_activities
+        super().__init__(cases_builder.log, cases_builder.params, profiler, progress, cases_builder.alphabet)
+
+    def prepare_cases(self) -> None:
+        with profile_stage(self.profiler, "select_cases") as counts:
+            self.select_cases()
+            counts.update(cases=len(self.cases))
+
+    def select_cases(self) -> None:
+        cases = {case_id: dict(self.cases_builder.cases[case_id]) for case_id in self.selected_case_ids}
+        self.optional_activities = self.cases_builder.optional_activities
+        if self.params.calculate_flexibility and self.recompute_optional_activities:
+            # Optional activities, and so the optionality of each case, depend on the selected cases
+            self.optional_activities = optional_activities_mask(case["activity_sets"][-1] for case in cases.values())
+            for case in cases.values():
+                case["optional_activities"] = self.optional_activities
+                case["flexibility"] = popcount(case["activity_sets"][-1] & self.optional_activities)
+        self.cases = cases
@@ -12,3 +12,4 @@ class DirectlyRootedTreeParameters:
     calculate_cost: bool = True
     calculate_quality: bool = True
     calculate_flexibility: bool = True
+    calculate_quantiles: bool = False
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from collections import deque
+
+from mddrt.tree_builder import DirectlyRootedTreeBuilder
+from mddrt.tree_node import LazyTreeNode
+from mddrt.utils.quantile_sketch import create_quantile_sketches
+
+
+class LazyDirectlyRootedTreeBuilder(DirectlyRootedTreeBuilder):
+    """
+    Builds a DRT whose nodes are materialized on demand.
+
+    Cases are sorted by their activity sequence, so the cases that pass through a node are a contiguous range of
+    the sorted cases. Each node only stores that range, and its children (with their frequencies and dimensions
+    data) are computed from it the first time they are accessed, then cached. Viewing the first levels of a tree
+    then only costs the cases that reach those levels.
+    """
+
+    def build_tree(self) -> None:
+        self.sorted_cases: list[dict] = sorted(self.cases.values(), key=lambda case: case["activities"])
+        self.sorted_activities: list[list[int]] = [case["activities"] for case in self.sorted_cases]
+        self.tree = LazyTreeNode("root", -1, self.alphabet, self.tree.id, self, (0, len(self.sorted_cases)))
+
+    def expand_node(self, node: LazyTreeNode) -> None:
+        start, end = node.cases_range
+        depth = node.depth + 1
+        position = start
+        # Cases that end in the node sort before the ones that continue
+        while position < end and len(self.sorted_activities[position]) <= depth:
+            position += 1
+
+        while position < end:
+            activity = self.sorted_activities[position][depth]
+            child_start = position
+            while position < end and self.sorted_activities[position][depth] == activity:
+                position += 1
+            child = self.create_lazy_node(activity, depth, (child_start, position))
+            child.set_parent(node)
+            node.add_children(child)
+
+    def create_lazy_node(self, activity: int, depth: int, cases_range: tuple[int, int]) -> LazyTreeNode:
+        node = LazyTreeNode(
+            self.alphabet.decode(activity), depth, self.alphabet, next(self.node_ids), self, cases_range, activity
+        )
+        if self.params.calculate_quantiles:
+            node.quantile_sketches = create_quantile_sketches(self.dimensions_to_calculate)
+        for position in range(*cases_range):
+            node.update_frequency()
+            self.update_node_dimensions(node, depth, self.sorted_cases[position])
+        return node
+
+    def query_prefix(self, prefix: list[int]) -> LazyTreeNode | None:
+        # Lists of activities compare lexicographically, so the cases starting with the prefix are the ones
+        # between the prefix and the prefix followed by a value greater than any activity
+        start = bisect_left(self.sorted_activities, prefix)
+        end = bisect_left(self.sorted_activities, [*prefix, math.inf])
+        if start == end:
+            return None
+        return self.create_lazy_node(prefix[-1], len(prefix) - 1, (start, end))
+
+    def tree_size(self) -> int:
+        # Counts the materialized nodes only, to not expand the whole tree
+        size = 0
+        queue = deque([self.tree])
+        while queue:
+            current_node = queue.popleft()
+            size += 1
+            queue.extend(current_node.expanded_children())
+        return size
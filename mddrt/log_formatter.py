@@ -3,43 +3,76 @@ from __future__ import annotations
 import pandas as pd
 
 
-def log_formatter(log: pd.DataFrame, log_format: dict, timestamp_format: str | None = None):
+def log_formatter(
+    log: pd.DataFrame,
+    log_format: dict,
+    timestamp_format: str | None = None,
+    zero_copy: bool = False,
+) -> pd.DataFrame:
     """Format the log DataFrame based on the provided format dictionary.
 
     Args:
         log (pd.DataFrame): The log DataFrame to be formatted.
         format (dict): The format dictionary containing the column mappings.
         timestamp_format (str | None): The format string for the timestamp column. Defaults to None.
+        zero_copy (bool): If True, columns are renamed without copying their data, missing start timestamp,
+            cost and resource columns are not materialized (the tree builder falls back to the complete
+            timestamp and to zero costs) and the case id and activity columns are stored as pandas
+            categoricals. Defaults to False.
 
     Returns:
         pd.DataFrame: The formatted log DataFrame.
 
     """
-    log = log.rename(
-        columns={
-            log_format["case:concept:name"]: "case:concept:name",
-            log_format["concept:name"]: "concept:name",
-            log_format["time:timestamp"]: "time:timestamp",
-        },
-    )
-
-    if "start_timestamp" not in log_format or log_format["start_timestamp"] == "":
-        log["start_timestamp"] = log["time:timestamp"].copy()
-    else:
-        log = log.rename(columns={log_format["start_timestamp"]: "start_timestamp"})
+    columns_mapping = {
+        log_format["case:concept:name"]: "case:concept:name",
+        log_format["concept:name"]: "concept:name",
+        log_format["time:timestamp"]: "time:timestamp",
+    }
+    has_start_timestamp = is_column_in_format(log_format, "start_timestamp")
+    has_cost = is_column_in_format(log_format, "cost:total")
+    has_resource = is_column_in_format(log_format, "org:resource")
+    for key, has_column in [
+        ("start_timestamp", has_start_timestamp),
+        ("cost:total", has_cost),
+        ("org:resource", has_resource),
+    ]:
+        if has_column:
+            columns_mapping[log_format[key]] = key
 
-    if "cost:total" not in log_format or log_format["cost:total"] == "":
-        log["cost:total"] = 0
-    else:
-        log = log.rename(columns={log_format["cost:total"]: "cost:total"})
+    log = log.rename(columns=columns_mapping, copy=False) if zero_copy else log.rename(columns=columns_mapping)
 
-    if "org:resource" not in log_format or log_format["org:resource"] == "":
-        log["org:resoure"] = ""
-    else:
-        log = log.rename(columns={log_format["org:resource"]: "org:resource"})
+    log["time:timestamp"] = parse_timestamps(log["time:timestamp"], timestamp_format)
+    if has_start_timestamp:
+        log["start_timestamp"] = parse_timestamps(log["start_timestamp"], timestamp_format)
+    elif not zero_copy:
+        log["start_timestamp"] = log["time:timestamp"].copy()
 
-    log["time:timestamp"] = pd.to_datetime(log["time:timestamp"], utc=True, format=timestamp_format)
-    log["start_timestamp"] = pd.to_datetime(log["start_timestamp"], utc=True, format=timestamp_format)
+    if not zero_copy:
+        if not has_cost:
+            log["cost:total"] = 0
+        if not has_resource:
+            log["org:resoure"] = ""
+        log["case:concept:name"] = log["case:concept:name"].astype(str)
+        return log
 
-    log["case:concept:name"] = log["case:concept:name"].astype(str)
+    log["case:concept:name"] = categorical_with_string_categories(log["case:concept:name"])
+    log["concept:name"] = categorical_with_string_categories(log["concept:name"])
     return log
+
+
+def is_column_in_format(log_format: dict, key: str) -> bool:
+    return key in log_format and log_format[key] != ""
+
+
+def parse_timestamps(timestamps: pd.Series, timestamp_format: str | None) -> pd.Series:
+    if isinstance(timestamps.dtype, pd.DatetimeTZDtype) and str(timestamps.dtype.tz) == "UTC":
+        return timestamps
+    return pd.to_datetime(timestamps, utc=True, format=timestamp_format)
+
+
+def categorical_with_string_categories(column: pd.Series) -> pd.Series:
+    categorical_column = column if isinstance(column.dtype, pd.CategoricalDtype) else column.astype("category")
+    if categorical_column.cat.categories.inferred_type == "string":
+        return categorical_column
+    return categorical_column.cat.rename_categories(categorical_column.cat.categories.astype(str))
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
-from tqdm import tqdm
+
+from mddrt.utils.progress import track_progress
 
 if TYPE_CHECKING:
     from time import timedelta
 
+    from mddrt.utils.progress import Progress
+
 
 class ManualLogGrouping:
     def __init__(
@@ -19,6 +25,8 @@ class ManualLogGrouping:
         activity_id_key: str = "concept:name",
         start_timestamp_key: str | None = "start_timestamp",
         timestamp_key: str = "time:timestamp",
+        progress: Progress = "tqdm",
+        validate: bool = True,
     ) -> None:
         self.log: pd.DataFrame = log
         self.activities_to_group: list[str] = activities_to_group
@@ -27,35 +35,32 @@ class ManualLogGrouping:
         self.activity_id_key: str = activity_id_key
         self.start_timestamp_key: str | None = start_timestamp_key
         self.timestamp_key: str = timestamp_key
+        self.progress: Progress = progress
         self.log_columns: pd.Index[str] = self.log.columns
         self.activities_left_to_be_grouped: set[str] = activities_to_group.copy()
         self.grouped_log: dict = {}
         self.actual_activities_index: int = 0
         self.actual_activities_grouping_index: int = 0
-        self.validate_activities_to_group()
+        if validate:
+            self.validate_activities_to_group()
         self.group()
 
     def set_group_name(self, group_name: str | None, activities_to_group: list[str]) -> str:
         return group_name if group_name else "[" + ",<br/>".join(activities_to_group) + "]"
 
     def validate_activities_to_group(self) -> None | ValueError:
-        unique_activities_names = set(self.log[self.activity_id_key].unique())
-        diff_between_sets = set(self.activities_to_group) - unique_activities_names
-        has_duplicated = len(self.activities_to_group) != len(set(self.activities_to_group))
-        if len(diff_between_sets) != 0:
-            error_message = f"Activities to group: {diff_between_sets} are not in log activity names or activities to group is empty."
-            raise ValueError(error_message)
-        if has_duplicated:
-            error_message = "Activities to group has duplicated elements. Keep only one occurrence of activity name."
-            raise ValueError(error_message)
+        check_activities_to_group(self.log, self.activities_to_group, self.activity_id_key)
 
     def group(self) -> None:
-        cases_grouped_by_id = self.log.groupby(self.case_id_key, dropna=True, sort=False)
-        print("Manual log grouping:")
-        for _, actual_case in tqdm(cases_grouped_by_id):
+        cases_grouped_by_id = self.log.groupby(self.case_id_key, dropna=True, sort=False, observed=True)
+        tracked_cases = track_progress(
+            cases_grouped_by_id, cases_grouped_by_id.ngroups, "Manual log grouping", self.progress
+        )
+        for _, actual_case in tracked_cases:
             self.iterate_case_rows(actual_case)
 
     def iterate_case_rows(self, df: pd.DataFrame) -> None:
+        self.reset_activities_left_to_be_grouped()
         for _, row in df.iterrows():
             if self.is_activities_left_to_be_grouped_empty():
                 self.reset_activities_left_to_be_grouped()
@@ -143,6 +148,20 @@ class ManualLogGrouping:
         return pd.DataFrame.from_dict(self.grouped_log, orient="index")
 
 
+def check_activities_to_group(log: pd.DataFrame, activities_to_group: list[str], activity_id_key: str) -> None:
+    unique_activities_names = set(log[activity_id_key].unique())
+    diff_between_sets = set(activities_to_group) - unique_activities_names
+    has_duplicated = len(activities_to_group) != len(set(activities_to_group))
+    if len(diff_between_sets) != 0:
+        error_message = (
+            f"Activities to group: {diff_between_sets} are not in log activity names or activities to group is empty."
+        )
+        raise ValueError(error_message)
+    if has_duplicated:
+        error_message = "Activities to group has duplicated elements. Keep only one occurrence of activity name."
+        raise ValueError(error_message)
+
+
 def manual_log_grouping(
     log: pd.DataFrame,
     activities_to_group: list[str],
@@ -151,6 +170,8 @@ def manual_log_grouping(
     activity_id_key: str = "concept:name",
     start_timestamp_key: str | None = "start_timestamp",
     timestamp_key: str = "time:timestamp",
+    progress: Progress = "tqdm",
+    n_jobs: int = 1,
 ) -> pd.DataFrame:
     """
     Groups specified activities in a process log into a single activity group.
@@ -172,12 +193,85 @@ def manual_log_grouping(
             timestamp of the events. Can be None if not available. Defaults to "start_timestamp".
         timestamp_key (str, optional): The key in the DataFrame representing the event timestamp.
             Defaults to "time:timestamp".
+        progress (Progress, optional): How to report the grouping progress: None for no output, "tqdm" for a
+            progress bar or a callable receiving (description, processed cases, total cases), called once per
+            batch of cases. Defaults to "tqdm".
+        n_jobs (int, optional): Number of processes used to group the log. With more than one process, the log
+            is split into partitions of whole cases that are grouped independently and concatenated back in the
+            original order. Defaults to 1.
 
     Returns:
         pd.DataFrame: A new DataFrame with the grouped activities, keeping the original structure
         of the log but modifying the activities defined in `activities_to_group`.
     """
+    if n_jobs > 1:
+        return parallel_manual_log_grouping(
+            log,
+            activities_to_group,
+            group_name,
+            case_id_key,
+            activity_id_key,
+            start_timestamp_key,
+            timestamp_key,
+            progress,
+            n_jobs,
+        )
     manual_log_grouping = ManualLogGrouping(
-        log, activities_to_group, group_name, case_id_key, activity_id_key, start_timestamp_key, timestamp_key
+        log,
+        activities_to_group,
+        group_name,
+        case_id_key,
+        activity_id_key,
+        start_timestamp_key,
+        timestamp_key,
+        progress,
     )
     return manual_log_grouping.get_grouped_log()
+
+
+def parallel_manual_log_grouping(
+    log: pd.DataFrame,
+    activities_to_group: list[str],
+    group_name: str | None,
+    case_id_key: str,
+    activity_id_key: str,
+    start_timestamp_key: str | None,
+    timestamp_key: str,
+    progress: Progress,
+    n_jobs: int,
+) -> pd.DataFrame:
+    check_activities_to_group(log, activities_to_group, activity_id_key)
+    log_partitions = split_log_by_cases(log, case_id_key, n_jobs * 4)
+    group_partition = partial(
+        group_log_partition,
+        activities_to_group=activities_to_group,
+        group_name=group_name,
+        case_id_key=case_id_key,
+        activity_id_key=activity_id_key,
+        start_timestamp_key=start_timestamp_key,
+        timestamp_key=timestamp_key,
+    )
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        grouped_partitions = list(
+            track_progress(
+                executor.map(group_partition, log_partitions),
+                len(log_partitions),
+                "Manual log grouping partitions",
+                progress,
+            )
+        )
+    grouped_log = pd.concat(grouped_partitions)
+    grouped_log.index = [str(index) for index in range(len(grouped_log))]
+    return grouped_log
+
+
+def split_log_by_cases(log: pd.DataFrame, case_id_key: str, partitions: int) -> list[pd.DataFrame]:
+    case_codes, case_ids = pd.factorize(log[case_id_key])
+    partitions = max(1, min(partitions, len(case_ids)))
+    event_partitions = np.where(case_codes >= 0, case_codes * partitions // max(1, len(case_ids)), -1)
+    return [log[event_partitions == partition] for partition in range(partitions)]
+
+
+def group_log_partition(log_partition: pd.DataFrame, **grouping_kwargs) -> pd.DataFrame:
+    manual_log_grouping = ManualLogGrouping(log_partition, **grouping_kwargs, progress=None, validate=False)
+    return manual_log_grouping.get_grouped_log()
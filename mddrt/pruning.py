@@ -39,7 +39,23 @@ def prune_log_based_on_top_variants(
         timestamp_key (str, optional): The key for timestamps in the event log. Defaults to "time:timestamp".
         case_id_key (str, optional): The key for case IDs in the event log. Defaults to "case:concept:name".
 
+    Zero-copy logs (see `log_formatter`) store the case id and activity columns as categoricals, which pm4py
+    does not accept. Their variants are filtered on a copy of these columns cast to strings, and the pruned
+    log keeps the categorical columns.
+
     Returns:
         pd.DataFrame: The pruned event log containing only the top k variants.
     """
-    return pm4py.filter_variants_top_k(log, k, activity_key, timestamp_key, case_id_key)
+    if not any(isinstance(log[key].dtype, pd.CategoricalDtype) for key in (case_id_key, activity_key)):
+        return pm4py.filter_variants_top_k(log, k, activity_key, timestamp_key, case_id_key)
+
+    variants_log = pd.DataFrame(
+        {
+            case_id_key: log[case_id_key].astype(str),
+            activity_key: log[activity_key].astype(str),
+            timestamp_key: log[timestamp_key],
+        }
+    )
+    pruned_variants_log = pm4py.filter_variants_top_k(variants_log, k, activity_key, timestamp_key, case_id_key)
+    is_case_kept = log[case_id_key].astype(str).isin(pruned_variants_log[case_id_key].unique())
+    return log[is_case_kept.to_numpy()]
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from itertools import count
+
+from mddrt.tree_merge import merge_nodes_data
+from mddrt.tree_node import TreeNode
+from mddrt.tree_query import copy_node
+
+
+def collapse_low_frequency_branches(tree: TreeNode, max_nodes: int, max_depth: int | None = None) -> TreeNode:
+    """
+    Reduces a DRT to its most frequent nodes, to render trees too large for Graphviz.
+
+    Nodes are selected best-first by frequency with a priority queue, starting from the root and only
+    considering children of already selected nodes, so every selected node keeps its path to the root and
+    the nodes of lazy trees are only materialized when their parent is selected. The children of a selected
+    node that are not selected are collapsed into one "+N more" node, whose data aggregates the collapsed
+    branches. The original tree is not modified.
+
+    Args:
+        tree (TreeNode): The root of the tree.
+        max_nodes (int): Maximum number of nodes of the tree to keep, root included. Aggregated nodes are added
+            on top of them, at most one per kept node.
+        max_depth (int | None, optional): Number of activity levels to consider below the root, or None to
+            consider the whole tree. Defaults to None.
+
+    Raises:
+        ValueError: If `max_nodes` is lower than 1.
+
+    Returns:
+        TreeNode: The root of the reduced tree.
+    """
+    if max_nodes < 1:
+        error_message = "Max nodes should be at least 1."
+        raise ValueError(error_message)
+
+    def visible_children(node: TreeNode) -> list[TreeNode]:
+        if max_depth is not None and node.depth - tree.depth >= max_depth:
+            return []
+        return node.children
+
+    selected_nodes = {id(tree)}
+    candidates = []
+    insertion_order = count()
+    for child in visible_children(tree):
+        heapq.heappush(candidates, (-child.frequency, next(insertion_order), child))
+    while candidates and len(selected_nodes) < max_nodes:
+        _, _, node = heapq.heappop(candidates)
+        selected_nodes.add(id(node))
+        for child in visible_children(node):
+            heapq.heappush(candidates, (-child.frequency, next(insertion_order), child))
+
+    node_ids = count()
+    reduced_tree = copy_node(tree)
+    reduced_tree.id = next(node_ids)
+    queue = deque([(tree, reduced_tree)])
+    while queue:
+        node, reduced_node = queue.popleft()
+        collapsed_children = []
+        for child in visible_children(node):
+            if id(child) not in selected_nodes:
+                collapsed_children.append(child)
+                continue
+            reduced_child = copy_node(child)
+            reduced_child.id = next(node_ids)
+            reduced_child.set_parent(reduced_node)
+            reduced_node.add_children(reduced_child)
+            queue.append((child, reduced_child))
+        if collapsed_children:
+            # A node without an activity code, so its name is a plain label and not added to the alphabet
+            aggregated_node = TreeNode(
+                f"+{len(collapsed_children)} more", collapsed_children[0].depth, tree.alphabet, next(node_ids)
+            )
+            merge_nodes_data(aggregated_node, collapsed_children)
+            aggregated_node.set_parent(reduced_node)
+            reduced_node.add_children(aggregated_node)
+
+    return reduced_tree
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from mddrt.case_attribute_index import IndexedCasesBuilder, SelectedCasesTreeBuilder
+from mddrt.drt_parameters import DirectlyRootedTreeParameters
+from mddrt.tree_merge import merge_trees
+from mddrt.utils.progress import track_progress
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from mddrt.tree_node import TreeNode
+    from mddrt.utils.progress import Progress
+
+
+class TimeWindowedDRT:
+    def __init__(
+        self,
+        log: pd.DataFrame,
+        freq: str = "W",
+        calculate_time: bool = True,
+        calculate_cost: bool = True,
+        calculate_quality: bool = True,
+        calculate_flexibility: bool = True,
+        calculate_quantiles: bool = False,
+        case_id_key: str = "case:concept:name",
+        activity_key: str = "concept:name",
+        timestamp_key: str = "time:timestamp",
+        start_timestamp_key: str = "start_timestamp",
+        cost_key: str = "cost:total",
+        progress: Progress = "tqdm",
+    ) -> None:
+        """
+        DRTs of time windows of a log, built by merging the trees of the buckets of the window.
+
+        Cases are partitioned in buckets by the period of their completion time, and the tree of each bucket is
+        built once. The tree of a window of consecutive buckets is the merge of the bucket trees, so all the rolling
+        windows of a log cost about one full build plus the merges. Optional activities are the ones of the whole
+        log, so the flexibility of a window can differ from the one of a tree discovered from the window's cases.
+
+        Args:
+            log (pd.DataFrame): The event log.
+            freq (str, optional): Pandas period frequency of the buckets, e.g. "D", "W" or "M". Defaults to "W".
+            calculate_time (bool, optional): Whether to include the time dimension in the trees. Defaults to True.
+            calculate_cost (bool, optional): Whether to include the cost dimension in the trees. Defaults to True.
+            calculate_quality (bool, optional): Whether to include the quality dimension in the trees.
+                Defaults to True.
+            calculate_flexibility (bool, optional): Whether to include the flexibility dimension in the trees.
+                Defaults to True.
+            calculate_quantiles (bool, optional): Whether to keep quantile sketches in the tree nodes.
+                Defaults to False.
+            case_id_key (str, optional): The key for case IDs in the event log. Defaults to "case:concept:name".
+            activity_key (str, optional): The key for activity names in the event log. Defaults to "concept:name".
+            timestamp_key (str, optional): The key for timestamps in the event log. Defaults to "time:timestamp".
+            start_timestamp_key (str, optional): The key for start timestamps in the event log.
+                Defaults to "start_timestamp".
+            cost_key (str, optional): The key for cost information in the event log. Defaults to "cost:total".
+            progress (Progress, optional): How to report the progress of building the cases and the bucket trees.
+                Defaults to "tqdm".
+        """
+        params = DirectlyRootedTreeParameters(
+            case_id_key,
+            activity_key,
+            timestamp_key,
+            start_timestamp_key,
+            cost_key,
+            calculate_time,
+            calculate_cost,
+            calculate_quality,
+            calculate_flexibility,
+            calculate_quantiles,
+        )
+        cases_builder = IndexedCasesBuilder(log, params, progress=progress)
+        cases_completion = log.groupby(case_id_key, sort=False, observed=True)[timestamp_key].max()
+        if cases_completion.dt.tz is not None:
+            cases_completion = cases_completion.dt.tz_convert(None)
+        cases_buckets = cases_completion.dt.to_period(freq).reindex(list(cases_builder.cases))
+
+        bucket_case_ids: dict[pd.Period, list] = {}
+        for case_id, bucket in cases_buckets.dropna().items():
+            bucket_case_ids.setdefault(bucket, []).append(case_id)
+        self.freq: str = freq
+        self.buckets: list[pd.Period] = sorted(bucket_case_ids)
+        self.bucket_trees: dict[pd.Period, TreeNode] = {
+            bucket: SelectedCasesTreeBuilder(
+                cases_builder, bucket_case_ids[bucket], progress=None, recompute_optional_activities=False
+            ).get_tree()
+            for bucket in track_progress(self.buckets, len(self.buckets), "Building Bucket Trees", progress)
+        }
+
+    def window(self, start: pd.Period | str, end: pd.Period | str) -> TreeNode:
+        """
+        Gets the DRT of the cases completed between two buckets, both included.
+
+        Args:
+            start (pd.Period | str): The first bucket of the window.
+            end (pd.Period | str): The last bucket of the window.
+
+        Raises:
+            ValueError: If no case is completed in the window.
+
+        Returns:
+            TreeNode: The root of the DRT of the window.
+        """
+        start, end = pd.Period(start, freq=self.freq), pd.Period(end, freq=self.freq)
+        window_trees = [tree for bucket, tree in self.bucket_trees.items() if start <= bucket <= end]
+        if not window_trees:
+            error_message = f"No case is completed between {start} and {end}."
+            raise ValueError(error_message)
+        return merge_trees(window_trees)
+
+    def rolling(self, size: int) -> Iterator[tuple[pd.Period, TreeNode]]:
+        """
+        Iterates the DRTs of the rolling windows of consecutive buckets.
+
+        Args:
+            size (int): Number of buckets of each window, e.g. 4 for 4-week windows of weekly buckets.
+
+        Returns:
+            Iterator[tuple[pd.Period, TreeNode]]: The last bucket and the DRT of each window with cases.
+        """
+        if not self.buckets:
+            return
+        for end in pd.period_range(self.buckets[0] + (size - 1), self.buckets[-1], freq=self.freq):
+            window_trees = [
+                self.bucket_trees[bucket]
+                for bucket in pd.period_range(end - (size - 1), end)
+                if bucket in self.bucket_trees
+            ]
+            if window_trees:
+                yield end, merge_trees(window_trees)
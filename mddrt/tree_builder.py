@@ -1,111 +1,175 @@
 from __future__ import annotations
 
-from datetime import timedelta
+from itertools import accumulate, count
+from operator import add, or_
 from typing import TYPE_CHECKING
 
-from tqdm import tqdm
+import numpy as np
+import pandas as pd
 
 from mddrt.tree_node import TreeNode
-from mddrt.utils.builder import calculate_cases_metrics, dimensions_to_calculate
+from mddrt.utils.activity_alphabet import ActivityAlphabet
+from mddrt.utils.builder import (
+    calculate_cases_metrics,
+    dimensions_to_calculate,
+    durations_to_nanoseconds,
+    optional_activities_mask,
+    resolve_missing_columns,
+    sort_case_events,
+    timestamps_to_nanoseconds,
+)
+from mddrt.utils.misc import tree_size
+from mddrt.utils.profiler import profile_stage
+from mddrt.utils.progress import track_progress
+from mddrt.utils.quantile_sketch import create_quantile_sketches, merge_sketches
+from mddrt.utils.running_stats import merge_running_stats
 
 if TYPE_CHECKING:
-    from collections.abc import Hashable
-
-    import pandas as pd
-    from pandas.core.groupby import DataFrameGroupBy
-
     from mddrt.drt_parameters import DirectlyRootedTreeParameters
+    from mddrt.utils.profiler import DiscoveryProfiler
+    from mddrt.utils.progress import Progress
 
 
 class DirectlyRootedTreeBuilder:
-    def __init__(self, log: pd.DataFrame, params: DirectlyRootedTreeParameters) -> None:
+    def __init__(
+        self,
+        log: pd.DataFrame,
+        params: DirectlyRootedTreeParameters,
+        profiler: DiscoveryProfiler | None = None,
+        progress: Progress = "tqdm",
+        alphabet: ActivityAlphabet | None = None,
+    ) -> None:
         self.log: pd.DataFrame = log
-        self.params: DirectlyRootedTreeParameters = params
-        self.tree: TreeNode = TreeNode(name="root", depth=-1)
+        self.profiler: DiscoveryProfiler | None = profiler
+        self.progress: Progress = progress
+        self.params: DirectlyRootedTreeParameters = resolve_missing_columns(log, params)
+        self.alphabet: ActivityAlphabet = (
+            alphabet if alphabet is not None else ActivityAlphabet.from_column(log[self.params.activity_key])
+        )
+        self.node_ids: count = count()
+        self.tree: TreeNode = TreeNode(name="root", depth=-1, alphabet=self.alphabet, node_id=next(self.node_ids))
         self.cases: dict = {}
+        self.optional_activities: int = 0
         self.dimensions_to_calculate: list[str] = dimensions_to_calculate(params)
         self.build()
 
     def build(self) -> None:
-        cases_grouped_by_id = self.log.groupby(self.params.case_id_key, dropna=True, sort=False)
-        self.build_cases(cases_grouped_by_id)
-        self.build_tree()
-        self.update_root()
-
-    def build_cases(self, cases_grouped_by_id: DataFrameGroupBy) -> None:
+        self.prepare_cases()
+        with profile_stage(self.profiler, "build_tree") as counts:
+            self.build_tree()
+            if self.profiler is not None:
+                counts.update(cases=len(self.cases), nodes=self.tree_size())
+        with profile_stage(self.profiler, "update_root"):
+            self.update_root()
+
+    def prepare_cases(self) -> None:
+        with profile_stage(self.profiler, "calculate_cases_metrics") as counts:
+            cases_metrics = calculate_cases_metrics(self.log, self.params)
+            counts.update(events=len(self.log), cases=len(cases_metrics))
+        with profile_stage(self.profiler, "build_cases") as counts:
+            self.build_cases(cases_metrics)
+            counts.update(events=len(self.log), cases=len(self.cases))
+
+    def build_cases(self, cases_metrics: pd.DataFrame) -> None:
         cases = {}
-        cases_metrics = calculate_cases_metrics(self.log, self.params)
-        print("Building Tree Cases:")
-        for case in tqdm(cases_grouped_by_id):
-            case_id = case[0]
-            cases[case_id] = {}
-            case_activities = self.build_case_activities(case)
-            case_metrics = cases_metrics.loc[cases_metrics["Case Id"] == case_id].iloc[0]
-            cases[case_id]["activities"] = case_activities
-            metrics_mapping = {"cost": "Cost", "time": "Duration", "flexibility": "Optionality", "quality": "Rework"}
-            for dimension in self.dimensions_to_calculate:
-                if dimension == "time":
-                    cases[case_id][dimension] = case_metrics[metrics_mapping[dimension]].to_pytimedelta()
-                else:
-                    cases[case_id][dimension] = case_metrics[metrics_mapping[dimension]]
+        cases_metrics = cases_metrics.set_index("Case Id")
+        case_codes, case_ids = pd.factorize(self.log[self.params.case_id_key])
+        start_timestamps = timestamps_to_nanoseconds(self.log[self.params.start_timestamp_key])
+        events_order = sort_case_events(case_codes, start_timestamps)
+        case_bounds = np.flatnonzero(np.diff(case_codes[events_order])) + 1
+        events_data = self.build_events_data(events_order, case_bounds, start_timestamps)
+        cases_metrics = cases_metrics.reindex(list(case_ids))
+        cases_dimensions = {
+            dimension: self.build_case_dimension_values(cases_metrics, dimension)
+            for dimension in self.dimensions_to_calculate
+        }
 
+        tracked_case_ids = track_progress(case_ids, len(case_ids), "Building Tree Cases", self.progress)
+        for position, case_id in enumerate(tracked_case_ids):
+            case = {name: data[position].tolist() for name, data in events_data.items()}
+            if self.params.calculate_quality or self.params.calculate_flexibility:
+                case["activity_sets"] = list(accumulate((1 << activity for activity in case["activities"]), or_))
+            if self.params.calculate_cost:
+                case["accumulated_costs"] = list(accumulate(case["costs"]))
+            if self.params.calculate_time:
+                lead_times = map(add, case["service_times"], case["waiting_times"])
+                case["accumulated_lead_times"] = list(accumulate(lead_times))
+            for dimension, values in cases_dimensions.items():
+                case[dimension] = values[position]
+            cases[case_id] = case
+
+        if self.params.calculate_flexibility:
+            self.optional_activities = optional_activities_mask(case["activity_sets"][-1] for case in cases.values())
+            for case in cases.values():
+                case["optional_activities"] = self.optional_activities
         self.cases = cases
 
-    def build_case_activities(self, case: tuple[Hashable, pd.DataFrame]) -> list[dict[str, any]]:
-        case_df = case[1].sort_values(by=[self.params.timestamp_key])
-        case_df = case[1].sort_values(by=[self.params.start_timestamp_key])
-        return [self.build_activity_dict(case_df, i) for i in range(len(case_df))]
-
-    def build_activity_dict(self, case_df: pd.DataFrame, index: int) -> dict[str, any]:
-        actual_activity = case_df.iloc[index]
-        activity_dict = {
-            "name": actual_activity[self.params.activity_key],
-        }
+    def build_case_dimension_values(self, cases_metrics: pd.DataFrame, dimension: str) -> list[int | float]:
+        metrics_mapping = {"cost": "Cost", "time": "Duration", "flexibility": "Optionality", "quality": "Rework"}
+        values = cases_metrics[metrics_mapping[dimension]]
+        if dimension == "time":
+            return durations_to_nanoseconds(values).tolist()
+        return values.tolist()
+
+    def build_events_data(
+        self,
+        events_order: np.ndarray,
+        case_bounds: np.ndarray,
+        start_timestamps: np.ndarray,
+    ) -> dict[str, list[np.ndarray]]:
+        activities = self.alphabet.encode_column(self.log[self.params.activity_key])
+        events_data = {"activities": activities[events_order]}
         if self.params.calculate_cost:
-            activity_dict["cost"] = actual_activity[self.params.cost_key]
+            if self.params.cost_key in self.log.columns:
+                events_data["costs"] = self.log[self.params.cost_key].to_numpy()[events_order]
+            else:
+                events_data["costs"] = np.zeros(len(events_order), dtype=int)
         if self.params.calculate_time:
-            activity_dict.update(self.calculate_time_data(case_df, index))
-        return activity_dict
-
-    def calculate_time_data(self, case_df: pd.DataFrame, index: int) -> dict[str, timedelta]:
-        actual_activity = case_df.iloc[index]
-        service_time = (
-            actual_activity[self.params.timestamp_key] - actual_activity[self.params.start_timestamp_key]
-        ).to_pytimedelta()
-
-        prev_activity = case_df.iloc[index - 1] if index > 0 else None
-        waiting_time = (
-            (
-                actual_activity[self.params.start_timestamp_key] - prev_activity[self.params.timestamp_key]
-            ).to_pytimedelta()
-            if prev_activity is not None
-            else timedelta(0)
-        )
-        return {"service_time": service_time, "waiting_time": waiting_time}
+            events_data.update(self.calculate_time_data(events_order, case_bounds, start_timestamps))
+        return {name: np.split(data, case_bounds) for name, data in events_data.items()}
+
+    def calculate_time_data(
+        self,
+        events_order: np.ndarray,
+        case_bounds: np.ndarray,
+        start_timestamps: np.ndarray,
+    ) -> dict[str, np.ndarray]:
+        start_timestamps = start_timestamps[events_order]
+        complete_timestamps = timestamps_to_nanoseconds(self.log[self.params.timestamp_key])[events_order]
+        service_times = complete_timestamps - start_timestamps
+        waiting_times = np.zeros_like(start_timestamps)
+        waiting_times[1:] = start_timestamps[1:] - complete_timestamps[:-1]
+        waiting_times[case_bounds] = 0
+        return {"service_times": service_times, "waiting_times": waiting_times}
 
     def build_tree(self) -> None:
         root = self.tree
-        print("Building Tree Graph:")
-        for current_case in tqdm(self.cases.values()):
+        tracked_cases = track_progress(self.cases.values(), len(self.cases), "Building Tree Graph", self.progress)
+        for current_case in tracked_cases:
             self.add_case_to_tree(root, current_case)
         self.tree = root
 
     def add_case_to_tree(self, root: TreeNode, current_case: dict) -> None:
         parent_node = root
         for depth, activity in enumerate(current_case["activities"]):
-            current_node = self.get_or_create_node(parent_node, activity["name"], depth)
+            current_node = self.get_or_create_node(parent_node, activity, depth)
             current_node.update_frequency()
             self.update_node_dimensions(current_node, depth, current_case)
             parent_node = current_node
 
-    def get_or_create_node(self, parent_node: TreeNode, activity_name: str, depth: int) -> TreeNode:
-        current_node = parent_node.get_child_by_name_and_depth(activity_name, depth)
+    def get_or_create_node(self, parent_node: TreeNode, activity: int, depth: int) -> TreeNode:
+        current_node = parent_node.get_child_by_activity_and_depth(activity, depth)
         if not current_node:
-            current_node = TreeNode(activity_name, depth)
-            current_node.set_parent(parent_node)
-            parent_node.add_children(current_node)
+            current_node = TreeNode(self.alphabet.decode(activity), depth, self.alphabet, next(self.node_ids), activity)
+            self.attach_node(parent_node, current_node)
         return current_node
 
+    def attach_node(self, parent_node: TreeNode, node: TreeNode) -> None:
+        node.set_parent(parent_node)
+        parent_node.add_children(node)
+        if self.params.calculate_quantiles:
+            node.quantile_sketches = create_quantile_sketches(self.dimensions_to_calculate)
+
     def update_node_dimensions(self, node: TreeNode, depth: int, current_case: dict) -> None:
         for dimension in self.dimensions_to_calculate:
             node.update_dimension(dimension, depth, current_case)
@@ -117,18 +181,21 @@ class DirectlyRootedTreeBuilder:
                 self.update_root_time_dimension()
             else:
                 self.update_root_cost_flexibility_quality_dimension(dimension)
+            self.tree.running_stats[dimension] = merge_running_stats(
+                node.running_stats[dimension] for node in self.tree.children
+            )
+        if self.params.calculate_quantiles:
+            self.update_root_quantile_sketches()
 
     def update_root_frequency(self) -> None:
         self.tree.frequency = sum(node.frequency for node in self.tree.children)
 
     def update_root_time_dimension(self) -> None:
         self.tree.dimensions_data["time"]["lead"] = sum(
-            [node.dimensions_data["time"]["lead"] for node in self.tree.children],
-            timedelta(),
+            node.dimensions_data["time"]["lead"] for node in self.tree.children
         )
         self.tree.dimensions_data["time"]["lead_case"] = sum(
-            [node.dimensions_data["time"]["lead_case"] for node in self.tree.children],
-            timedelta(),
+            node.dimensions_data["time"]["lead_case"] for node in self.tree.children
         )
         self.tree.dimensions_data["time"]["max"] = max(
             node.dimensions_data["time"]["max"] for node in self.tree.children
@@ -153,6 +220,18 @@ class DirectlyRootedTreeBuilder:
         )
         self.tree.dimensions_data[dimension]["remainder"] = self.tree.dimensions_data[dimension]["total_case"]
 
+    def update_root_quantile_sketches(self) -> None:
+        self.tree.quantile_sketches = {
+            dimension: {
+                metric: merge_sketches(node.quantile_sketches[dimension][metric] for node in self.tree.children)
+                for metric in sketches
+            }
+            for dimension, sketches in create_quantile_sketches(self.dimensions_to_calculate).items()
+        }
+
+    def tree_size(self) -> int:
+        return tree_size(self.tree)
+
     def get_tree(self) -> TreeNode:
         if not self.tree:
             msg = "Tree not built yet."
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Callable, Literal
 
 import graphviz
 
+from mddrt.render_budget import collapse_low_frequency_branches
 from mddrt.utils.constants import (
     GRAPHVIZ_ACTIVITY,
     GRAPHVIZ_ACTIVITY_DATA,
@@ -12,12 +13,16 @@ from mddrt.utils.constants import (
     GRAPHVIZ_STATE_NODE_ROW,
 )
 from mddrt.utils.diagrammer import (
-    background_color,
+    ColorScale,
     dimensions_min_and_max,
     dimensions_to_diagram,
-    format_time,
+    escape_activity_name,
+    format_dimension_value,
+    is_quantile_measure,
     link_width,
+    split_label_lines,
 )
+from mddrt.utils.misc import nanoseconds_to_timedelta
 
 if TYPE_CHECKING:
     from datetime import timedelta
@@ -49,10 +54,15 @@ class DirectlyRootedTreeDiagrammer:
         visualize_quality: bool = True,
         visualize_flexibility: bool = True,
         node_measures: list[Literal["total", "consumed", "remaining"]] = ["total"],
-        arc_measures: list[Literal["avg", "min", "max"]] = [],
+        arc_measures: list[Literal["avg", "min", "max", "std", "p50", "p95"]] = [],
         rankdir: str = "TB",
+        max_depth: int | None = None,
+        max_nodes: int | None = None,
+        precomputed_min_and_max: dict[str, list[int]] | None = None,
     ) -> None:
-        self.tree_root = tree_root
+        self.tree_root = (
+            collapse_low_frequency_branches(tree_root, max_nodes, max_depth) if max_nodes is not None else tree_root
+        )
         self.dimensions_to_diagram = dimensions_to_diagram(
             visualize_time,
             visualize_cost,
@@ -62,8 +72,17 @@ class DirectlyRootedTreeDiagrammer:
         self.node_measures = node_measures if node_measures != [] else ["total"]
         self.arc_measures = arc_measures
         self.rankdir = rankdir
+        self.max_depth = max_depth
         self.diagram = graphviz.Digraph("mddrt", comment="Multi-Dimensional Directed Rooted Tree")
-        self.dimensions_min_and_max = dimensions_min_and_max(self.tree_root)
+        self.dimensions_min_and_max = (
+            precomputed_min_and_max
+            if precomputed_min_and_max is not None
+            else dimensions_min_and_max(self.tree_root, self.max_depth)
+        )
+        self.color_scales = {
+            dimension: ColorScale(dimension, self.dimensions_min_and_max[dimension])
+            for dimension in self.dimensions_to_diagram
+        }
         self.build_diagram()
 
     def build_diagram(self) -> None:
@@ -77,9 +96,14 @@ class DirectlyRootedTreeDiagrammer:
         while queue:
             current_node = queue.popleft()
             diagram_routine(current_node)
-            for child in current_node.children:
+            for child in self.diagram_children(current_node):
                 queue.append(child)
 
+    def diagram_children(self, node: TreeNode) -> list[TreeNode]:
+        if self.max_depth is not None and node.depth - self.tree_root.depth >= self.max_depth:
+            return []
+        return node.children
+
     def build_node(self, node: TreeNode) -> None:
         state_label = self.build_state_label(node)
         self.diagram.node(str(node.id), label=f"<{state_label}>", shape="none")
@@ -95,47 +119,43 @@ class DirectlyRootedTreeDiagrammer:
         dimension: Literal["cost", "time", "flexibility", "quality"],
         node: TreeNode,
     ) -> str:
-        avg_total_case = (
-            self.format_value("total_case", dimension, node)
-            if dimension != "time"
-            else self.format_value("lead_case", dimension, node)
-        )
-        avg_consumed = (
-            self.format_value("accumulated", dimension, node)
-            if dimension != "time"
-            else self.format_value("lead_accumulated", dimension, node)
-        )
-        avg_remaining = (
-            self.format_value("remainder", dimension, node)
-            if dimension != "time"
-            else self.format_value("lead_remainder", dimension, node)
-        )
+        bg_color, dimension_row = self.build_state_row_content(dimension, node)
+        return GRAPHVIZ_STATE_NODE_ROW.format(bg_color, dimension_row)
+
+    def build_state_row_content(
+        self,
+        dimension: Literal["cost", "time", "flexibility", "quality"],
+        node: TreeNode,
+    ) -> tuple[str, str]:
         dimension_row = f"{dimension.capitalize()}<br/>"
         dimension_row += (
-            f"Avg. {self.build_dimension_row_string(dimension, 'total')}: {avg_total_case}<br/>"
+            f"Avg. {self.build_dimension_row_string(dimension, 'total')}: "
+            f"{self.format_value('total_case' if dimension != 'time' else 'lead_case', dimension, node)}<br/>"
             if "total" in self.node_measures
             else ""
         )
         dimension_row += (
-            f"Avg. {self.build_dimension_row_string(dimension, 'consumed')}: {avg_consumed}<br/>"
+            f"Avg. {self.build_dimension_row_string(dimension, 'consumed')}: "
+            f"{self.format_value('accumulated' if dimension != 'time' else 'lead_accumulated', dimension, node)}<br/>"
             if "consumed" in self.node_measures
             else ""
         )
         dimension_row += (
-            f"Avg. {self.build_dimension_row_string(dimension, 'remaining')}: {avg_remaining}<br/>"
+            f"Avg. {self.build_dimension_row_string(dimension, 'remaining')}: "
+            f"{self.format_value('remainder' if dimension != 'time' else 'lead_remainder', dimension, node)}<br/>"
             if "remaining" in self.node_measures
             else ""
         )
         data = node.dimensions_data[dimension]
-        bg_color = background_color(
-            (data["total_case"] if dimension != "time" else data["lead_case"]) / node.frequency,
-            dimension,
-            self.dimensions_min_and_max[dimension],
+        bg_color = self.color_scales[dimension].color(
+            data["total_case"] / node.frequency
+            if dimension != "time"
+            else nanoseconds_to_timedelta(data["lead_case"]) / node.frequency,
         )
-        return GRAPHVIZ_STATE_NODE_ROW.format(bg_color, dimension_row)
+        return bg_color, dimension_row
 
     def build_links(self, node: TreeNode) -> None:
-        for child in node.children:
+        for child in self.diagram_children(node):
             link_label = self.build_link_label(child)
             penwidth = link_width(child.frequency, self.dimensions_min_and_max["frequency"])
             self.diagram.edge(
@@ -159,6 +179,13 @@ class DirectlyRootedTreeDiagrammer:
     ) -> str:
         if len(self.arc_measures) == 0:
             return " "
+        return GRAPHVIZ_ACTIVITY_DATA.format(self.build_link_row_content(dimension, node))
+
+    def build_link_row_content(
+        self,
+        dimension: Literal["cost", "time", "flexibility", "quality"],
+        node: TreeNode,
+    ) -> str:
         avg_total = (
             self.format_value("total", dimension, node)
             if dimension != "time"
@@ -170,7 +197,44 @@ class DirectlyRootedTreeDiagrammer:
         link_row += f"Avg: {avg_total}<br/>" if "avg" in self.arc_measures else ""
         link_row += f"Max: {maximum}<br/>" if "max" in self.arc_measures else ""
         link_row += f"Min: {minimum}<br/>" if "min" in self.arc_measures else ""
-        return GRAPHVIZ_ACTIVITY_DATA.format(link_row)
+        link_row += f"Std: {self.format_std(dimension, node)}<br/>" if "std" in self.arc_measures else ""
+        link_row += self.build_quantiles_link_string(dimension, node)
+        return link_row
+
+    def build_plain_labels(self, node: TreeNode) -> tuple[list[tuple[str, list[str]]], list[str]]:
+        state_rows = []
+        for dimension in self.dimensions_to_diagram:
+            bg_color, dimension_row = self.build_state_row_content(dimension, node)
+            state_rows.append((bg_color, split_label_lines(dimension_row)))
+        link_lines = [f"{node.name} ({node.frequency})"]
+        if len(self.arc_measures) > 0:
+            for dimension in self.dimensions_to_diagram:
+                link_lines.extend(split_label_lines(self.build_link_row_content(dimension, node)))
+        return state_rows, link_lines
+
+    def format_std(self, dimension: Literal["cost", "time", "flexibility", "quality"], node: TreeNode) -> str:
+        std = node.running_stats[dimension].std
+        if dimension == "time":
+            std = nanoseconds_to_timedelta(round(std))
+        return self.format_by_dimension(std, dimension)
+
+    def build_quantiles_link_string(
+        self,
+        dimension: Literal["cost", "time", "flexibility", "quality"],
+        node: TreeNode,
+    ) -> str:
+        metric = "service" if dimension == "time" else "total"
+        quantiles_row = ""
+        for measure in self.arc_measures:
+            if not is_quantile_measure(measure):
+                continue
+            value = node.get_quantile(dimension, metric, int(measure[1:]) / 100)
+            if value is None:
+                continue
+            if dimension == "time":
+                value = nanoseconds_to_timedelta(int(value))
+            quantiles_row += f"{measure.upper()}: {self.format_by_dimension(value, dimension)}<br/>"
+        return quantiles_row
 
     def format_value(
         self,
@@ -182,29 +246,18 @@ class DirectlyRootedTreeDiagrammer:
         return self.format_by_dimension(value, dimension)
 
     def get_dimension_metric_value(self, node: TreeNode, metric: METRIC, dimension: str) -> int | float | timedelta:
+        value = node.dimensions_data[dimension][metric]
+        if dimension == "time":
+            value = nanoseconds_to_timedelta(value)
         if metric in ["max", "min"]:
-            return node.dimensions_data[dimension][metric]
-        return node.dimensions_data[dimension][metric] / node.frequency
+            return value
+        return value / node.frequency
 
     def format_by_dimension(self, value: float | timedelta, dimension: str) -> str:
-        if dimension == "time":
-            return format_time(value)
-        if dimension == "cost":
-            return f"{abs(round(value,2))} USD"
-        return str(abs(round(value, 2)))
+        return format_dimension_value(value, dimension)
 
     def build_activity_link_name(self, node: TreeNode):
-        node_name = node.name
-        if "&" in node_name:
-            node_name = node_name.replace("&", "&amp;")
-        if "<" in node_name:
-            node_name = node_name.replace("<", "&lt")
-        if ">" in node_name:
-            node_name = node_name.replace(">", "&gt")
-        if "=" in node_name:
-            node_name = node_name.replace("=", "&#61;")
-
-        return f"{node_name} ({node.frequency})"
+        return f"{escape_activity_name(node.name)} ({node.frequency})"
 
     def build_dimension_row_string(self, dimension: str, metric: str) -> str:
         metric_string_mapper = {
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Literal
+
+import graphviz
+
+from mddrt.utils.color_schemes import COST_COLOR_SCHEME, TIME_COLOR_SCHEME
+from mddrt.utils.constants import (
+    GRAPHVIZ_ACTIVITY,
+    GRAPHVIZ_ACTIVITY_DATA,
+    GRAPHVIZ_STATE_NODE,
+    GRAPHVIZ_STATE_NODE_ROW,
+)
+from mddrt.utils.diagrammer import (
+    color_scheme_index,
+    dimensions_to_diagram,
+    escape_activity_name,
+    format_dimension_value,
+)
+from mddrt.utils.misc import iter_nodes, nanoseconds_to_timedelta
+
+if TYPE_CHECKING:
+    from mddrt.tree_diff import TreeNodeDiff
+    from mddrt.tree_node import TreeNode
+
+UNMATCHED_NODE_COLOR = "gray"
+INCREASE_COLOR_SCHEME = TIME_COLOR_SCHEME
+DECREASE_COLOR_SCHEME = COST_COLOR_SCHEME
+
+
+class DirectlyRootedTreeDiffDiagrammer:
+    def __init__(
+        self,
+        diff_root: TreeNodeDiff,
+        visualize_time: bool = True,
+        visualize_cost: bool = True,
+        visualize_quality: bool = True,
+        visualize_flexibility: bool = True,
+        rankdir: str = "TB",
+    ) -> None:
+        """
+        Diagram of the diff between two DRTs.
+
+        Every node shows, for each dimension, the average total per case in both trees and its delta. Rows are
+        colored red when the average increases and green when it decreases, more intense for larger relative
+        deltas. Paths only present in one tree have gray rows, with dashed arcs when removed and bold arcs when
+        added.
+        """
+        self.diff_root = diff_root
+        self.dimensions_to_diagram = dimensions_to_diagram(
+            visualize_time,
+            visualize_cost,
+            visualize_quality,
+            visualize_flexibility,
+        )
+        self.rankdir = rankdir
+        self.diagram = graphviz.Digraph("mddrt_diff", comment="Multi-Dimensional Directed Rooted Tree Diff")
+        self.max_relative_deltas = self.calculate_max_relative_deltas()
+        self.build_diagram()
+
+    def build_diagram(self) -> None:
+        self.diagram.graph_attr["rankdir"] = self.rankdir
+        self.traverse_to_diagram(self.build_node)
+        self.traverse_to_diagram(self.build_links)
+
+    def traverse_to_diagram(self, diagram_routine: Callable[[TreeNodeDiff], None]) -> None:
+        queue = deque([self.diff_root])
+
+        while queue:
+            current_node = queue.popleft()
+            diagram_routine(current_node)
+            queue.extend(current_node.children)
+
+    def calculate_max_relative_deltas(self) -> dict[str, float]:
+        max_relative_deltas = dict.fromkeys(self.dimensions_to_diagram, 0.0)
+        for node in iter_nodes(self.diff_root):
+            for dimension in self.dimensions_to_diagram:
+                max_relative_deltas[dimension] = max(
+                    max_relative_deltas[dimension], abs(self.relative_delta(node, dimension))
+                )
+        return max_relative_deltas
+
+    def build_node(self, node: TreeNodeDiff) -> None:
+        content = "".join(self.build_state_row_string(dimension, node) for dimension in self.dimensions_to_diagram)
+        self.diagram.node(str(node.id), label=f"<{GRAPHVIZ_STATE_NODE.format(content)}>", shape="none")
+
+    def build_state_row_string(
+        self, dimension: Literal["cost", "time", "flexibility", "quality"], node: TreeNodeDiff
+    ) -> str:
+        metric = "lead_case" if dimension == "time" else "total_case"
+        dimension_row = f"{dimension.capitalize()}<br/>"
+        if node.status == "common":
+            base_value = self.format_average(node.base, dimension, metric)
+            other_value = self.format_average(node.other, dimension, metric)
+            delta = self.format_delta(node.dimensions_delta[dimension][metric], dimension)
+            dimension_row += f"Avg. Total: {base_value} &#8594; {other_value} ({delta})<br/>"
+        else:
+            existing_node = node.base if node.status == "removed" else node.other
+            dimension_row += f"Avg. Total: {self.format_average(existing_node, dimension, metric)} ({node.status})<br/>"
+        return GRAPHVIZ_STATE_NODE_ROW.format(self.delta_color(node, dimension), dimension_row)
+
+    def build_links(self, node: TreeNodeDiff) -> None:
+        for child in node.children:
+            base_frequency = child.base.frequency if child.base is not None else 0
+            other_frequency = child.other.frequency if child.other is not None else 0
+            link_row = f"{escape_activity_name(child.name)} ({base_frequency} &#8594; {other_frequency})"
+            link_label = GRAPHVIZ_ACTIVITY.format(GRAPHVIZ_ACTIVITY_DATA.format(link_row))
+            style = {"added": "bold", "removed": "dashed", "common": "solid"}[child.status]
+            self.diagram.edge(tail_name=str(node.id), head_name=str(child.id), label=f"<{link_label}>", style=style)
+
+    def relative_delta(self, node: TreeNodeDiff, dimension: str) -> float:
+        if node.status != "common":
+            return 0.0
+        metric = "lead_case" if dimension == "time" else "total_case"
+        base_average = node.base.dimensions_data[dimension][metric] / node.base.frequency
+        delta = node.dimensions_delta[dimension][metric]
+        if base_average == 0:
+            return 0.0 if delta == 0 else 1.0 if delta > 0 else -1.0
+        return delta / abs(base_average)
+
+    def delta_color(self, node: TreeNodeDiff, dimension: str) -> str:
+        if node.status != "common":
+            return UNMATCHED_NODE_COLOR
+        relative_delta = self.relative_delta(node, dimension)
+        color_scheme = INCREASE_COLOR_SCHEME if relative_delta >= 0 else DECREASE_COLOR_SCHEME
+        max_relative_delta = self.max_relative_deltas[dimension]
+        intensity = abs(relative_delta) / max_relative_delta if max_relative_delta > 0 else 0
+        return color_scheme[color_scheme_index(intensity)]
+
+    def format_average(self, node: TreeNode, dimension: str, metric: str) -> str:
+        value = node.dimensions_data[dimension][metric]
+        if dimension == "time":
+            value = nanoseconds_to_timedelta(value)
+        return format_dimension_value(value / node.frequency, dimension)
+
+    def format_delta(self, delta: float, dimension: str) -> str:
+        sign = "-" if delta < 0 else "+"
+        value = nanoseconds_to_timedelta(round(abs(delta))) if dimension == "time" else abs(delta)
+        return f"{sign}{format_dimension_value(value, dimension)}"
+
+    def get_diagram_string(self) -> str:
+        return self.diagram.source
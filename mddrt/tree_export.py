@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+from collections import deque
+from pathlib import Path
+from sys import maxsize
+from typing import IO, TYPE_CHECKING, Literal, Union
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterator
+
+    from mddrt.tree_node import TreeNode
+
+ExportTarget = Union[str, "os.PathLike[str]", IO]
+
+NODE_COLUMNS = [
+    ("id", pa.int64()),
+    ("parent_id", pa.int64()),
+    ("depth", pa.int64()),
+    ("name", pa.string()),
+    ("frequency", pa.int64()),
+]
+
+
+def export_tree(
+    tree: TreeNode,
+    target: ExportTarget,
+    format: Literal["jsonl", "arrow", "parquet"] = "jsonl",
+    max_depth: int | None = None,
+    batch_size: int = 65536,
+) -> None:
+    """
+    Exports a DRT as a flat table of nodes, for front-ends that lay out and render trees themselves.
+
+    Each row is a node with its id, the id of its parent (None for the root), depth, activity name, frequency
+    and one column per metric of each dimension, named "<dimension>_<metric>" (e.g. "time_lead_case"). Time
+    metrics are integer nanoseconds, and min values of nodes without data (the root) are None. Rows are in
+    breadth-first order, so parents come before their children. The tree is walked once and rows are written as they are produced: one line at a time in JSON lines, and
+    one record batch of `batch_size` rows at a time in Arrow IPC and Parquet.
+
+    Args:
+        tree (TreeNode): The root of the tree to export.
+        target (ExportTarget): The file path or the open file to write to. JSON lines need a text file, Arrow
+            and Parquet a binary file.
+        format (Literal["jsonl", "arrow", "parquet"], optional): The output format. Defaults to "jsonl".
+        max_depth (int | None, optional): Number of activity levels to export below the root, or None to export
+            the whole tree. Limiting the depth avoids expanding the deep levels of lazy trees. Defaults to None.
+        batch_size (int, optional): Number of rows per record batch in Arrow and Parquet. Defaults to 65536.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    if format == "jsonl":
+        export_tree_json_lines(tree, target, max_depth)
+    elif format in ["arrow", "parquet"]:
+        export_tree_record_batches(tree, target, format, max_depth, batch_size)
+    else:
+        error_message = f"Unsupported export format '{format}'. Options are 'jsonl', 'arrow' or 'parquet'."
+        raise ValueError(error_message)
+
+
+def export_tree_json_lines(tree: TreeNode, target: ExportTarget, max_depth: int | None) -> None:
+    if hasattr(target, "write"):
+        write_json_lines(tree, target, max_depth)
+        return
+    with Path(target).open("w", encoding="utf-8") as file:
+        write_json_lines(tree, file, max_depth)
+
+
+def write_json_lines(tree: TreeNode, file: IO, max_depth: int | None) -> None:
+    column_names = node_table_schema(tree).names
+    for row in iter_node_rows(tree, max_depth):
+        file.write(json.dumps(dict(zip(column_names, row)), separators=(",", ":"), default=json_value))
+        file.write("\n")
+
+
+def export_tree_record_batches(
+    tree: TreeNode,
+    target: ExportTarget,
+    format: Literal["arrow", "parquet"],
+    max_depth: int | None,
+    batch_size: int,
+) -> None:
+    schema = node_table_schema(tree)
+    writer = pq.ParquetWriter(target, schema) if format == "parquet" else pa.ipc.new_file(target, schema)
+    with writer:
+        columns = [[] for _ in schema]
+        for row in iter_node_rows(tree, max_depth):
+            for column, value in zip(columns, row):
+                column.append(value)
+            if len(columns[0]) == batch_size:
+                writer.write_batch(pa.record_batch(columns, schema=schema))
+                columns = [[] for _ in schema]
+        if columns[0]:
+            writer.write_batch(pa.record_batch(columns, schema=schema))
+
+
+def node_table_schema(tree: TreeNode) -> pa.Schema:
+    fields = list(NODE_COLUMNS)
+    for dimension, data in tree.dimensions_data.items():
+        metric_type = pa.int64() if dimension == "time" else pa.float64()
+        fields.extend((f"{dimension}_{metric}", metric_type) for metric in data)
+    return pa.schema(fields)
+
+
+def iter_node_rows(tree: TreeNode, max_depth: int | None = None) -> Iterator[tuple]:
+    metrics = [(dimension, list(data)) for dimension, data in tree.dimensions_data.items()]
+    queue = deque([tree])
+
+    while queue:
+        node = queue.popleft()
+        parent_id = node.parent.id if node.parent is not None and node is not tree else None
+        row = [node.id, parent_id, node.depth, node.name, node.frequency]
+        for dimension, dimension_metrics in metrics:
+            data = node.dimensions_data[dimension]
+            row.extend(data[metric] if data[metric] != maxsize else None for metric in dimension_metrics)
+        yield tuple(row)
+
+        if max_depth is not None and node.depth - tree.depth >= max_depth:
+            continue
+        queue.extend(node.children)
+
+
+def json_value(value: object) -> int | float:
+    # Numpy scalars from pandas aggregations
+    if hasattr(value, "item"):
+        return value.item()
+    error_message = f"Object of type {type(value).__name__} is not JSON serializable."
+    raise TypeError(error_message)
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-from datetime import timedelta
+from itertools import count
 
 from mddrt.tree_node import TreeNode
+from mddrt.utils.misc import max_node_id
+from mddrt.utils.quantile_sketch import merge_sketches
+from mddrt.utils.running_stats import merge_running_stats
 
 
 class DirectedRootedTreeGrouper:
     def __init__(self, tree: TreeNode) -> None:
         self.tree: TreeNode = tree
+        self.node_ids: count = count(max_node_id(tree) + 1)
         self.start_group()
 
     def start_group(self) -> None:
@@ -45,7 +49,7 @@ class DirectedRootedTreeGrouper:
 
     def group_nodes(self, parent_node: TreeNode, nodes: list[TreeNode]) -> None:
         new_node_name = self.create_new_node_name(nodes)
-        new_node = TreeNode(new_node_name, nodes[0].depth)
+        new_node = TreeNode(new_node_name, nodes[0].depth, nodes[0].alphabet, next(self.node_ids))
 
         self.group_dimensions_data_in_new_node(new_node, nodes)
         self.replace_old_nodes_with_new(parent_node, new_node, nodes)
@@ -79,6 +83,10 @@ class DirectedRootedTreeGrouper:
             grouped_data["min"] = self.calculate_min(nodes, dimension)
             grouped_data["max"] = self.calculate_max(nodes, dimension)
 
+        for dimension in grouped_node.running_stats:
+            grouped_node.running_stats[dimension] = merge_running_stats(node.running_stats[dimension] for node in nodes)
+        self.group_quantile_sketches_in_new_node(grouped_node, nodes)
+
     def group_time_dimension_in_new_node(self, grouped_node: TreeNode, nodes: list[TreeNode]) -> None:
         first_node = nodes[0]
         last_node = nodes[-1]
@@ -92,18 +100,28 @@ class DirectedRootedTreeGrouper:
         grouped_data["min"] = self.calculate_min(nodes, "time")
         grouped_data["max"] = self.calculate_max(nodes, "time")
 
-        grouped_data["service"] = sum([node.dimensions_data["time"]["service"] for node in nodes], timedelta())
-        grouped_data["waiting"] = sum([node.dimensions_data["time"]["waiting"] for node in nodes], timedelta())
+        grouped_data["service"] = sum(node.dimensions_data["time"]["service"] for node in nodes)
+        grouped_data["waiting"] = sum(node.dimensions_data["time"]["waiting"] for node in nodes)
+
+    def group_quantile_sketches_in_new_node(self, grouped_node: TreeNode, nodes: list[TreeNode]) -> None:
+        # Like min and max, grouped quantiles describe the values of every activity of the group
+        grouped_node.quantile_sketches = {
+            dimension: {
+                metric: merge_sketches(node.quantile_sketches[dimension][metric] for node in nodes)
+                for metric in sketches
+            }
+            for dimension, sketches in nodes[0].quantile_sketches.items()
+        }
 
-    def calculate_total(self, nodes: list[TreeNode], dimension: str) -> int | float | timedelta:
+    def calculate_total(self, nodes: list[TreeNode], dimension: str) -> int | float:
         if dimension == "time":
-            return sum([node.dimensions_data["time"]["lead"] for node in nodes], timedelta())
+            return sum(node.dimensions_data["time"]["lead"] for node in nodes)
         return sum(node.dimensions_data[dimension]["total"] for node in nodes)
 
-    def calculate_min(self, nodes: list[TreeNode], dimension: str) -> int | float | timedelta:
+    def calculate_min(self, nodes: list[TreeNode], dimension: str) -> int | float:
         return min(node.dimensions_data[dimension]["min"] for node in nodes)
 
-    def calculate_max(self, nodes: list[TreeNode], dimension: str) -> int | float | timedelta:
+    def calculate_max(self, nodes: list[TreeNode], dimension: str) -> int | float:
         return max(node.dimensions_data[dimension]["max"] for node in nodes)
 
     def get_tree(self) -> TreeNode:
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import base64
+import json
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+from mddrt.tree_diagrammer import DirectlyRootedTreeDiagrammer
+from mddrt.utils.diagrammer import link_width
+
+if TYPE_CHECKING:
+    from mddrt.tree_node import TreeNode
+
+HTML_TEMPLATE_PATH = Path(__file__).parent / "templates" / "interactive_tree.html"
+
+
+class DirectlyRootedTreeHtmlRenderer(DirectlyRootedTreeDiagrammer):
+    def __init__(
+        self,
+        tree_root: TreeNode,
+        visualize_time: bool = True,
+        visualize_cost: bool = True,
+        visualize_quality: bool = True,
+        visualize_flexibility: bool = True,
+        node_measures: list[Literal["total", "consumed", "remaining"]] = ["total"],
+        arc_measures: list[Literal["avg", "min", "max", "std", "p50", "p95"]] = [],
+        max_depth: int | None = None,
+        max_nodes: int | None = None,
+        initial_depth: int = 2,
+    ) -> None:
+        """
+        Self-contained HTML page of a DRT, laid out and drawn in the browser without Graphviz.
+
+        Node and arc labels and colors are the ones of the Graphviz diagram. They are computed here and embedded
+        in the page as a zlib compressed, base64 encoded node table. The browser decompresses the table, lays out
+        the visible nodes as a tree and draws them as SVG. Only the first `initial_depth` levels are shown
+        initially, and clicking a node expands or collapses its children.
+        """
+        self.initial_depth = initial_depth
+        self.node_table: list[list] = []
+        self.node_indexes: dict[int, int] = {}
+        super().__init__(
+            tree_root,
+            visualize_time=visualize_time,
+            visualize_cost=visualize_cost,
+            visualize_quality=visualize_quality,
+            visualize_flexibility=visualize_flexibility,
+            node_measures=node_measures,
+            arc_measures=arc_measures,
+            max_depth=max_depth,
+            max_nodes=max_nodes,
+        )
+
+    def build_diagram(self) -> None:
+        self.traverse_to_diagram(self.build_node_row)
+
+    def build_node_row(self, node: TreeNode) -> None:
+        state_rows, link_lines = self.build_plain_labels(node)
+        parent_index = self.node_indexes.get(id(node.parent), -1) if node is not self.tree_root else -1
+        penwidth = link_width(node.frequency, self.dimensions_min_and_max["frequency"])
+        self.node_indexes[id(node)] = len(self.node_table)
+        self.node_table.append([parent_index, state_rows, link_lines, penwidth])
+
+    def get_html_string(self) -> str:
+        payload = json.dumps({"initialDepth": self.initial_depth, "nodes": self.node_table}, separators=(",", ":"))
+        encoded_payload = base64.b64encode(zlib.compress(payload.encode("utf-8"), 9)).decode("ascii")
+        template = HTML_TEMPLATE_PATH.read_text(encoding="utf-8")
+        return template.replace("__DRT_PAYLOAD__", encoded_payload)
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from mddrt.tree_node import TreeNode
+
+
+class LayoutNode:
+    def __init__(self, node: TreeNode, parent: LayoutNode | None, number: int, width: float) -> None:
+        self.node: TreeNode = node
+        self.parent: LayoutNode | None = parent
+        self.children: list[LayoutNode] = []
+        self.number: int = number
+        self.depth: int = parent.depth + 1 if parent is not None else 0
+        self.width: float = width
+        self.x: float = 0.0
+        self.mod: float = 0.0
+        self.change: float = 0.0
+        self.shift: float = 0.0
+        self.thread: LayoutNode | None = None
+        self.ancestor: LayoutNode = self
+
+    def left(self) -> LayoutNode | None:
+        return self.thread or (self.children[0] if self.children else None)
+
+    def right(self) -> LayoutNode | None:
+        return self.thread or (self.children[-1] if self.children else None)
+
+    def left_sibling(self) -> LayoutNode | None:
+        return self.parent.children[self.number - 1] if self.parent is not None and self.number > 0 else None
+
+    def leftmost_sibling(self) -> LayoutNode | None:
+        return self.parent.children[0] if self.parent is not None and self.number > 0 else None
+
+
+def tidy_tree_layout(
+    tree_root: TreeNode,
+    node_width: Callable[[TreeNode], float],
+    node_children: Callable[[TreeNode], list[TreeNode]] | None = None,
+    gap: float = 16,
+) -> list[LayoutNode]:
+    """
+    Computes the horizontal position of every node of a tree with the Buchheim et al. layout algorithm.
+
+    It is the linear time version of the Reingold-Tilford tidy tree layout: parents are centered over their
+    children, subtrees are placed as close as possible without overlapping at any depth, and isomorphic subtrees
+    get the same shape. Nodes have different widths, so the separation between two neighboring nodes is half the
+    width of each node plus the gap. The walks are iterative, so deep trees do not reach the recursion limit.
+
+    Args:
+        tree_root (TreeNode): The root of the tree.
+        node_width (Callable[[TreeNode], float]): The width of each node.
+        node_children (Callable[[TreeNode], list[TreeNode]] | None, optional): The children of each node to lay
+            out, e.g. to lay out the first levels of the tree. Defaults to the children of the nodes.
+        gap (float, optional): Minimum horizontal space between two nodes. Defaults to 16.
+
+    Returns:
+        list[LayoutNode]: The layout nodes in breadth-first order, with their center `x` (the left edge of the
+            tree is at zero) and their `depth` relative to the root.
+    """
+    node_children = node_children if node_children is not None else (lambda node: node.children)
+    layout_root = LayoutNode(tree_root, None, 0, node_width(tree_root))
+    layout_nodes = [layout_root]
+    for layout_node in layout_nodes:
+        for number, child in enumerate(node_children(layout_node.node)):
+            layout_child = LayoutNode(child, layout_node, number, node_width(child))
+            layout_node.children.append(layout_child)
+            layout_nodes.append(layout_child)
+
+    def separation(left_node: LayoutNode, right_node: LayoutNode) -> float:
+        return (left_node.width + right_node.width) / 2 + gap
+
+    first_walk(layout_root, separation)
+    second_walk(layout_nodes)
+    return layout_nodes
+
+
+def first_walk(layout_root: LayoutNode, separation: Callable[[LayoutNode, LayoutNode], float]) -> None:
+    # Post-order walk: each frame is a node, the index of its next child and its default ancestor
+    stack = [[layout_root, 0, layout_root.children[0] if layout_root.children else None]]
+    while stack:
+        frame = stack[-1]
+        node, child_index, _ = frame
+        if child_index < len(node.children):
+            frame[1] += 1
+            child = node.children[child_index]
+            stack.append([child, 0, child.children[0] if child.children else None])
+            continue
+
+        stack.pop()
+        left_sibling = node.left_sibling()
+        if node.children:
+            execute_shifts(node)
+            midpoint = (node.children[0].x + node.children[-1].x) / 2
+            if left_sibling is not None:
+                node.x = left_sibling.x + separation(left_sibling, node)
+                node.mod = node.x - midpoint
+            else:
+                node.x = midpoint
+        elif left_sibling is not None:
+            node.x = left_sibling.x + separation(left_sibling, node)
+        if stack:
+            parent_frame = stack[-1]
+            parent_frame[2] = apportion(node, parent_frame[2], separation)
+
+
+def apportion(
+    node: LayoutNode,
+    default_ancestor: LayoutNode,
+    separation: Callable[[LayoutNode, LayoutNode], float],
+) -> LayoutNode:
+    left_sibling = node.left_sibling()
+    if left_sibling is None:
+        return default_ancestor
+
+    inner_right = outer_right = node
+    inner_left = left_sibling
+    outer_left = node.leftmost_sibling()
+    shift_inner_right = shift_outer_right = node.mod
+    shift_inner_left = inner_left.mod
+    shift_outer_left = outer_left.mod
+    while inner_left.right() is not None and inner_right.left() is not None:
+        inner_left = inner_left.right()
+        inner_right = inner_right.left()
+        outer_left = outer_left.left()
+        outer_right = outer_right.right()
+        outer_right.ancestor = node
+        shift = (
+            inner_left.x + shift_inner_left - (inner_right.x + shift_inner_right) + separation(inner_left, inner_right)
+        )
+        if shift > 0:
+            move_subtree(subtree_ancestor(inner_left, node, default_ancestor), node, shift)
+            shift_inner_right += shift
+            shift_outer_right += shift
+        shift_inner_left += inner_left.mod
+        shift_inner_right += inner_right.mod
+        shift_outer_left += outer_left.mod
+        shift_outer_right += outer_right.mod
+
+    if inner_left.right() is not None and outer_right.right() is None:
+        outer_right.thread = inner_left.right()
+        outer_right.mod += shift_inner_left - shift_outer_right
+    else:
+        if inner_right.left() is not None and outer_left.left() is None:
+            outer_left.thread = inner_right.left()
+            outer_left.mod += shift_inner_right - shift_outer_left
+        default_ancestor = node
+    return default_ancestor
+
+
+def subtree_ancestor(inner_left: LayoutNode, node: LayoutNode, default_ancestor: LayoutNode) -> LayoutNode:
+    return inner_left.ancestor if inner_left.ancestor.parent is node.parent else default_ancestor
+
+
+def move_subtree(left_subtree: LayoutNode, right_subtree: LayoutNode, shift: float) -> None:
+    subtrees = right_subtree.number - left_subtree.number
+    right_subtree.change -= shift / subtrees
+    right_subtree.shift += shift
+    left_subtree.change += shift / subtrees
+    right_subtree.x += shift
+    right_subtree.mod += shift
+
+
+def execute_shifts(node: LayoutNode) -> None:
+    shift = change = 0.0
+    for child in reversed(node.children):
+        child.x += shift
+        child.mod += shift
+        change += child.change
+        shift += child.shift + change
+
+
+def second_walk(layout_nodes: list[LayoutNode]) -> None:
+    # Breadth-first order: the modifiers of the ancestors of a node are summed before reaching it
+    modifier_sums = {id(layout_nodes[0]): 0.0}
+    for layout_node in layout_nodes:
+        modifier_sum = modifier_sums.pop(id(layout_node))
+        layout_node.x += modifier_sum
+        for child in layout_node.children:
+            modifier_sums[id(child)] = modifier_sum + layout_node.mod
+
+    left_edge = min(layout_node.x - layout_node.width / 2 for layout_node in layout_nodes)
+    for layout_node in layout_nodes:
+        layout_node.x -= left_edge
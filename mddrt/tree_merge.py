@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from collections import deque
+from itertools import count
+
+from mddrt.tree_node import TreeNode
+from mddrt.utils.quantile_sketch import merge_sketches
+from mddrt.utils.running_stats import merge_running_stats
+
+REMAINDER_METRICS = {"remainder": ("total_case", "accumulated"), "lead_remainder": ("lead_case", "lead_accumulated")}
+
+
+def merge_trees(trees: list[TreeNode]) -> TreeNode:
+    """
+    Merges DRTs of disjoint sets of cases into the DRT of all their cases.
+
+    Nodes are aligned by their activity path. Frequencies and summed metrics are added, min and max values are
+    combined, and running statistics and quantile sketches are merged. The trees should be discovered with the
+    same dimensions and without grouping activities. Trees of subsets of a log should share the optional
+    activities of the whole log (as the buckets of `TimeWindowedDRT` do), otherwise the flexibility of the
+    merged tree mixes different definitions of optional activities.
+
+    Args:
+        trees (list[TreeNode]): The roots of the trees to merge.
+
+    Raises:
+        ValueError: If there are no trees to merge.
+
+    Returns:
+        TreeNode: The root of the merged tree.
+    """
+    if not trees:
+        error_message = "At least one tree is needed to merge."
+        raise ValueError(error_message)
+
+    alphabet = trees[0].alphabet
+    node_ids = count()
+    merged_tree = TreeNode("root", -1, alphabet, next(node_ids))
+    queue = deque([(merged_tree, trees)])
+
+    while queue:
+        merged_node, nodes = queue.popleft()
+        merge_nodes_data(merged_node, nodes)
+
+        children_by_name: dict[str, list[TreeNode]] = {}
+        for node in nodes:
+            for child in node.children:
+                children_by_name.setdefault(child.name, []).append(child)
+
+        for name, children in children_by_name.items():
+            # Trees of other builders may have other alphabets, so activities are looked up by name
+            activity = alphabet.codes.get(name) if children[0].activity is not None else None
+            merged_child = TreeNode(name, children[0].depth, alphabet, next(node_ids), activity)
+            merged_child.set_parent(merged_node)
+            merged_node.add_children(merged_child)
+            queue.append((merged_child, children))
+
+    return merged_tree
+
+
+def merge_nodes_data(merged_node: TreeNode, nodes: list[TreeNode]) -> None:
+    first_node, *other_nodes = nodes
+    merged_node.frequency = first_node.frequency
+    merged_node.dimensions_data = {dimension: dict(data) for dimension, data in first_node.dimensions_data.items()}
+
+    for node in other_nodes:
+        merged_node.frequency += node.frequency
+        for dimension, data in node.dimensions_data.items():
+            merged_data = merged_node.dimensions_data[dimension]
+            for metric, value in data.items():
+                if metric == "min":
+                    merged_data[metric] = min(merged_data[metric], value)
+                elif metric == "max":
+                    merged_data[metric] = max(merged_data[metric], value)
+                else:
+                    merged_data[metric] += value
+
+    for dimension, merged_data in merged_node.dimensions_data.items():
+        for metric, (total_metric, accumulated_metric) in REMAINDER_METRICS.items():
+            if metric in merged_data:
+                merged_data[metric] = merged_data[total_metric] - merged_data[accumulated_metric]
+        merged_node.running_stats[dimension] = merge_running_stats(node.running_stats[dimension] for node in nodes)
+
+    merged_node.quantile_sketches = {
+        dimension: {
+            metric: merge_sketches(node.quantile_sketches[dimension][metric] for node in nodes) for metric in sketches
+        }
+        for dimension, sketches in first_node.quantile_sketches.items()
+    }
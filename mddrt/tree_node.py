@@ -2,26 +2,50 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Literal
 
-from mddrt.utils.builder import activities_dimension_cumsum, create_dimensions_data
-from mddrt.utils.optional_activities import OptionalActivities
-from mddrt.utils.misc import pretty_format_dict
+from mddrt.utils.activity_alphabet import ActivityAlphabet
+from mddrt.utils.builder import create_dimensions_data, popcount
+from mddrt.utils.misc import nanoseconds_to_timedelta, pretty_format_dict
+from mddrt.utils.running_stats import RunningStats
 
 if TYPE_CHECKING:
-    from datetime import timedelta
+    from mddrt.lazy_tree_builder import LazyDirectlyRootedTreeBuilder
+    from mddrt.utils.quantile_sketch import KLLSketch
 
 
 class TreeNode:
-    id: int = 0
-
-    def __init__(self, name: str, depth: int) -> None:
-        self.id: int = TreeNode.id
-        self.name: str = name
+    def __init__(
+        self,
+        name: str,
+        depth: int,
+        alphabet: ActivityAlphabet | None = None,
+        node_id: int = 0,
+        activity: int | None = None,
+    ) -> None:
+        self.id: int = node_id
+        self.alphabet: ActivityAlphabet = alphabet if alphabet is not None else ActivityAlphabet()
+        # Only the builders give nodes the code of a log activity. Other nodes (the root, grouped activities,
+        # collapsed branches) keep their name as a plain label, so they never add names to the shared alphabet.
+        self.activity: int | None = activity
+        self.label: str | None = name if activity is None else None
         self.depth: int = depth
         self.frequency: int = 0
         self.dimensions_data: dict[Literal["cost", "time", "flexibility", "quality"], dict] = create_dimensions_data()
+        self.running_stats: dict[Literal["cost", "time", "flexibility", "quality"], RunningStats] = {
+            dimension: RunningStats() for dimension in self.dimensions_data
+        }
+        self.confidence_intervals: dict[str, dict[str, tuple[float, float]]] = {}
+        self.quantile_sketches: dict[str, dict[str, KLLSketch]] = {}
         self.parent: TreeNode = None
         self.children: list[TreeNode] = []
-        TreeNode.id += 1
+
+    @property
+    def name(self) -> str:
+        return self.label if self.activity is None else self.alphabet.decode(self.activity)
+
+    @name.setter
+    def name(self, name: str) -> None:
+        self.activity = None
+        self.label = name
 
     def add_children(self, node: TreeNode) -> None:
         self.children.append(node)
@@ -35,6 +59,12 @@ class TreeNode:
                 return child
         return None
 
+    def get_child_by_activity_and_depth(self, activity: int, depth: int) -> TreeNode | None:
+        for child in self.children:
+            if child.activity == activity and child.depth == depth:
+                return child
+        return None
+
     def update_frequency(self) -> None:
         self.frequency += 1
 
@@ -51,12 +81,11 @@ class TreeNode:
 
     def update_time_dimension(self, depth: int, current_case: dict) -> None:
         time_data = self.dimensions_data["time"]
-        activity = current_case["activities"][depth]
 
-        service_time = activity["service_time"]
-        waiting_time = activity["waiting_time"]
+        service_time = current_case["service_times"][depth]
+        waiting_time = current_case["waiting_times"][depth]
         lead_time = service_time + waiting_time
-        lead_accumulated = activities_dimension_cumsum(current_case, "time")[depth]
+        lead_accumulated = current_case["accumulated_lead_times"][depth]
         time_data["service"] += service_time
         time_data["waiting"] += waiting_time
         time_data["lead"] += lead_time
@@ -64,30 +93,35 @@ class TreeNode:
         time_data["lead_accumulated"] += lead_accumulated
         time_data["lead_remainder"] = time_data["lead_case"] - time_data["lead_accumulated"]
         self.update_min_max(time_data, service_time)
+        self.running_stats["time"].update(service_time)
+        if "time" in self.quantile_sketches:
+            self.quantile_sketches["time"]["service"].update(service_time)
+            self.quantile_sketches["time"]["waiting"].update(waiting_time)
 
     def update_cost_dimension(self, depth: int, current_case: dict) -> None:
         dimension_data = self.dimensions_data["cost"]
-        activity_cost = current_case["activities"][depth]["cost"]
-        cost_cumsum = activities_dimension_cumsum(current_case, "cost")
+        activity_cost = current_case["costs"][depth]
+        accumulated_cost = current_case["accumulated_costs"][depth]
 
-        self.update_cumulative_data(dimension_data, activity_cost, cost_cumsum[depth], current_case["cost"])
+        self.update_cumulative_data(dimension_data, activity_cost, accumulated_cost, current_case["cost"])
         self.update_min_max(dimension_data, activity_cost)
+        self.running_stats["cost"].update(activity_cost)
+        if "cost" in self.quantile_sketches:
+            self.quantile_sketches["cost"]["total"].update(activity_cost)
 
     def update_quality_dimension(self, depth: int, current_case: dict) -> None:
         dimension_data = self.dimensions_data["quality"]
-        activities_till_depth = [activity["name"] for activity in current_case["activities"]][: depth + 1]
-        accumulated_rework = len(activities_till_depth) - len(set(activities_till_depth))
+        accumulated_rework = depth + 1 - popcount(current_case["activity_sets"][depth])
         self.update_cumulative_data(dimension_data, accumulated_rework, accumulated_rework, current_case["quality"])
+        self.running_stats["quality"].update(accumulated_rework)
 
     def update_flexibility_dimension(self, depth: int, current_case: dict) -> None:
         dimension_data = self.dimensions_data["flexibility"]
-        case_activities = [activity["name"] for activity in current_case["activities"]]
-        optional_activities = OptionalActivities().get_activities()
-        activities_till_depth = case_activities[: depth + 1]
-        accumulated_optionality = len(set(activities_till_depth) & set(optional_activities))
+        accumulated_optionality = popcount(current_case["activity_sets"][depth] & current_case["optional_activities"])
         self.update_cumulative_data(
             dimension_data, accumulated_optionality, accumulated_optionality, current_case["flexibility"]
         )
+        self.running_stats["flexibility"].update(accumulated_optionality)
 
     def update_cumulative_data(
         self,
@@ -101,10 +135,22 @@ class TreeNode:
         dimension_data["accumulated"] += dimension_cumsum
         dimension_data["remainder"] = dimension_data["total_case"] - dimension_data["accumulated"]
 
-    def update_min_max(self, dimension_data: dict, value_to_compare: float | timedelta) -> None:
+    def update_min_max(self, dimension_data: dict, value_to_compare: float) -> None:
         dimension_data["max"] = max(dimension_data["max"], value_to_compare)
         dimension_data["min"] = min(dimension_data["min"], value_to_compare)
 
+    def get_quantile(self, dimension: str, metric: str, q: float) -> float | None:
+        sketch = self.quantile_sketches.get(dimension, {}).get(metric)
+        if sketch is None:
+            return None
+        return sketch.quantile(q)
+
+    def get_dimension_data(self, dimension: Literal["cost", "time", "flexibility", "quality"]) -> dict:
+        dimension_data = self.dimensions_data[dimension]
+        if dimension != "time":
+            return dict(dimension_data)
+        return {metric: nanoseconds_to_timedelta(value) for metric, value in dimension_data.items()}
+
     def __str__(self) -> str:
         return f"""
 Id: {self.id}
@@ -112,5 +158,50 @@ Name: {self.name}
 Depth: {self.depth}
 Freq: {self.frequency}
 Parent: {self.parent.name if self.parent else None} {self.parent.id if self.parent else None}
-Data: \n{pretty_format_dict(self.dimensions_data)}
+Data: \n{pretty_format_dict({dimension: self.get_dimension_data(dimension) for dimension in self.dimensions_data})}
 """
+
+
+class LazyTreeNode(TreeNode):
+    def __init__(
+        self,
+        name: str,
+        depth: int,
+        alphabet: ActivityAlphabet,
+        node_id: int,
+        builder: LazyDirectlyRootedTreeBuilder,
+        cases_range: tuple[int, int],
+        activity: int | None = None,
+    ) -> None:
+        """
+        Tree node whose children are built the first time they are accessed.
+
+        Args:
+            name (str): The activity name.
+            depth (int): The node depth.
+            alphabet (ActivityAlphabet): The activity alphabet of the tree.
+            node_id (int): The node id.
+            builder (LazyDirectlyRootedTreeBuilder): The builder that computes the children of the node.
+            cases_range (tuple[int, int]): Start and end positions of the cases that pass through the node in the
+                variant-sorted cases array of the builder.
+            activity (int | None, optional): The code of the activity in the alphabet, or None for the root.
+                Defaults to None.
+        """
+        self.builder: LazyDirectlyRootedTreeBuilder = builder
+        self.cases_range: tuple[int, int] = cases_range
+        self.is_expanded: bool = False
+        super().__init__(name, depth, alphabet, node_id, activity)
+
+    @property
+    def children(self) -> list[TreeNode]:
+        if not self.is_expanded:
+            self.is_expanded = True
+            self.builder.expand_node(self)
+        return self._children
+
+    @children.setter
+    def children(self, children: list[TreeNode]) -> None:
+        self._children = children
+
+    def expanded_children(self) -> list[TreeNode]:
+        return self._children if self.is_expanded else []
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from collections import deque
+from copy import deepcopy
+
+from mddrt.tree_node import LazyTreeNode, TreeNode
+from mddrt.utils.misc import iter_nodes
+from mddrt.utils.quantile_sketch import KLLSketch
+
+# Case total and consumed metrics of the dimensions whose values add up along a case
+REBASED_METRICS = {"cost": ("total_case", "accumulated"), "time": ("lead_case", "lead_accumulated")}
+
+
+def subtree_by_prefix(tree: TreeNode, prefix: list[str], rebase: bool = False) -> TreeNode:
+    """
+    Gets the DRT of the cases that start with an activity prefix, without rebuilding the tree from the log.
+
+    The returned tree is rooted at the node reached by the prefix and is independent of the original tree, so
+    it can be grouped or pruned without modifying it. By default its nodes keep their original depths and
+    aggregates, which describe the whole cases: the consumed cost and time include the prefix activities. For
+    lazy trees the cases with the prefix are then found by binary search over the variant-sorted cases, so the
+    intermediate levels are not materialized.
+
+    With `rebase`, the subtree describes the cases trimmed to start at its root, as if it was discovered from
+    the log without the activities before the last one of the prefix. Depths start at 0, the root has no
+    waiting time, and the cost and time consumed before the root are subtracted from the case totals and
+    consumed values. The tree only keeps sums over the cases, so these values are exact at the root, while
+    below it the average per case consumed before the root is subtracted. Rework and optionality are counted on
+    the activities of the whole cases and are kept. Lazy subtrees are materialized.
+
+    Args:
+        tree (TreeNode): The root of a DRT discovered without grouping activities.
+        prefix (list[str]): The activity names that every case of the subtree starts with.
+        rebase (bool, optional): Whether to re-root the depths and the cost and time aggregates at the subtree
+            root. Defaults to False.
+
+    Raises:
+        ValueError: If the prefix is empty or no case starts with it.
+
+    Returns:
+        TreeNode: The root of the subtree, the node of the last activity of the prefix.
+    """
+    if not prefix:
+        error_message = "Activity prefix should have at least one activity."
+        raise ValueError(error_message)
+
+    if isinstance(tree, LazyTreeNode):
+        subtree = lazy_subtree_by_prefix(tree, prefix)
+    else:
+        prefix_node = find_prefix_node(tree, prefix)
+        subtree = copy_subtree(prefix_node) if prefix_node is not None else None
+
+    if subtree is None:
+        error_message = f"No case starts with the activity prefix {prefix}."
+        raise ValueError(error_message)
+    if rebase:
+        subtree = copy_subtree(subtree) if isinstance(subtree, LazyTreeNode) else subtree
+        rebase_subtree(subtree)
+    return subtree
+
+
+def find_prefix_node(tree: TreeNode, prefix: list[str]) -> TreeNode | None:
+    current_node = tree
+    for depth, activity_name in enumerate(prefix):
+        current_node = current_node.get_child_by_name_and_depth(activity_name, depth)
+        if current_node is None:
+            return None
+    return current_node
+
+
+def lazy_subtree_by_prefix(tree: LazyTreeNode, prefix: list[str]) -> LazyTreeNode | None:
+    activities = [tree.alphabet.codes.get(activity_name) for activity_name in prefix]
+    if None in activities:
+        return None
+    return tree.builder.query_prefix(activities)
+
+
+def copy_subtree(node: TreeNode) -> TreeNode:
+    subtree = copy_node(node)
+    queue = deque([(node, subtree)])
+
+    while queue:
+        original_node, copied_node = queue.popleft()
+        for child in original_node.children:
+            copied_child = copy_node(child)
+            copied_child.set_parent(copied_node)
+            copied_node.add_children(copied_child)
+            queue.append((child, copied_child))
+
+    return subtree
+
+
+def copy_node(node: TreeNode) -> TreeNode:
+    copied_node = TreeNode(node.name, node.depth, node.alphabet, node.id, node.activity)
+    copied_node.frequency = node.frequency
+    copied_node.dimensions_data = deepcopy(node.dimensions_data)
+    copied_node.running_stats = deepcopy(node.running_stats)
+    copied_node.quantile_sketches = deepcopy(node.quantile_sketches)
+    copied_node.confidence_intervals = deepcopy(node.confidence_intervals)
+    return copied_node
+
+
+def rebase_subtree(subtree: TreeNode) -> None:
+    root_time_data = subtree.dimensions_data["time"]
+    # The trimmed cases start at the root, so the consumption before the root includes its waiting time
+    prefix_consumptions = {
+        "cost": subtree.dimensions_data["cost"]["accumulated"] - subtree.dimensions_data["cost"]["total"],
+        "time": root_time_data["lead_accumulated"] - root_time_data["service"],
+    }
+    root_time_data["waiting"] = 0
+    root_time_data["lead"] = root_time_data["service"]
+    if "time" in subtree.quantile_sketches:
+        waiting_sketch = KLLSketch(subtree.quantile_sketches["time"]["waiting"].k)
+        for _ in range(subtree.frequency):
+            waiting_sketch.update(0)
+        subtree.quantile_sketches["time"]["waiting"] = waiting_sketch
+
+    depth_offset = subtree.depth
+    for node in iter_nodes(subtree):
+        node.depth -= depth_offset
+        for dimension, metrics in REBASED_METRICS.items():
+            consumption = prefix_consumptions[dimension] * node.frequency / subtree.frequency
+            if dimension == "time":
+                consumption = round(consumption)
+            for metric in metrics:
+                node.dimensions_data[dimension][metric] -= consumption
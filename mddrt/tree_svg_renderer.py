@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal
+from xml.sax.saxutils import escape, quoteattr
+
+from mddrt.tree_diagrammer import DirectlyRootedTreeDiagrammer
+from mddrt.tree_layout import tidy_tree_layout
+from mddrt.utils.diagrammer import link_width
+
+if TYPE_CHECKING:
+    from mddrt.tree_layout import LayoutNode
+    from mddrt.tree_node import TreeNode
+
+CHAR_WIDTH = 7
+LINE_HEIGHT = 15
+ROW_PADDING = 4
+LABEL_GAP = 8
+SIBLING_GAP = 16
+MARGIN = 20
+
+
+class NodeLabels:
+    def __init__(self, state_rows: list[tuple[str, list[str]]], link_lines: list[str], penwidth: float) -> None:
+        self.state_rows = state_rows
+        self.link_lines = link_lines
+        self.penwidth = penwidth
+        self.width = max(len(line) for _, lines in state_rows for line in lines) * CHAR_WIDTH + 4 * ROW_PADDING
+        self.height = sum(len(lines) * LINE_HEIGHT + 2 * ROW_PADDING for _, lines in state_rows)
+        self.link_width = max(len(line) for line in link_lines) * CHAR_WIDTH
+        self.link_height = len(link_lines) * LINE_HEIGHT
+
+
+class DirectlyRootedTreeSvgRenderer(DirectlyRootedTreeDiagrammer):
+    def __init__(
+        self,
+        tree_root: TreeNode,
+        visualize_time: bool = True,
+        visualize_cost: bool = True,
+        visualize_quality: bool = True,
+        visualize_flexibility: bool = True,
+        node_measures: list[Literal["total", "consumed", "remaining"]] = ["total"],
+        arc_measures: list[Literal["avg", "min", "max", "std", "p50", "p95"]] = [],
+        max_depth: int | None = None,
+        max_nodes: int | None = None,
+    ) -> None:
+        """
+        SVG diagram of a DRT, laid out with a tidy tree layout instead of Graphviz.
+
+        Node and arc labels and colors are the ones of the Graphviz diagram. A DRT is a tree, so the nodes are
+        placed with the linear time Buchheim layout and written as SVG directly, without the `dot` binary and its
+        general graph layout. Text widths are estimated from the number of characters. The tree is drawn top to
+        bottom.
+        """
+        self.node_labels: dict[int, NodeLabels] = {}
+        super().__init__(
+            tree_root,
+            visualize_time=visualize_time,
+            visualize_cost=visualize_cost,
+            visualize_quality=visualize_quality,
+            visualize_flexibility=visualize_flexibility,
+            node_measures=node_measures,
+            arc_measures=arc_measures,
+            max_depth=max_depth,
+            max_nodes=max_nodes,
+        )
+
+    def build_diagram(self) -> None:
+        self.traverse_to_diagram(self.build_node_labels)
+
+    def build_node_labels(self, node: TreeNode) -> None:
+        state_rows, link_lines = self.build_plain_labels(node)
+        penwidth = link_width(node.frequency, self.dimensions_min_and_max["frequency"])
+        self.node_labels[id(node)] = NodeLabels(state_rows, link_lines, penwidth)
+
+    def layout_width(self, node: TreeNode) -> float:
+        labels = self.node_labels[id(node)]
+        return max(labels.width, labels.link_width) if node is not self.tree_root else labels.width
+
+    def get_svg_string(self) -> str:
+        layout_nodes = tidy_tree_layout(self.tree_root, self.layout_width, self.diagram_children, SIBLING_GAP)
+        levels_y, height = self.levels_y(layout_nodes)
+        width = max(layout_node.x + layout_node.width / 2 for layout_node in layout_nodes) + 2 * MARGIN
+
+        links, nodes = [], []
+        for layout_node in layout_nodes:
+            x, y = layout_node.x + MARGIN, levels_y[layout_node.depth]
+            labels = self.node_labels[id(layout_node.node)]
+            nodes.append(self.build_svg_node(labels, x, y))
+            for child in layout_node.children:
+                child_labels = self.node_labels[id(child.node)]
+                links.append(self.build_svg_link(labels, child_labels, x, y, child.x + MARGIN, levels_y[child.depth]))
+
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.0f}" height="{height:.0f}" '
+            f'viewBox="0 0 {width:.0f} {height:.0f}" font-family="Arial">\n'
+            + "".join(links)
+            + "".join(nodes)
+            + "</svg>\n"
+        )
+
+    def levels_y(self, layout_nodes: list[LayoutNode]) -> tuple[list[float], float]:
+        levels_box_height: list[float] = []
+        levels_link_height: list[float] = []
+        for layout_node in layout_nodes:
+            labels = self.node_labels[id(layout_node.node)]
+            if layout_node.depth == len(levels_box_height):
+                levels_box_height.append(0)
+                levels_link_height.append(0)
+            levels_box_height[layout_node.depth] = max(levels_box_height[layout_node.depth], labels.height)
+            if layout_node.depth > 0:
+                levels_link_height[layout_node.depth] = max(levels_link_height[layout_node.depth], labels.link_height)
+
+        levels_y = []
+        y = MARGIN
+        for depth, box_height in enumerate(levels_box_height):
+            if depth > 0:
+                y += levels_link_height[depth] + 2 * LABEL_GAP
+            levels_y.append(y)
+            y += box_height
+        return levels_y, y + MARGIN + LINE_HEIGHT
+
+    def build_svg_node(self, labels: NodeLabels, x: float, y: float) -> str:
+        left = x - labels.width / 2
+        content = ""
+        row_top = y
+        for bg_color, lines in labels.state_rows:
+            row_height = len(lines) * LINE_HEIGHT + 2 * ROW_PADDING
+            content += (
+                f'<rect x="{left:.1f}" y="{row_top:.1f}" width="{labels.width}" height="{row_height}" '
+                f"fill={quoteattr(bg_color)}/>"
+            )
+            content += build_svg_text(lines, x, row_top + ROW_PADDING, 12, "white")
+            row_top += row_height
+        content += (
+            f'<rect x="{left:.1f}" y="{y:.1f}" width="{labels.width}" height="{labels.height}" rx="4" '
+            'fill="none" stroke="black"/>'
+        )
+        return f"<g>{content}</g>\n"
+
+    def build_svg_link(
+        self,
+        labels: NodeLabels,
+        child_labels: NodeLabels,
+        x: float,
+        y: float,
+        child_x: float,
+        child_y: float,
+    ) -> str:
+        start_y = y + labels.height
+        middle_y = (start_y + child_y) / 2
+        path = (
+            f"M{x:.1f},{start_y:.1f} C{x:.1f},{middle_y:.1f} {child_x:.1f},{middle_y:.1f} {child_x:.1f},{child_y:.1f}"
+        )
+        label_top = child_y - LABEL_GAP - child_labels.link_height
+        return (
+            f'<path d="{path}" fill="none" stroke="black" stroke-width="{child_labels.penwidth}"/>'
+            f'<rect x="{child_x - child_labels.link_width / 2:.1f}" y="{label_top:.1f}" '
+            f'width="{child_labels.link_width}" height="{child_labels.link_height}" fill="snow"/>'
+            + build_svg_text(child_labels.link_lines, child_x, label_top, 11, "black")
+            + "\n"
+        )
+
+
+def build_svg_text(lines: list[str], x: float, y: float, font_size: int, color: str) -> str:
+    spans = "".join(
+        f'<tspan x="{x:.1f}" y="{y + (index + 0.8) * LINE_HEIGHT:.1f}">{escape(line)}</tspan>'
+        for index, line in enumerate(lines)
+    )
+    return f'<text text-anchor="middle" font-size="{font_size}" fill="{color}">{spans}</text>'
@@ -1,50 +1,96 @@
+import hashlib
 import os
 import platform
 import subprocess
 import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
 
 from graphviz import Source
 
+RENDERED_DIAGRAMS_CACHE_SIZE = 32
+
+rendered_diagrams: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+rendered_diagrams_lock = threading.Lock()
+
+
+def pipe_graphviz_diagram(drt_string: str, format: str, use_cache: bool = True) -> bytes:
+    """
+    Renders a DOT source in memory, without writing the source or the output to disk.
+
+    Rendered diagrams are kept in an LRU cache of `RENDERED_DIAGRAMS_CACHE_SIZE` entries keyed by the SHA-256 of
+    the source and the format, so viewing the same diagram again does not run `dot`.
+    """
+    key = (hashlib.sha256(drt_string.encode("utf-8")).hexdigest(), format)
+    if use_cache:
+        with rendered_diagrams_lock:
+            if key in rendered_diagrams:
+                rendered_diagrams.move_to_end(key)
+                return rendered_diagrams[key]
+
+    diagram = Source(drt_string).pipe(format=format)
+
+    if use_cache:
+        with rendered_diagrams_lock:
+            rendered_diagrams[key] = diagram
+            while len(rendered_diagrams) > RENDERED_DIAGRAMS_CACHE_SIZE:
+                rendered_diagrams.popitem(last=False)
+    return diagram
+
+
+def clear_rendered_diagrams_cache() -> None:
+    with rendered_diagrams_lock:
+        rendered_diagrams.clear()
+
 
 def save_graphviz_diagram(drt_string: str, filename: str, format: str):
-    graph = Source(drt_string)
-    graph.render(filename=filename, format=format, cleanup=True)
+    diagram = pipe_graphviz_diagram(drt_string, format, use_cache=False)
+    Path(f"{filename}.{format}").write_bytes(diagram)
+
 
+def render_graphviz_diagram(drt_string: str, filename: str, format: str) -> str:
+    diagram = pipe_graphviz_diagram(drt_string, format, use_cache=False)
+    file_path = f"{filename}.{format}"
+    Path(file_path).write_bytes(diagram)
+    return file_path
 
-def view_graphviz_diagram(drt_string: str, format: str):
-    filename = "tmp_source_file"
-    file_format = format
-    graph = Source(drt_string)
 
+def view_graphviz_diagram(drt_string: str, format: str, use_cache: bool = True):
+    check_view_format(format)
+    display_diagram(pipe_graphviz_diagram(drt_string, format, use_cache), format)
+
+
+def check_view_format(format: str):
     if is_google_colab() or is_jupyter_notebook():
         if format not in ["jpg", "png", "jpeg", "svg"]:
             msg_error = "Format value should be a valid image extension for interactive Python Environments. Options are 'jpg', 'png', 'jpeq' or 'svg'"
             raise ValueError(msg_error)
-        from IPython.display import SVG, Image, display
+    elif format not in ["jpg", "png", "jpeg", "webp", "svg"]:
+        msg_error = "Format value should be a valid image extension for interactive Python Environments. Options are 'jpg', 'png', 'jpeq', 'webp' or 'svg'"
+        raise ValueError(msg_error)
 
-        graph_path = graph.render(filename=filename, format=file_format, cleanup=True)
+
+def display_diagram(diagram: bytes, format: str):
+    if is_google_colab() or is_jupyter_notebook():
+        from IPython.display import SVG, Image, display
 
         if format == "svg":
-            display(SVG(filename=graph_path))
+            display(SVG(data=diagram))
         else:
-            display(Image(graph_path))
+            display(Image(data=diagram))
     else:
-        from PIL import Image
-
-        if format not in ["jpg", "png", "jpeg", "webp", "svg"]:
-            msg_error = "Format value should be a valid image extension for interactive Python Environments. Options are 'jpg', 'png', 'jpeq', 'webp' or 'svg'"
-            raise ValueError(msg_error)
-
+        # External viewers need a file, written once from the rendered bytes
         with tempfile.NamedTemporaryFile(suffix=f".{format}", delete=False) as temp_file:
+            temp_file.write(diagram)
             temp_file_path = temp_file.name
-        graph_path = graph.render(filename=temp_file_path, format=file_format, cleanup=True)
 
         if platform.system() == "Darwin":  # macOS
-            subprocess.call(("open", f"{temp_file_path}.{format}"))
+            subprocess.call(("open", temp_file_path))
         elif platform.system() == "Windows":  # Windows
-            os.startfile(f"{temp_file_path}.{format}")
+            os.startfile(temp_file_path)
         else:  # linux variants
-            subprocess.call(("xdg-open", f"{temp_file_path}.{format}"))
+            subprocess.call(("xdg-open", temp_file_path))
 
 
 def is_jupyter_notebook():
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy as np
+
+
+class ActivityAlphabet:
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self.names: list[str] = []
+        self.codes: dict[str, int] = {}
+        for name in names:
+            self.encode(name)
+
+    @classmethod
+    def from_column(cls, column: pd.Series) -> ActivityAlphabet:
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            return cls(column.cat.categories)
+        return cls(pd.unique(column))
+
+    def encode(self, name: str) -> int:
+        code = self.codes.get(name)
+        if code is None:
+            code = len(self.names)
+            self.names.append(name)
+            self.codes[name] = code
+        return code
+
+    def encode_column(self, column: pd.Series) -> np.ndarray:
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            categories = column.cat.categories.tolist()
+            if categories == self.names[: len(categories)]:
+                return column.cat.codes.to_numpy()
+        for name in pd.unique(column):
+            self.encode(name)
+        return pd.Categorical(column, categories=self.names).codes
+
+    def decode(self, code: int) -> str:
+        return self.names[code]
+
+    def __len__(self) -> int:
+        return len(self.names)
@@ -1,75 +1,104 @@
 from __future__ import annotations
 
-from datetime import timedelta
-from itertools import accumulate
+import sys
+from dataclasses import replace
 from sys import maxsize
 from typing import TYPE_CHECKING, Literal
 
+import numpy as np
 import pandas as pd
-from tqdm import tqdm
-
-from mddrt.utils.optional_activities import OptionalActivities
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from mddrt.drt_parameters import DirectlyRootedTreeParameters
 
+if sys.version_info >= (3, 10):
+    popcount = int.bit_count
+else:
+
+    def popcount(bitset: int) -> int:
+        return bin(bitset).count("1")
+
 
 def calculate_cases_metrics(
     log: pd.DataFrame,
     params: DirectlyRootedTreeParameters,
     num_mandatory_activities: int | None = None,
 ) -> pd.DataFrame:
-    case_ids = sorted(log[params.case_id_key].unique())
+    cases_grouped_by_id = log.groupby(params.case_id_key, dropna=True, sort=False, observed=True)
 
     if params.calculate_flexibility and num_mandatory_activities is None:
         total_cases = log[params.case_id_key].nunique()
-        activity_case_counts = log.groupby(params.activity_key)[params.case_id_key].nunique()
-
-        mandatory_activities = activity_case_counts[activity_case_counts == total_cases].index.tolist()
-        mandatory_activities_set = set(mandatory_activities)
+        activity_case_counts = log.groupby(params.activity_key, observed=True)[params.case_id_key].nunique()
 
-        optional_activities = activity_case_counts[activity_case_counts < total_cases].index.tolist()
-        OptionalActivities().set_activities(list(optional_activities))
-        print("Calculating log mandatory activities: ")
-        for case_id in tqdm(case_ids):
-            log_case = log.loc[log[params.case_id_key] == case_id]
-            case_activities = log_case[params.activity_key].unique()
-            mandatory_activities_set = mandatory_activities_set.intersection(case_activities)
-        num_mandatory_activities = len(mandatory_activities_set)
+        num_mandatory_activities = int((activity_case_counts == total_cases).sum())
 
     num_mandatory_activities = 0 if num_mandatory_activities is None else num_mandatory_activities
 
-    log_metrics = []
-    print("Calculating log metrics: ")
-    for case_id in tqdm(case_ids):
-        log_case = log.loc[log[params.case_id_key] == case_id]
-        case_metrics = {}
-        case_metrics["Case Id"] = case_id
+    log_metrics = pd.DataFrame(index=cases_grouped_by_id.size().index)
+
+    if params.calculate_time:
+        case_start = cases_grouped_by_id[params.start_timestamp_key].min()
+        case_complete = cases_grouped_by_id[params.timestamp_key].max()
+        log_metrics["Duration"] = case_complete - case_start
+
+    if params.calculate_cost:
+        log_metrics["Cost"] = cases_grouped_by_id[params.cost_key].sum() if params.cost_key in log.columns else 0
+
+    if params.calculate_quality or params.calculate_flexibility:
+        num_unique_activities = cases_grouped_by_id[params.activity_key].nunique()
+        num_activities = cases_grouped_by_id.size()
+
+        if params.calculate_quality:
+            log_metrics["Rework"] = num_activities - num_unique_activities
 
-        if params.calculate_time:
-            case_start = log_case[params.start_timestamp_key].min()
-            case_complete = log_case[params.timestamp_key].max()
-            case_metrics["Duration"] = case_complete - case_start
+        if params.calculate_flexibility:
+            log_metrics["Optionality"] = num_unique_activities - num_mandatory_activities
 
-        if params.calculate_cost:
-            case_metrics["Cost"] = log_case[params.cost_key].sum()
+        log_metrics["Optional Activities"] = num_unique_activities - num_mandatory_activities
+        log_metrics["Unique Activities"] = num_unique_activities
+        log_metrics["Total Activities"] = num_activities
 
-        if params.calculate_quality or params.calculate_flexibility:
-            unique_activities = log_case[params.activity_key].unique()
-            num_unique_activities = len(unique_activities)
+    log_metrics.insert(0, "Case Id", log_metrics.index.tolist())
+    return log_metrics.sort_values("Case Id").reset_index(drop=True)
 
-            if params.calculate_quality:
-                case_metrics["Rework"] = len(log_case) - num_unique_activities
 
-            if params.calculate_flexibility:
-                case_metrics["Optionality"] = num_unique_activities - num_mandatory_activities
+def timestamps_to_nanoseconds(timestamps: pd.Series) -> np.ndarray:
+    return timestamps.dt.as_unit("ns").astype("int64").to_numpy()
 
-            case_metrics["Optional Activities"] = num_unique_activities - num_mandatory_activities
-            case_metrics["Unique Activities"] = num_unique_activities
-            case_metrics["Total Activities"] = len(log_case)
 
-        log_metrics.append(case_metrics)
-    return pd.DataFrame(log_metrics)
+def sort_case_events(case_codes: np.ndarray, start_timestamps: np.ndarray) -> np.ndarray:
+    # Events positions grouped by case and sorted by start timestamp, without events of missing cases
+    events_order = np.lexsort((start_timestamps, case_codes))
+    return events_order[case_codes[events_order] >= 0]
+
+
+def durations_to_nanoseconds(durations: pd.Series) -> np.ndarray:
+    return durations.dt.as_unit("ns").astype("int64").to_numpy()
+
+
+def optional_activities_mask(cases_activity_sets: Iterable[int]) -> int:
+    # Optional activities are the ones that are not present in every case
+    all_activities = 0
+    mandatory_activities = -1
+    for activity_set in cases_activity_sets:
+        all_activities |= activity_set
+        mandatory_activities &= activity_set
+    return all_activities & ~mandatory_activities
+
+
+def log_optional_activities(log: pd.DataFrame, params: DirectlyRootedTreeParameters) -> list[str]:
+    # Names of the activities that are not present in every case of the log
+    case_activities = log[[params.case_id_key, params.activity_key]].drop_duplicates()
+    activity_cases = case_activities[params.activity_key].value_counts(sort=False)
+    return activity_cases.index[activity_cases < log[params.case_id_key].nunique()].tolist()
+
+
+def resolve_missing_columns(log: pd.DataFrame, params: DirectlyRootedTreeParameters) -> DirectlyRootedTreeParameters:
+    if params.start_timestamp_key not in log.columns:
+        return replace(params, start_timestamp_key=params.timestamp_key)
+    return params
 
 
 def create_dimensions_data() -> dict:
@@ -77,11 +106,11 @@ def create_dimensions_data() -> dict:
         "cost": create_default_data("numeric"),
         "quality": create_default_data("numeric"),
         "flexibility": create_default_data("numeric"),
-        "time": create_default_data("timedelta"),
+        "time": create_default_data("time"),
     }
 
 
-def create_default_data(data_type: Literal["numeric", "timedelta"]) -> dict:
+def create_default_data(data_type: Literal["numeric", "time"]) -> dict:
     if data_type == "numeric":
         return {
             "total": 0,
@@ -91,33 +120,19 @@ def create_default_data(data_type: Literal["numeric", "timedelta"]) -> dict:
             "max": 0,
             "min": maxsize,
         }
+    # Time metrics are accumulated as integer nanoseconds
     return {
-        "lead": timedelta(days=0),
-        "lead_case": timedelta(days=0),
-        "lead_remainder": timedelta(days=0),
-        "lead_accumulated": timedelta(days=0),
-        "max": timedelta(days=0),
-        "min": timedelta.max,
-        "service": timedelta(days=0),
-        "waiting": timedelta(days=0),
+        "lead": 0,
+        "lead_case": 0,
+        "lead_remainder": 0,
+        "lead_accumulated": 0,
+        "max": 0,
+        "min": maxsize,
+        "service": 0,
+        "waiting": 0,
     }
 
 
-def activities_dimension_cumsum(
-    current_case: dict,
-    dimension: Literal["cost", "time", "flexibility", "quality"],
-) -> list[int | timedelta]:
-    activities = current_case["activities"]
-    if dimension == "time":
-        dimension_data = [item["service_time"] + item["waiting_time"] for item in activities]
-    elif dimension == "cost":
-        dimension_data = [item[dimension] for item in activities]
-    else:
-        dimension_data = [current_case[dimension] / len(current_case["activities"])] * len(current_case["activities"])
-
-    return list(accumulate(dimension_data))
-
-
 def dimensions_to_calculate(params: DirectlyRootedTreeParameters) -> list[str]:
     dimensions_to_calculate = []
     if params.calculate_cost:
@@ -4,19 +4,20 @@ from collections import deque
 from datetime import timedelta
 from typing import TYPE_CHECKING, Literal
 
-from mddrt.utils.color_schemes import (
-    COST_COLOR_SCHEME,
-    FLEXIBILITY_COLOR_SCHEME,
-    FREQUENCY_COLOR_SCHEME,
-    QUALITY_COLOR_SCHEME,
-    TIME_COLOR_SCHEME,
-)
+from mddrt.utils.color_schemes import COLOR_SCHEMES
+from mddrt.utils.misc import nanoseconds_to_timedelta
 
 if TYPE_CHECKING:
     from mddrt.tree_node import TreeNode
 
+# Indexes of the color schemes used for the node backgrounds, the lightest colors are skipped
+COLOR_SCHEME_RANGE = (90, 255)
+COLOR_SCHEME_SPAN = COLOR_SCHEME_RANGE[1] - COLOR_SCHEME_RANGE[0]
+# Quantile arc measures are written "pNN", e.g. "p95", with NN from 1 to MAX_QUANTILE_PERCENT
+MAX_QUANTILE_PERCENT = 100
 
-def dimensions_min_and_max(tree_root: TreeNode) -> dict[str, list[int]]:
+
+def dimensions_min_and_max(tree_root: TreeNode, max_depth: int | None = None) -> dict[str, list[int]]:
     dimensions_min_and_max = {"frequency": [0, 0]}
     for dimension in tree_root.dimensions_data:
         dimensions_min_and_max[dimension] = [0, 0]
@@ -33,28 +34,46 @@ def dimensions_min_and_max(tree_root: TreeNode) -> dict[str, list[int]]:
             dimension_avg_total_case = (
                 data["total_case"] / current_node.frequency
                 if dimension != "time"
-                else (data["lead_case"] / current_node.frequency).total_seconds()
+                else (nanoseconds_to_timedelta(data["lead_case"]) / current_node.frequency).total_seconds()
             )
             dimensions_min_and_max[dimension][0] = min(dimensions_min_and_max[dimension][0], dimension_avg_total_case)
             dimensions_min_and_max[dimension][1] = max(dimensions_min_and_max[dimension][1], dimension_avg_total_case)
 
+        if max_depth is not None and current_node.depth - tree_root.depth >= max_depth:
+            continue
         for child in current_node.children:
             queue.append(child)
 
     return dimensions_min_and_max
 
 
-def background_color(
-    measure: timedelta | int,
-    dimension: Literal["frequency", "cost", "time", "flexibility", "quality"],
-    dimension_scale: tuple[int, int],
-) -> str:
-    if isinstance(measure, timedelta):
-        measure = measure.total_seconds()
-    color_scheme_range = (90, 255)
-    color_scheme = color_scheme_by_dimension(dimension)
-    assigned_color_index = interpolated_value(measure, dimension_scale, color_scheme_range)
-    return color_scheme[assigned_color_index]
+class ColorScale:
+    def __init__(
+        self,
+        dimension: Literal["frequency", "cost", "time", "flexibility", "quality"],
+        dimension_scale: tuple[int, int],
+    ) -> None:
+        """
+        Background colors of the measures of a dimension in one diagram.
+
+        The color scheme and the scale of the dimension are resolved once per diagram, so coloring a node is a
+        clamp and a lookup in the `COLOR_SCHEME_RANGE` of the scheme.
+        """
+        self.color_scheme = color_scheme_by_dimension(dimension)
+        self.low, self.high = dimension_scale
+        self.denominator = max(1, (self.high - self.low))
+
+    def color(self, measure: timedelta | float) -> str:
+        if isinstance(measure, timedelta):
+            measure = measure.total_seconds()
+        measure = max(min(measure, self.high), self.low)
+        normalized_value = (measure - self.low) / self.denominator
+        return self.color_scheme[color_scheme_index(normalized_value)]
+
+
+def color_scheme_index(normalized_value: float) -> int:
+    # Index in a color scheme of a value normalized to [0, 1], within COLOR_SCHEME_RANGE
+    return round(COLOR_SCHEME_RANGE[0] + normalized_value * COLOR_SCHEME_SPAN)
 
 
 def interpolated_value(measure: int, from_scale: tuple[int, int], to_scale: tuple[int, int]) -> int:
@@ -66,14 +85,7 @@ def interpolated_value(measure: int, from_scale: tuple[int, int], to_scale: tupl
 
 
 def color_scheme_by_dimension(dimension: Literal["frequency", "cost", "time", "flexibility", "quality"]) -> list[str]:
-    dimension_color_schemes = {
-        "frequency": FREQUENCY_COLOR_SCHEME,
-        "cost": COST_COLOR_SCHEME,
-        "time": TIME_COLOR_SCHEME,
-        "flexibility": FLEXIBILITY_COLOR_SCHEME,
-        "quality": QUALITY_COLOR_SCHEME,
-    }
-    return dimension_color_schemes.get(dimension)
+    return COLOR_SCHEMES.get(dimension)
 
 
 def format_time(time: timedelta) -> str:
@@ -97,6 +109,14 @@ def format_time(time: timedelta) -> str:
     return f"{seconds:02d}s"
 
 
+def format_dimension_value(value: float | timedelta, dimension: str) -> str:
+    if dimension == "time":
+        return format_time(value)
+    if dimension == "cost":
+        return f"{abs(round(value, 2))} USD"
+    return str(abs(round(value, 2)))
+
+
 def dimensions_to_diagram(time: bool, cost: bool, quality: bool, flexibility: bool) -> list[str]:
     dimensions_to_diagram = []
     if time:
@@ -110,6 +130,19 @@ def dimensions_to_diagram(time: bool, cost: bool, quality: bool, flexibility: bo
     return dimensions_to_diagram
 
 
+def is_quantile_measure(measure: str) -> bool:
+    return measure.startswith("p") and measure[1:].isdigit() and 0 < int(measure[1:]) <= MAX_QUANTILE_PERCENT
+
+
+def escape_activity_name(name: str) -> str:
+    # Activity names are written inside HTML-like labels
+    return name.replace("&", "&amp;").replace("<", "&lt").replace(">", "&gt").replace("=", "&#61;")
+
+
+def split_label_lines(label: str) -> list[str]:
+    return [line.strip() for line in label.split("<br/>") if line.strip()]
+
+
 def link_width(measure: int, dimension_scale: list[int]) -> int:
     width_scale = (1, 8)
     return round(interpolated_value(measure, dimension_scale, width_scale), 2)
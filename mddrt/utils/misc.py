@@ -1,4 +1,5 @@
 from collections import deque
+from datetime import timedelta
 from pathlib import Path
 
 
@@ -21,6 +22,28 @@ def pretty_format_dict(d: dict, indent: int = 0) -> str:
     return pretty_str
 
 
+def nanoseconds_to_timedelta(nanoseconds: int) -> timedelta:
+    return timedelta(microseconds=nanoseconds // 1000)
+
+
+def iter_nodes(root):
+    queue = deque([root])
+
+    while queue:
+        current_node = queue.popleft()
+        yield current_node
+        for child in current_node.children:
+            queue.append(child)
+
+
+def max_node_id(root) -> int:
+    return max(node.id for node in iter_nodes(root))
+
+
+def tree_size(root) -> int:
+    return sum(1 for _ in iter_nodes(root))
+
+
 def bfs(root, write_to_file: bool = False) -> None:
     queue = deque([root])
 
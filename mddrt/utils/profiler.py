@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from contextlib import AbstractContextManager
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+@dataclass
+class StageStats:
+    name: str
+    wall_time: float
+    cpu_time: float
+    peak_rss: int | None
+    counts: dict[str, int] = field(default_factory=dict)
+
+
+class DiscoveryProfiler:
+    def __init__(self, callback: Callable[[StageStats], None] | None = None) -> None:
+        """
+        Collects per-stage statistics of a DRT discovery.
+
+        Args:
+            callback (Callable[[StageStats], None] | None, optional): Function called with the statistics of
+                each stage as soon as the stage finishes, e.g. to export them to a metrics system. Defaults to None.
+        """
+        self.callback: Callable[[StageStats], None] | None = callback
+        self.stages: list[StageStats] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[dict[str, int]]:
+        counts = {}
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        yield counts
+        stage_stats = StageStats(
+            name=name,
+            wall_time=time.perf_counter() - wall_start,
+            cpu_time=time.process_time() - cpu_start,
+            peak_rss=peak_rss(),
+            counts=counts,
+        )
+        self.stages.append(stage_stats)
+        if self.callback is not None:
+            self.callback(stage_stats)
+
+    def to_dicts(self) -> list[dict]:
+        return [asdict(stage_stats) for stage_stats in self.stages]
+
+    def report(self) -> str:
+        lines = [f"{'Stage':<25}{'Wall (s)':>12}{'CPU (s)':>12}{'Peak RSS (MB)':>16}  Counts"]
+        for stage_stats in self.stages:
+            rss = f"{stage_stats.peak_rss / 1024**2:.1f}" if stage_stats.peak_rss is not None else "-"
+            counts = ", ".join(f"{key}={value}" for key, value in stage_stats.counts.items())
+            lines.append(
+                f"{stage_stats.name:<25}{stage_stats.wall_time:>12.4f}{stage_stats.cpu_time:>12.4f}{rss:>16}  {counts}"
+            )
+        return "\n".join(lines)
+
+
+def profile_stage(profiler: DiscoveryProfiler | None, name: str) -> AbstractContextManager[dict[str, int]]:
+    if profiler is None:
+        return nullcontext({})
+    return profiler.stage(name)
+
+
+def peak_rss() -> int | None:
+    # Peak resident set size of the process so far, in bytes
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
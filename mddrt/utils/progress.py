@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Callable, Literal, TypeVar, Union
+
+from tqdm import tqdm
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+T = TypeVar("T")
+
+ProgressCallback = Callable[[str, int, int], None]
+Progress = Union[Literal["tqdm"], ProgressCallback, None]
+
+PROGRESS_UPDATES = 100
+
+
+def track_progress(iterable: Iterable[T], total: int, description: str, progress: Progress) -> Iterable[T]:
+    """
+    Wraps an iterable to report its progress.
+
+    Args:
+        iterable (Iterable[T]): The iterable to track.
+        total (int): Number of items of the iterable.
+        description (str): Description of the tracked task.
+        progress (Progress): None to not report progress, "tqdm" to show a tqdm progress bar or a callable
+            that receives the description, the number of processed items and the total number of items.
+            Progress is reported at most `PROGRESS_UPDATES` times, once per batch of items.
+
+    Returns:
+        Iterable[T]: An iterable with the same items.
+    """
+    if progress is None:
+        return iterable
+    if progress == "tqdm":
+        return tqdm(iterable, total=total, desc=description, miniters=progress_batch_size(total))
+    if callable(progress):
+        return report_progress_in_batches(iterable, total, description, progress)
+    error_message = "Progress should be None, 'tqdm' or a callable receiving (description, done, total)."
+    raise ValueError(error_message)
+
+
+def report_progress_in_batches(
+    iterable: Iterable[T],
+    total: int,
+    description: str,
+    callback: ProgressCallback,
+) -> Iterator[T]:
+    batch_size = progress_batch_size(total)
+    callback(description, 0, total)
+    for done, item in enumerate(iterable, start=1):
+        yield item
+        if done % batch_size == 0 or done == total:
+            callback(description, done, total)
+
+
+def progress_batch_size(total: int) -> int:
+    return max(1, math.ceil(total / PROGRESS_UPDATES))
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+DEFAULT_SKETCH_SIZE = 200
+CAPACITY_DECAY = 2 / 3
+
+
+class KLLSketch:
+    def __init__(self, k: int = DEFAULT_SKETCH_SIZE) -> None:
+        """
+        Mergeable streaming quantile sketch (Karnin, Lang and Liberty, 2016).
+
+        Values are stored in a hierarchy of compactors, where an item at level h stands for 2**h values.
+        When the sketch is full, the lowest full compactor is sorted and half of its items are promoted to the
+        next level, so the memory stays in O(k) items and the rank error is about 1.7 / k. Compactions
+        alternate between keeping the odd and the even items, which keeps the sketch deterministic.
+
+        Args:
+            k (int, optional): Capacity of the top compactor, controls accuracy and memory. Defaults to 200.
+        """
+        self.k: int = k
+        self.count: int = 0
+        self.compactors: list[list[float]] = [[]]
+        self.size: int = 0
+        self.max_size: int = self.capacity(0)
+        self.compaction_offset: int = 0
+
+    def capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return max(2, math.ceil(self.k * CAPACITY_DECAY**depth))
+
+    def update(self, value: float) -> None:
+        self.compactors[0].append(value)
+        self.count += 1
+        self.size += 1
+        if self.size >= self.max_size:
+            self.compress()
+
+    def merge(self, other: KLLSketch) -> None:
+        while len(self.compactors) < len(other.compactors):
+            self.grow()
+        for compactor, other_compactor in zip(self.compactors, other.compactors):
+            compactor.extend(other_compactor)
+        self.count += other.count
+        self.size = sum(map(len, self.compactors))
+        while self.size >= self.max_size:
+            self.compress()
+
+    def grow(self) -> None:
+        self.compactors.append([])
+        self.max_size = sum(self.capacity(level) for level in range(len(self.compactors)))
+
+    def compress(self) -> None:
+        for level, compactor in enumerate(self.compactors):
+            if len(compactor) < self.capacity(level):
+                continue
+            if level + 1 == len(self.compactors):
+                self.grow()
+            compactor.sort()
+            # An odd item out stays in the current level
+            leftover = [compactor.pop()] if len(compactor) % 2 else []
+            self.compactors[level + 1].extend(compactor[self.compaction_offset :: 2])
+            self.compaction_offset = 1 - self.compaction_offset
+            compactor[:] = leftover
+            self.size = sum(map(len, self.compactors))
+            if self.size < self.max_size:
+                return
+
+    def quantile(self, q: float) -> float | None:
+        if self.count == 0:
+            return None
+        weighted_items = sorted(
+            (value, 1 << level) for level, compactor in enumerate(self.compactors) for value in compactor
+        )
+        total_weight = sum(weight for _, weight in weighted_items)
+        target_rank = q * total_weight
+        cumulative_weight = 0
+        for value, weight in weighted_items:
+            cumulative_weight += weight
+            if cumulative_weight >= target_rank:
+                return value
+        return weighted_items[-1][0]
+
+    def __len__(self) -> int:
+        return self.count
+
+
+def merge_sketches(sketches: Iterable[KLLSketch], k: int = DEFAULT_SKETCH_SIZE) -> KLLSketch:
+    merged_sketch = KLLSketch(k)
+    for sketch in sketches:
+        merged_sketch.merge(sketch)
+    return merged_sketch
+
+
+def create_quantile_sketches(dimensions: Iterable[str]) -> dict[str, dict[str, KLLSketch]]:
+    # Sketched metrics are the per-activity values shown on the arcs of the diagram
+    sketched_metrics = {"time": ["service", "waiting"], "cost": ["total"]}
+    return {
+        dimension: {metric: KLLSketch() for metric in sketched_metrics[dimension]}
+        for dimension in dimensions
+        if dimension in sketched_metrics
+    }
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from mddrt.utils.color_schemes import COLOR_SCHEMES
+
+if TYPE_CHECKING:
+    from mddrt.tree_node import TreeNode
+
+CACHE_FILE_SUFFIX = ".render"
+
+
+class RenderCache:
+    def __init__(
+        self,
+        max_memory_bytes: int = 64 * 1024**2,
+        cache_dir: str | os.PathLike | None = None,
+        max_disk_bytes: int = 512 * 1024**2,
+    ) -> None:
+        """
+        Cache of rendered diagrams, keyed by the content of the tree and the visualization options.
+
+        Passed to `view_multi_dimensional_drt`, `save_vis_multi_dimensional_drt` or
+        `get_multi_dimensional_drt_image`, a hit skips both the DOT generation and the Graphviz layout. Diagrams are
+        kept in memory and, when `cache_dir` is given, on disk, so they survive restarts and can be shared by
+        processes. Each tier is an LRU cache with a byte budget: the least recently used diagrams are evicted when
+        the budget is exceeded. Disk hits are promoted to memory.
+
+        Args:
+            max_memory_bytes (int, optional): Byte budget of the memory tier. Defaults to 64 MiB.
+            cache_dir (str | os.PathLike | None, optional): Directory of the disk tier, or None to only cache in
+                memory. Defaults to None.
+            max_disk_bytes (int, optional): Byte budget of the disk tier. Defaults to 512 MiB.
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.memory: OrderedDict[str, bytes] = OrderedDict()
+        self.memory_bytes = 0
+        self.disk_bytes = 0
+        self.lock = threading.Lock()
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.disk_bytes = sum(file_size for _, file_size, _ in self.disk_entries())
+
+    def get(self, key: str) -> bytes | None:
+        with self.lock:
+            if key in self.memory:
+                self.memory.move_to_end(key)
+                return self.memory[key]
+            diagram = self.read_from_disk(key)
+            if diagram is not None:
+                self.put_in_memory(key, diagram)
+            return diagram
+
+    def put(self, key: str, diagram: bytes) -> None:
+        with self.lock:
+            self.put_in_memory(key, diagram)
+            self.write_to_disk(key, diagram)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.memory.clear()
+            self.memory_bytes = 0
+            if self.cache_dir is not None:
+                for file_path, _, _ in self.disk_entries():
+                    file_path.unlink(missing_ok=True)
+                self.disk_bytes = 0
+
+    def put_in_memory(self, key: str, diagram: bytes) -> None:
+        if key in self.memory:
+            self.memory_bytes -= len(self.memory.pop(key))
+        if len(diagram) > self.max_memory_bytes:
+            return
+        self.memory[key] = diagram
+        self.memory_bytes += len(diagram)
+        while self.memory_bytes > self.max_memory_bytes:
+            _, evicted_diagram = self.memory.popitem(last=False)
+            self.memory_bytes -= len(evicted_diagram)
+
+    def read_from_disk(self, key: str) -> bytes | None:
+        if self.cache_dir is None:
+            return None
+        file_path = self.cache_dir / f"{key}{CACHE_FILE_SUFFIX}"
+        try:
+            diagram = file_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        # The modification time orders the disk entries by their last use
+        os.utime(file_path)
+        return diagram
+
+    def write_to_disk(self, key: str, diagram: bytes) -> None:
+        if self.cache_dir is None or len(diagram) > self.max_disk_bytes:
+            return
+        file_path = self.cache_dir / f"{key}{CACHE_FILE_SUFFIX}"
+        if file_path.exists():
+            os.utime(file_path)
+            return
+        # Written to a temporary file and renamed, so other processes never read a partial diagram
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(file_descriptor, "wb") as temp_file:
+            temp_file.write(diagram)
+        Path(temp_path).replace(file_path)
+        self.disk_bytes += len(diagram)
+        if self.disk_bytes > self.max_disk_bytes:
+            self.evict_from_disk()
+
+    def evict_from_disk(self) -> None:
+        entries = sorted(self.disk_entries(), key=lambda entry: entry[2])
+        self.disk_bytes = sum(file_size for _, file_size, _ in entries)
+        for file_path, file_size, _ in entries:
+            if self.disk_bytes <= self.max_disk_bytes:
+                break
+            file_path.unlink(missing_ok=True)
+            self.disk_bytes -= file_size
+
+    def disk_entries(self) -> list[tuple[Path, int, float]]:
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(CACHE_FILE_SUFFIX):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((Path(entry.path), stat.st_size, stat.st_mtime))
+        return entries
+
+
+def render_cache_key(tree: TreeNode, options: dict) -> str:
+    """
+    Key of a diagram in a `RenderCache`: the hash of the tree content and of the visualization options.
+
+    The content hash covers the structure, names, frequencies, dimension data and running statistics of the
+    nodes up to the `max_depth` option, so the key changes when the tree is modified in place (e.g. grouped).
+    The state of the quantile sketches is hashed too, as trees discovered with and without quantiles have the
+    same node data but not the same quantile arc measures. The color schemes are hashed so that registering a
+    color scheme does not return diagrams with the old colors. Only the diagrammed levels of lazy trees are
+    expanded.
+    """
+    key_hash = hashlib.blake2b(digest_size=20)
+    key_hash.update(json.dumps(options, sort_keys=True, default=str).encode("utf-8"))
+    key_hash.update(json.dumps(COLOR_SCHEMES, sort_keys=True).encode("utf-8"))
+    key_hash.update(repr([list(data) for data in tree.dimensions_data.values()]).encode("utf-8"))
+    max_depth = options.get("max_depth")
+
+    queue = deque([tree])
+    while queue:
+        node = queue.popleft()
+        dimensions_data = [tuple(data.values()) for data in node.dimensions_data.values()]
+        running_stats = [(stats.weight, stats.mean, stats.m2) for stats in node.running_stats.values()]
+        quantile_sketches = [
+            (dimension, metric, sketch.count, sketch.compactors)
+            for dimension, sketches in node.quantile_sketches.items()
+            for metric, sketch in sketches.items()
+        ]
+        node_content = (
+            node.id,
+            node.name,
+            node.depth,
+            node.frequency,
+            dimensions_data,
+            running_stats,
+            quantile_sketches,
+        )
+        key_hash.update(repr(node_content).encode("utf-8"))
+        if max_depth is not None and node.depth - tree.depth >= max_depth:
+            continue
+        key_hash.update(repr([child.id for child in node.children]).encode("utf-8"))
+        queue.extend(node.children)
+
+    return key_hash.hexdigest()
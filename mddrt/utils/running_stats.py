@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class RunningStats:
+    def __init__(self) -> None:
+        """
+        Numerically stable running mean and variance (Welford), with optional frequency weights.
+
+        Partial statistics, e.g. of two subtrees built separately, can be combined with `merge` using the
+        pairwise update of Chan et al., so no per-case values are stored.
+        """
+        self.count: int = 0
+        self.weight: float = 0
+        self.mean: float = 0.0
+        self.m2: float = 0.0
+
+    def update(self, value: float, weight: float = 1) -> None:
+        self.count += 1
+        self.weight += weight
+        delta = value - self.mean
+        self.mean += delta * weight / self.weight
+        self.m2 += weight * delta * (value - self.mean)
+
+    def merge(self, other: RunningStats) -> None:
+        if other.weight == 0:
+            return
+        total_weight = self.weight + other.weight
+        delta = other.mean - self.mean
+        self.mean += delta * other.weight / total_weight
+        self.m2 += other.m2 + delta * delta * self.weight * other.weight / total_weight
+        self.weight = total_weight
+        self.count += other.count
+
+    @property
+    def variance(self) -> float:
+        # Population variance, which is the one that stays meaningful with frequency weights
+        if self.weight == 0:
+            return 0.0
+        return max(0.0, self.m2 / self.weight)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+def merge_running_stats(running_stats: Iterable[RunningStats]) -> RunningStats:
+    merged_stats = RunningStats()
+    for stats in running_stats:
+        merged_stats.merge(stats)
+    return merged_stats
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+import pandas as pd
+
+from mddrt.utils.builder import sort_case_events, timestamps_to_nanoseconds
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from mddrt.drt_parameters import DirectlyRootedTreeParameters
+
+VARIANT_HASH_BASE = np.uint64(1_000_003)
+
+
+def stratified_cases_sample(
+    log: pd.DataFrame,
+    params: DirectlyRootedTreeParameters,
+    sample_fraction: float,
+    stratify_by: Literal["variant", "start_activity"] = "variant",
+    random_state: int | None = None,
+) -> tuple[pd.DataFrame, dict[Hashable, float]]:
+    if not 0 < sample_fraction <= 1:
+        error_message = "Sample fraction should be greater than 0 and lower or equal than 1."
+        raise ValueError(error_message)
+
+    case_codes, case_ids = pd.factorize(log[params.case_id_key])
+    cases_strata = cases_strata_codes(log, params, case_codes, stratify_by)
+    sampled_cases, cases_weights = stratified_sample(cases_strata, sample_fraction, np.random.default_rng(random_state))
+
+    is_case_sampled = np.zeros(len(case_ids) + 1, dtype=bool)
+    is_case_sampled[sampled_cases] = True
+    sampled_log = log[is_case_sampled[case_codes]]  # missing case ids (code -1) map to the last False slot
+    sampled_cases_weights = dict(zip(np.asarray(case_ids)[sampled_cases].tolist(), cases_weights.tolist()))
+    return sampled_log, sampled_cases_weights
+
+
+def cases_strata_codes(
+    log: pd.DataFrame,
+    params: DirectlyRootedTreeParameters,
+    case_codes: np.ndarray,
+    stratify_by: Literal["variant", "start_activity"],
+) -> np.ndarray:
+    start_timestamps = timestamps_to_nanoseconds(log[params.start_timestamp_key])
+    events_order = sort_case_events(case_codes, start_timestamps)
+    activities = pd.factorize(log[params.activity_key])[0][events_order]
+    case_starts = np.flatnonzero(np.diff(case_codes[events_order], prepend=-1))
+
+    if stratify_by == "start_activity":
+        return activities[case_starts]
+    if stratify_by == "variant":
+        # Polynomial hash of the activity sequence of each case, computed with wrapping uint64 arithmetic
+        event_positions = np.arange(len(events_order)) - np.repeat(
+            case_starts, np.diff(case_starts, append=len(events_order))
+        )
+        powers = np.power(VARIANT_HASH_BASE, event_positions.astype(np.uint64))
+        variant_hashes = np.add.reduceat((activities.astype(np.uint64) + np.uint64(1)) * powers, case_starts)
+        return pd.factorize(variant_hashes)[0]
+    error_message = "Stratify by value should be 'variant' or 'start_activity'."
+    raise ValueError(error_message)
+
+
+def stratified_sample(
+    cases_strata: np.ndarray,
+    sample_fraction: float,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, np.ndarray]:
+    # Proportional allocation: each stratum gets floor(fraction * size) cases plus one more with probability
+    # equal to the fractional part, so the expected sample size is fraction * cases.
+    strata_sizes = np.bincount(cases_strata)
+    expected_sample_sizes = strata_sizes * sample_fraction
+    strata_sample_sizes = np.floor(expected_sample_sizes).astype(int)
+    strata_sample_sizes += rng.random(len(strata_sizes)) < expected_sample_sizes - strata_sample_sizes
+
+    cases_order = np.lexsort((rng.random(len(cases_strata)), cases_strata))
+    ordered_strata = cases_strata[cases_order]
+    strata_starts = np.concatenate(([0], np.cumsum(strata_sizes)[:-1]))
+    rank_in_stratum = np.arange(len(cases_order)) - strata_starts[ordered_strata]
+    is_sampled = rank_in_stratum < strata_sample_sizes[ordered_strata]
+
+    # Horvitz-Thompson weights: the inverse of the inclusion probability of each case, i.e. the stratum size over
+    # its expected sample size. Weighting by the realized sample size would be biased low, as strata smaller than
+    # 1 / fraction are rarely sampled but would then be weighted by their full size instead of 1 / fraction.
+    sampled_cases = cases_order[is_sampled]
+    sampled_strata = ordered_strata[is_sampled]
+    cases_weights = strata_sizes[sampled_strata] / expected_sample_sizes[sampled_strata]
+    return sampled_cases, cases_weights
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import mddrt
+
+EXAMPLE_LOG_PATH = Path(__file__).parent.parent / "examples" / "blasting_with_rework_event_log.csv"
+EXAMPLE_LOG_FORMAT = {
+    "case:concept:name": "Case ID",
+    "concept:name": "Activity",
+    "time:timestamp": "Complete",
+    "start_timestamp": "Start",
+    "org:resource": "Resource",
+    "cost:total": "Cost",
+}
+
+
+@pytest.fixture(scope="session")
+def raw_example_log() -> pd.DataFrame:
+    return pd.read_csv(EXAMPLE_LOG_PATH, sep=";")
+
+
+@pytest.fixture(scope="session")
+def example_log(raw_example_log: pd.DataFrame) -> pd.DataFrame:
+    return mddrt.log_formatter(raw_example_log.copy(), EXAMPLE_LOG_FORMAT)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+import mddrt
+from mddrt.utils import actions as actions_utils
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    import pandas as pd
+
+
+class FakeSource:
+    def __init__(self, source: str) -> None:
+        self.source = source
+
+    def pipe(self, format: str) -> bytes:
+        return f"<{format}>{len(self.source)}</{format}>".encode()
+
+
+@pytest.fixture(autouse=True)
+def fake_graphviz(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setattr(actions_utils, "Source", FakeSource)
+    actions_utils.clear_rendered_diagrams_cache()
+    yield
+    actions_utils.clear_rendered_diagrams_cache()
+
+
+def test_saving_does_not_fill_the_rendered_diagrams_cache(example_log: pd.DataFrame, tmp_path: Path) -> None:
+    drt = mddrt.discover_multi_dimensional_drt(example_log, progress=None)
+
+    mddrt.get_multi_dimensional_drt_image(drt, format="svg")
+    for arc_measures in ([], ["avg"], ["avg", "min", "max"]):
+        mddrt.save_vis_multi_dimensional_drt(drt, str(tmp_path / "drt"), arc_measures=arc_measures)
+
+    assert (tmp_path / "drt.svg").exists()
+    assert len(actions_utils.rendered_diagrams) == 1
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import gzip
+import json
+import re
+from pathlib import Path
+from sys import maxsize
+from typing import TYPE_CHECKING
+
+import pytest
+
+import mddrt
+from mddrt.utils.misc import iter_nodes
+from tests.conftest import EXAMPLE_LOG_FORMAT
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from mddrt.tree_node import TreeNode
+
+# Output of the example log built with the timedelta implementation, before time metrics were accumulated as
+# int64 nanoseconds. Node ids are numbered by their first appearance in the DOT source.
+BASELINE_PATH = Path(__file__).parent / "fixtures" / "example_log_baseline.json.gz"
+LOG_FORMATS = {
+    "all_columns": EXAMPLE_LOG_FORMAT,
+    "required_columns": {
+        **EXAMPLE_LOG_FORMAT,
+        "start_timestamp": "",
+        "org:resource": "",
+        "cost:total": "",
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def baseline() -> dict:
+    with gzip.open(BASELINE_PATH, "rt", encoding="utf-8") as baseline_file:
+        return json.load(baseline_file)
+
+
+def time_data_in_nanoseconds(node: TreeNode) -> dict[str, int | None]:
+    return {metric: None if value == maxsize else value for metric, value in node.dimensions_data["time"].items()}
+
+
+def normalize_node_ids(dot_source: str) -> str:
+    node_names: dict[str, str] = {}
+
+    def node_name(node_id: str) -> str:
+        return "N" + node_names.setdefault(node_id, str(len(node_names)))
+
+    dot_source = re.sub(
+        r"^\t(\d+) \[", lambda match: f"\t{node_name(match.group(1))} [", dot_source, flags=re.MULTILINE
+    )
+    return re.sub(
+        r"^\t(\d+) -> (\d+)",
+        lambda match: f"\t{node_name(match.group(1))} -> {node_name(match.group(2))}",
+        dot_source,
+        flags=re.MULTILINE,
+    )
+
+
+@pytest.mark.parametrize("group_activities", [False, True])
+@pytest.mark.parametrize("log_format", LOG_FORMATS)
+def test_drt_matches_baseline(
+    raw_example_log: pd.DataFrame,
+    baseline: dict,
+    log_format: str,
+    group_activities: bool,
+) -> None:
+    log = mddrt.log_formatter(raw_example_log.copy(), LOG_FORMATS[log_format])
+    drt = mddrt.discover_multi_dimensional_drt(log, group_activities=group_activities, progress=None)
+    expected = baseline[f"{log_format}_grouped" if group_activities else log_format]
+
+    nodes = [[node.name, node.depth, node.frequency, time_data_in_nanoseconds(node)] for node in iter_nodes(drt)]
+    dot_source = mddrt.get_multi_dimensional_drt_string(
+        drt,
+        node_measures=["total", "consumed", "remaining"],
+        arc_measures=["avg", "min", "max"],
+    )
+
+    assert nodes == expected["nodes"]
+    assert normalize_node_ids(dot_source) == expected["dot"]
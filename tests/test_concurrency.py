@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+import mddrt
+from benchmarks.synthetic_log import SYNTHETIC_LOG_FORMAT, generate_event_log
+from mddrt.utils.misc import iter_nodes
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+BUILDS_PER_LOG = 4
+MAX_WORKERS = 8
+
+
+def build_result(log: pd.DataFrame, group_activities: bool) -> tuple[str, list[int]]:
+    drt = mddrt.discover_multi_dimensional_drt(log, group_activities=group_activities, progress=None)
+    dot_source = mddrt.get_multi_dimensional_drt_string(drt, arc_measures=["avg", "min", "max"])
+    return dot_source, [node.id for node in iter_nodes(drt)]
+
+
+@pytest.fixture(scope="module")
+def logs(example_log: pd.DataFrame) -> list[pd.DataFrame]:
+    synthetic_logs = [
+        mddrt.log_formatter(generate_event_log(300, variants=variants, seed=seed), SYNTHETIC_LOG_FORMAT)
+        for seed, variants in enumerate((10, 60))
+    ]
+    return [example_log, *synthetic_logs]
+
+
+@pytest.mark.parametrize("group_activities", [False, True])
+def test_concurrent_builds_match_sequential_builds(logs: list[pd.DataFrame], group_activities: bool) -> None:
+    builds = [log for log in logs for _ in range(BUILDS_PER_LOG)]
+
+    sequential_results = [build_result(log, group_activities) for log in builds]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        concurrent_results = list(executor.map(lambda log: build_result(log, group_activities), builds))
+
+    assert concurrent_results == sequential_results
+    for log_index in range(len(logs)):
+        log_results = sequential_results[log_index * BUILDS_PER_LOG : (log_index + 1) * BUILDS_PER_LOG]
+        assert all(result == log_results[0] for result in log_results)
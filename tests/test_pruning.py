@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import pandas as pd
+
+import mddrt
+from tests.conftest import EXAMPLE_LOG_FORMAT
+
+
+def test_prune_zero_copy_log_keeps_the_same_cases(raw_example_log: pd.DataFrame, example_log: pd.DataFrame) -> None:
+    zero_copy_log = mddrt.log_formatter(raw_example_log.copy(), EXAMPLE_LOG_FORMAT, zero_copy=True)
+
+    pruned_log = mddrt.prune_log_based_on_top_variants(example_log, 3)
+    pruned_zero_copy_log = mddrt.prune_log_based_on_top_variants(zero_copy_log, 3)
+
+    assert isinstance(pruned_zero_copy_log["case:concept:name"].dtype, pd.CategoricalDtype)
+    assert pruned_zero_copy_log.index.equals(pruned_log.index)
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import mddrt
+from mddrt.render_budget import collapse_low_frequency_branches
+from mddrt.utils.misc import iter_nodes
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+MAX_NODES = 20
+
+
+def test_budgeted_renders_do_not_modify_the_alphabet(example_log: pd.DataFrame) -> None:
+    drt = mddrt.discover_multi_dimensional_drt(example_log, progress=None)
+    activity_names = list(drt.alphabet.names)
+    activity_codes = dict(drt.alphabet.codes)
+
+    reduced_tree = collapse_low_frequency_branches(drt, MAX_NODES)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        dot_sources = list(
+            executor.map(
+                lambda max_nodes: mddrt.get_multi_dimensional_drt_string(drt, max_nodes=max_nodes),
+                range(5, 5 + 4 * MAX_NODES, 4),
+            )
+        )
+
+    assert any(node.name.endswith(" more") for node in iter_nodes(reduced_tree))
+    assert all("more" in dot_source for dot_source in dot_sources)
+    assert drt.alphabet.names == activity_names
+    assert drt.alphabet.codes == activity_codes
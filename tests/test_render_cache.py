@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import mddrt
+from mddrt.utils.render_cache import render_cache_key
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+OPTIONS = {"format": "svg", "arc_measures": ["avg", "p50", "p95"], "max_depth": None}
+
+
+def test_render_cache_key_depends_on_quantile_sketches(example_log: pd.DataFrame) -> None:
+    drt = mddrt.discover_multi_dimensional_drt(example_log, progress=None)
+    same_drt = mddrt.discover_multi_dimensional_drt(example_log, progress=None)
+    quantiles_drt = mddrt.discover_multi_dimensional_drt(example_log, calculate_quantiles=True, progress=None)
+
+    assert render_cache_key(drt, OPTIONS) == render_cache_key(same_drt, OPTIONS)
+    assert render_cache_key(drt, OPTIONS) != render_cache_key(quantiles_drt, OPTIONS)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import mddrt
+from benchmarks.synthetic_log import SYNTHETIC_LOG_FORMAT, generate_event_log
+from mddrt.utils.sampling import stratified_sample
+
+if TYPE_CHECKING:
+    from mddrt.tree_node import TreeNode
+
+SEEDS = 100
+
+
+def estimated_totals(tree: TreeNode) -> np.ndarray:
+    totals = [tree.frequency, tree.dimensions_data["time"]["lead_case"]]
+    totals += [tree.dimensions_data[dimension]["total_case"] for dimension in ("cost", "quality", "flexibility")]
+    return np.array(totals, dtype=float)
+
+
+@pytest.mark.parametrize("stratify_by", ["variant", "start_activity"])
+def test_approximate_totals_are_unbiased(example_log: pd.DataFrame, stratify_by: str) -> None:
+    exact_totals = estimated_totals(mddrt.discover_multi_dimensional_drt(example_log, progress=None))
+    approximate_totals = [
+        estimated_totals(
+            mddrt.discover_multi_dimensional_drt(
+                example_log,
+                approximate=True,
+                sample_fraction=0.1,
+                stratify_by=stratify_by,
+                random_state=seed,
+                progress=None,
+            )
+        )
+        for seed in range(SEEDS)
+    ]
+    np.testing.assert_allclose(np.mean(approximate_totals, axis=0), exact_totals, rtol=0.03)
+
+
+def test_sample_weights_are_unbiased_with_many_small_strata() -> None:
+    log = mddrt.log_formatter(generate_event_log(5_000, variants=4_000, seed=1), SYNTHETIC_LOG_FORMAT)
+    cases_strata = pd.factorize(log.groupby("case:concept:name", sort=False)["concept:name"].agg(tuple))[0]
+    estimated_cases = [
+        stratified_sample(cases_strata, 0.1, np.random.default_rng(seed))[1].sum() for seed in range(SEEDS)
+    ]
+    assert np.mean(estimated_cases) == pytest.approx(len(cases_strata), rel=0.01)
+
+
+def nearly_mandatory_activity_log(cases: int = 2_000) -> pd.DataFrame:
+    # "B" is optional, but only 1 case in 200 skips it, so samples often contain it in every case
+    events = []
+    for case in range(cases):
+        activities = ["A", "B", "C"] if case % 200 else ["A", "C"]
+        activities += ["D"] if case % 3 == 0 else []
+        for position, activity in enumerate(activities):
+            start_timestamp = pd.Timestamp("2024-01-01", tz="UTC") + pd.Timedelta(hours=10 * case + position)
+            events.append(
+                {
+                    "case:concept:name": str(case),
+                    "concept:name": activity,
+                    "start_timestamp": start_timestamp,
+                    "time:timestamp": start_timestamp + pd.Timedelta(minutes=30),
+                    "cost:total": 1,
+                }
+            )
+    return pd.DataFrame(events)
+
+
+def test_approximate_flexibility_uses_the_optional_activities_of_the_log() -> None:
+    log = nearly_mandatory_activity_log()
+    exact_flexibility = mddrt.discover_multi_dimensional_drt(log, progress=None).dimensions_data["flexibility"]
+    approximate_flexibilities = [
+        mddrt.discover_multi_dimensional_drt(
+            log,
+            approximate=True,
+            sample_fraction=0.1,
+            stratify_by="start_activity",
+            random_state=seed,
+            progress=None,
+        ).dimensions_data["flexibility"]["total_case"]
+        for seed in range(SEEDS)
+    ]
+    assert np.mean(approximate_flexibilities) == pytest.approx(exact_flexibility["total_case"], rel=0.02)
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import mddrt
+from mddrt.tree_grouper import DirectedRootedTreeGrouper
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def test_grouping_and_queries_do_not_add_names_to_the_alphabet(example_log: pd.DataFrame) -> None:
+    drt = mddrt.discover_multi_dimensional_drt(example_log, progress=None)
+    activity_names = list(drt.alphabet.names)
+
+    subtree = mddrt.subtree_by_prefix(drt, [drt.children[0].name])
+    DirectedRootedTreeGrouper(subtree)
+    mddrt.merge_trees([drt, subtree])
+
+    assert drt.alphabet.names == activity_names
+    assert sorted(activity_names) == sorted(example_log["concept:name"].unique())
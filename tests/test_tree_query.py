@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+import mddrt
+from mddrt.utils.misc import iter_nodes
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from mddrt.tree_node import TreeNode
+
+PREFIX_LENGTH = 3
+# Metrics of the cases after the subtree root, which the rebased subtree has exactly at every node
+EXACT_METRICS = {
+    "cost": ["total", "remainder", "min", "max"],
+    "time": ["service", "waiting", "lead", "lead_remainder", "min", "max"],
+}
+ROOT_METRICS = {"cost": ["total_case", "accumulated"], "time": ["lead_case", "lead_accumulated"]}
+APPROXIMATE_TOLERANCE = 0.05
+
+
+def trimmed_log(log: pd.DataFrame, prefix: list[str]) -> pd.DataFrame:
+    log = log.sort_values(["case:concept:name", "start_timestamp"], kind="stable")
+    event_positions = log.groupby("case:concept:name").cumcount()
+    case_prefixes = log[event_positions < len(prefix)].groupby("case:concept:name")["concept:name"].agg(list)
+    prefix_cases = case_prefixes[case_prefixes.map(lambda activities: activities == prefix)].index
+    return log[log["case:concept:name"].isin(prefix_cases) & (event_positions >= len(prefix) - 1)]
+
+
+def nodes_by_path(tree: TreeNode) -> dict[tuple[str, ...], TreeNode]:
+    paths = {id(tree): (tree.name,)}
+    nodes = {}
+    for node in iter_nodes(tree):
+        path = paths[id(node)]
+        nodes[path] = node
+        for child in node.children:
+            paths[id(child)] = (*path, child.name)
+    return nodes
+
+
+def test_rebased_subtree_matches_discovery_on_the_trimmed_log(example_log: pd.DataFrame) -> None:
+    drt = mddrt.discover_multi_dimensional_drt(example_log, progress=None)
+    prefix, prefix_node = [], drt
+    for _ in range(PREFIX_LENGTH):
+        prefix_node = max(prefix_node.children, key=lambda child: child.frequency)
+        prefix.append(prefix_node.name)
+
+    subtree = mddrt.subtree_by_prefix(drt, prefix, rebase=True)
+    (trimmed_subtree,) = mddrt.discover_multi_dimensional_drt(trimmed_log(example_log, prefix), progress=None).children
+
+    subtree_nodes = nodes_by_path(subtree)
+    trimmed_nodes = nodes_by_path(trimmed_subtree)
+    assert subtree_nodes.keys() == trimmed_nodes.keys()
+    for path, node in subtree_nodes.items():
+        trimmed_node = trimmed_nodes[path]
+        assert (node.depth, node.frequency) == (trimmed_node.depth, trimmed_node.frequency)
+        for dimension, metrics in EXACT_METRICS.items():
+            for metric in metrics:
+                expected = trimmed_node.dimensions_data[dimension][metric]
+                assert node.dimensions_data[dimension][metric] == pytest.approx(expected), (path, metric)
+        # Below the root, the average per case consumed before the root is subtracted
+        for dimension, metrics in ROOT_METRICS.items():
+            tolerance = 0 if node is subtree else APPROXIMATE_TOLERANCE
+            for metric in metrics:
+                expected = trimmed_node.dimensions_data[dimension][metric]
+                assert node.dimensions_data[dimension][metric] == pytest.approx(expected, rel=tolerance), (path, metric)